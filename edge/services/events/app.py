@@ -16,17 +16,22 @@ Data Model in VM (Influx line protocol):
 
 import os
 import re
+import atexit
 import time
+import gzip
 import json
 import math
 import sqlite3
 import logging
+import queue
 import hashlib
+import tempfile
 import threading
 import subprocess
 from datetime import datetime
 from typing import Optional, Dict, Any, List, Tuple
 from contextlib import contextmanager
+from functools import lru_cache
 from werkzeug.utils import secure_filename
 from urllib.parse import quote
 
@@ -35,7 +40,9 @@ from map_tiles import (
     utc_month_key,
     init_map_tables,
     increment_tile_count,
+    flush_tile_counts,
     get_tile_counts,
+    get_stored_tile_counts,
     get_tile_sync_totals,
     set_tile_sync_total,
     set_preferred_provider,
@@ -45,7 +52,7 @@ from map_tiles import (
 )
 
 import requests
-from flask import Flask, request, jsonify, render_template_string, send_from_directory, make_response
+from flask import Flask, Response, request, jsonify, send_from_directory, make_response
 
 try:
     import paramiko
@@ -59,6 +66,18 @@ try:
 except ImportError:
     PAHO_AVAILABLE = False
 
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+try:
+    from PIL import Image, ImageOps
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
 # Configuration from environment
 VM_WRITE_URL = os.environ.get("VM_WRITE_URL", "http://victoria-metrics:8428/write")
 VM_WRITE_URL_SECONDARY = os.environ.get("VM_WRITE_URL_SECONDARY", "").strip()
@@ -101,6 +120,7 @@ ESRI_ATTRIBUTION = os.environ.get("ESRI_ATTRIBUTION", MAP_TILE_ATTRIBUTION)
 MAPBOX_MAX_ZOOM = int(os.environ.get("MAPBOX_MAX_ZOOM", "20"))
 ESRI_MAX_ZOOM = int(os.environ.get("ESRI_MAX_ZOOM", "19"))
 
+@lru_cache(maxsize=1024)
 def canonicalize_system_id(system_id: str) -> str:
     if not system_id:
         return system_id
@@ -125,6 +145,7 @@ GUARDRAIL_LIMIT_PCT = float(os.environ.get("GUARDRAIL_LIMIT_PCT", "0.95"))
 CLOUD_API_URL = os.environ.get("CLOUD_API_URL", os.environ.get("CLOUD_BASE_URL", "")).strip()
 CLOUD_API_TIMEOUT = float(os.environ.get("CLOUD_API_TIMEOUT", "4"))
 TILE_USAGE_SYNC_INTERVAL = int(os.environ.get("TILE_USAGE_SYNC_INTERVAL", "60"))
+TILE_COUNT_FLUSH_INTERVAL = int(os.environ.get("TILE_COUNT_FLUSH_INTERVAL", "5"))
 
 # GX Device SSH configuration
 GX_HOST = os.environ.get("GX_HOST", "").strip()
@@ -135,6 +156,12 @@ GX_PASSWORD_FILE = os.environ.get("GX_PASSWORD_FILE", "").strip()
 # Image upload settings
 ALLOWED_EXTENSIONS = {'jpg', 'jpeg', 'png', 'gif', 'heic', 'webp'}
 MAX_IMAGE_SIZE = 10 * 1024 * 1024  # 10MB
+IMAGE_UPLOAD_CHUNK_SIZE = 64 * 1024
+IMAGE_BULK_DELETE_MAX = 500  # ids per DELETE /api/images request
+IMAGE_INSERT_QUEUE_MAX = 256  # queued uploads before the request inserts its own row
+IMAGE_INSERT_ATTEMPTS = 3
+IMAGE_THUMBS_PATH = os.path.join(IMAGES_PATH, "thumbs")
+IMAGE_THUMB_SIZE = (320, 240)  # 2x the 160x120 gallery tiles for high-DPI screens
 
 # Retry configuration
 MAX_RETRIES = 3
@@ -143,6 +170,12 @@ RETRY_BACKOFF_BASE = 0.5  # seconds
 # Heartbeat configuration
 HEARTBEAT_INTERVAL = 2  # seconds - how often to write active events/locations to VM
 
+# Serve the web UI unminified for local debugging
+DEBUG = os.environ.get("DEBUG", "").strip().lower() in ("1", "true", "yes", "y")
+
+# Response compression (JSON bodies smaller than this are sent as-is)
+COMPRESS_MIN_SIZE = int(os.environ.get("COMPRESS_MIN_SIZE", "1024"))
+
 # Setup logging
 logging.basicConfig(
     level=getattr(logging, LOG_LEVEL.upper(), logging.INFO),
@@ -182,12 +215,120 @@ if not GX_PASSWORD and GX_PASSWORD_FILE:
 if not PARAMIKO_AVAILABLE:
     logger.warning("paramiko not installed - GX device control will not work. Install with: pip install paramiko")
 
-app = Flask(__name__)
+# Static files are served from memory by static_asset(), not Flask's static folder
+app = Flask(__name__, static_folder=None)
 
 # Global flag for heartbeat thread
 _heartbeat_stop = threading.Event()
 
 
+# ============================================================================
+# Response Compression
+# ============================================================================
+
+# Polled JSON endpoints worth compressing; image files are already compressed
+COMPRESSED_ENDPOINTS = {"api_status", "api_images_list"}
+
+
+def negotiate_encoding() -> Optional[str]:
+    """Pick the best content-coding the client accepts (br, then gzip)."""
+    accepted = request.accept_encodings
+    if BROTLI_AVAILABLE and accepted["br"] > 0:
+        return "br"
+    if accepted["gzip"] > 0:
+        return "gzip"
+    return None
+
+
+def compress_body(data: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=5)
+    return gzip.compress(data, compresslevel=6)
+
+
+def precompress(data: bytes) -> Dict[str, bytes]:
+    """Build every encoded variant of a static body once, at maximum compression."""
+    variants = {"identity": data, "gzip": gzip.compress(data, compresslevel=9)}
+    if BROTLI_AVAILABLE:
+        variants["br"] = brotli.compress(data, quality=11)
+    return variants
+
+
+def body_etag(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+# Each content-coding is a different representation, so it gets its own strong tag
+def encoded_etag(etag: str, encoding: Optional[str]) -> str:
+    if not encoding or encoding == "identity":
+        return etag
+    return f"{etag}-{encoding}"
+
+
+def precompressed_response(variants: Dict[str, bytes], mimetype: str,
+                           etag: Optional[str] = None) -> Response:
+    encoding = negotiate_encoding()
+    if encoding not in variants:
+        encoding = "identity"
+    if etag:
+        etag = encoded_etag(etag, encoding)
+    if etag and etag in request.if_none_match:
+        response = Response(status=304)
+    else:
+        response = Response(variants[encoding], mimetype=mimetype)
+        if encoding != "identity":
+            response.headers["Content-Encoding"] = encoding
+    if etag:
+        response.set_etag(etag)
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+def json_response_encoding(data: bytes) -> Optional[str]:
+    """Content-coding compress_json_response will apply to this JSON body, if any."""
+    if request.endpoint not in COMPRESSED_ENDPOINTS or len(data) < COMPRESS_MIN_SIZE:
+        return None
+    return negotiate_encoding()
+
+
+def conditional_json(payload: Any) -> Response:
+    """JSON response tagged with its body hash; 304 when the client already has it."""
+    response = jsonify(payload)
+    data = response.get_data()
+    etag = body_etag(data)
+    encoded = encoded_etag(etag, json_response_encoding(data))
+    if encoded in request.if_none_match:
+        response = Response(status=304)
+        response.set_etag(encoded)
+    else:
+        # compress_json_response adds the encoding suffix when it compresses
+        response.set_etag(etag)
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+# Large bodies from COMPRESSED_ENDPOINTS go out gzip/br-encoded when the client accepts it
+@app.after_request
+def compress_json_response(response):
+    if request.endpoint not in COMPRESSED_ENDPOINTS:
+        return response
+    if response.status_code != 200 or response.direct_passthrough or response.is_streamed:
+        return response
+    if "Content-Encoding" in response.headers:
+        return response
+    response.vary.add("Accept-Encoding")
+    data = response.get_data()
+    encoding = json_response_encoding(data)
+    if not encoding:
+        return response
+    response.set_data(compress_body(data, encoding))
+    response.headers["Content-Encoding"] = encoding
+    etag, weak = response.get_etag()
+    if etag:
+        response.set_etag(encoded_etag(etag, encoding), weak=weak)
+    return response
+
+
 # ============================================================================
 # Map Tile Providers
 # ============================================================================
@@ -259,37 +400,32 @@ MAP_TILE_CACHE_PREFIXES = [
 # Influx Line Protocol Escaping
 # ============================================================================
 
+# One str.translate pass per value; each character is mapped once, so
+# backslashes need no special ordering
+_TAG_VALUE_ESCAPES = str.maketrans({"\\": "\\\\", ",": "\\,", "=": "\\=", " ": "\\ "})
+_FIELD_STRING_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"'})
+_MEASUREMENT_ESCAPES = str.maketrans({"\\": "\\\\", ",": "\\,", " ": "\\ "})
+
+
 def escape_tag_value(s: str) -> str:
     """Escape tag values: commas, equals, spaces -> backslash-escaped."""
     if not s:
         return ""
-    s = str(s)
-    s = s.replace("\\", "\\\\")  # backslash first
-    s = s.replace(",", "\\,")
-    s = s.replace("=", "\\=")
-    s = s.replace(" ", "\\ ")
-    return s
+    return str(s).translate(_TAG_VALUE_ESCAPES)
 
 
 def escape_field_string(s: str) -> str:
     """Escape field string values: quotes and backslashes."""
     if not s:
         return '""'
-    s = str(s)
-    s = s.replace("\\", "\\\\")  # backslash first
-    s = s.replace('"', '\\"')
-    return f'"{s}"'
+    return f'"{str(s).translate(_FIELD_STRING_ESCAPES)}"'
 
 
 def escape_measurement(s: str) -> str:
     """Escape measurement names: commas and spaces."""
     if not s:
         return "metric"
-    s = str(s)
-    s = s.replace("\\", "\\\\")
-    s = s.replace(",", "\\,")
-    s = s.replace(" ", "\\ ")
-    return s
+    return str(s).translate(_MEASUREMENT_ESCAPES)
 
 
 def build_event_line(event_id: str, system_id: str, location: Optional[str], active: int, ts_ns: int) -> str:
@@ -396,6 +532,7 @@ def write_to_vm(lines: List[str]) -> tuple[bool, str]:
 # VictoriaMetrics Reader
 # ============================================================================
 
+@lru_cache(maxsize=1024)
 def escape_prom_label_value(value: str) -> str:
     """Escape label values for PromQL queries."""
     return str(value).replace("\\", "\\\\").replace('"', '\\"')
@@ -2205,15 +2342,37 @@ def init_db():
     logger.info(f"Image storage at {IMAGES_PATH}")
 
 
+# One long-lived connection per thread (request workers and background workers)
+_db_local = threading.local()
+
+
+def _open_db() -> sqlite3.Connection:
+    conn = sqlite3.connect(DB_PATH, cached_statements=512)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=5000")
+    return conn
+
+
 @contextmanager
 def get_db():
-    """Context manager for database connections."""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+    """Context manager for this thread's database connection.
+
+    Callers commit explicitly. Work left uncommitted when the outermost block
+    exits is rolled back, matching the old close-per-block behavior.
+    """
+    conn = getattr(_db_local, "conn", None)
+    if conn is None:
+        conn = _db_local.conn = _open_db()
+        _db_local.depth = 0
+    _db_local.depth += 1
     try:
         yield conn
     finally:
-        conn.close()
+        _db_local.depth -= 1
+        if _db_local.depth == 0 and conn.in_transaction:
+            conn.rollback()
 
 
 def get_cached_gps(system_id: str) -> Optional[Dict[str, Any]]:
@@ -2291,6 +2450,141 @@ def log_audit(action: str, system_id: str, event_id: Optional[str] = None,
         conn.commit()
 
 
+# ============================================================================
+# Image Metadata Writer
+# ============================================================================
+
+# Uploaded image rows waiting to be inserted; the file is already on disk
+_image_insert_queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=IMAGE_INSERT_QUEUE_MAX)
+
+
+def _insert_image_metadata(conn: sqlite3.Connection, meta: Dict[str, Any]) -> int:
+    cursor = conn.execute("""
+        INSERT INTO images 
+        (filename, original_filename, system_id, event_id, location, caption, timestamp, file_size, content_type)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, (
+        meta["filename"],
+        meta["original_filename"],
+        meta["system_id"],
+        meta["event_id"] or None,
+        meta["location"] or None,
+        meta["caption"] or None,
+        meta["timestamp"],
+        meta["file_size"],
+        meta["content_type"]
+    ))
+    conn.commit()
+    return cursor.lastrowid
+
+
+def save_image_metadata(meta: Dict[str, Any], attempts: int = IMAGE_INSERT_ATTEMPTS) -> Optional[int]:
+    """Insert an uploaded image's row, retrying briefly; returns the id, or None if every attempt failed.
+
+    The upload was already accepted, so the file stays on disk even when the
+    row can't be written; the error log carries the metadata to restore it.
+    """
+    for attempt in range(1, attempts + 1):
+        try:
+            with get_db() as conn:
+                image_id = _insert_image_metadata(conn, meta)
+        except Exception as e:
+            logger.warning(f"Saving image metadata for {meta['filename']} failed (attempt {attempt}/{attempts}): {e}")
+            if attempt < attempts:
+                time.sleep(attempt)
+            continue
+        log_audit("image_upload", meta["system_id"], meta["event_id"], meta["location"], meta["caption"], True)
+        return image_id
+    logger.error(f"Image metadata not saved; file kept in {IMAGES_PATH}: {json.dumps(meta)}")
+    return None
+
+
+def image_metadata_worker() -> None:
+    """Insert queued image uploads so the upload request does not wait on SQLite."""
+    while not _heartbeat_stop.is_set():
+        try:
+            meta = _image_insert_queue.get(timeout=1.0)
+        except queue.Empty:
+            continue
+        try:
+            save_image_metadata(meta)
+        finally:
+            _image_insert_queue.task_done()
+
+
+def _drain_image_inserts() -> None:
+    """Insert uploads still queued at shutdown; the worker is a daemon thread."""
+    while True:
+        try:
+            meta = _image_insert_queue.get_nowait()
+        except queue.Empty:
+            return
+        try:
+            save_image_metadata(meta)
+        finally:
+            _image_insert_queue.task_done()
+
+
+# ============================================================================
+# Image Thumbnails
+# ============================================================================
+
+def image_thumbnail(filename: str) -> Optional[str]:
+    """Return the JPEG thumbnail name for an uploaded image, creating it on first use.
+
+    Returns None if Pillow is not installed or the image can't be decoded
+    (e.g. HEIC); callers serve the original instead.
+    """
+    if not PIL_AVAILABLE:
+        return None
+    thumb_name = os.path.splitext(filename)[0] + ".jpg"
+    if os.path.exists(os.path.join(IMAGE_THUMBS_PATH, thumb_name)):
+        return thumb_name
+    source = os.path.join(IMAGES_PATH, filename)
+    if not os.path.exists(source):
+        return None
+
+    tmp_path = None
+    try:
+        os.makedirs(IMAGE_THUMBS_PATH, exist_ok=True)
+        with Image.open(source) as img:
+            thumb = ImageOps.exif_transpose(img)
+            thumb.thumbnail(IMAGE_THUMB_SIZE)
+            fd, tmp_path = tempfile.mkstemp(dir=IMAGE_THUMBS_PATH, prefix=".thumb-", suffix=".tmp")
+            with os.fdopen(fd, "wb") as out:
+                thumb.convert("RGB").save(out, "JPEG", quality=80, optimize=True)
+        # Atomic, so a concurrent request never serves a half-written file
+        os.replace(tmp_path, os.path.join(IMAGE_THUMBS_PATH, thumb_name))
+    except Exception as e:
+        logger.warning(f"Failed to create thumbnail for {filename}: {e}")
+        if tmp_path:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        return None
+    return thumb_name
+
+
+def remove_image_files(filename: str) -> None:
+    """Remove an image and its thumbnail from disk; missing files are fine."""
+    filepath = os.path.join(IMAGES_PATH, filename)
+    try:
+        if os.path.exists(filepath):
+            os.remove(filepath)
+    except Exception as e:
+        logger.error(f"Failed to delete image file: {e}")
+    remove_image_thumbnail(filename)
+
+
+def remove_image_thumbnail(filename: str) -> None:
+    """Delete an image's cached thumbnail, if any."""
+    try:
+        os.remove(os.path.join(IMAGE_THUMBS_PATH, os.path.splitext(filename)[0] + ".jpg"))
+    except OSError:
+        pass
+
+
 # ============================================================================
 # API Endpoints
 # ============================================================================
@@ -2418,7 +2712,7 @@ def _sync_tile_usage_once() -> None:
         return
     month_key = utc_month_key()
     with get_db() as conn:
-        totals = get_tile_counts(conn, month_key)
+        totals = get_stored_tile_counts(conn, month_key)
         sent_totals = get_tile_sync_totals(conn, month_key)
 
     for provider in MAP_TILE_PROVIDERS:
@@ -2438,13 +2732,25 @@ def _sync_tile_usage_once() -> None:
                 conn.commit()
 
 
+def _flush_tile_counts() -> None:
+    try:
+        with get_db() as conn:
+            flush_tile_counts(conn)
+    except Exception as exc:
+        logger.warning(f"Tile count flush failed: {exc}")
+
+
 def tile_usage_sync_worker() -> None:
+    next_sync = 0.0
     while not _heartbeat_stop.is_set():
-        try:
-            _sync_tile_usage_once()
-        except Exception as exc:
-            logger.warning(f"Tile usage sync failed: {exc}")
-        _heartbeat_stop.wait(max(TILE_USAGE_SYNC_INTERVAL, 5))
+        _flush_tile_counts()
+        if time.monotonic() >= next_sync:
+            try:
+                _sync_tile_usage_once()
+            except Exception as exc:
+                logger.warning(f"Tile usage sync failed: {exc}")
+            next_sync = time.monotonic() + max(TILE_USAGE_SYNC_INTERVAL, 5)
+        _heartbeat_stop.wait(max(TILE_COUNT_FLUSH_INTERVAL, 1))
 
 
 # ============================================================================
@@ -3093,9 +3399,7 @@ def api_map_tiles_increment():
     if DEPLOYMENT_ID and payload_deployment_id and payload_deployment_id != DEPLOYMENT_ID:
         return jsonify({"error": "deployment_id mismatch"}), 400
 
-    with get_db() as conn:
-        increment_tile_count(conn, month_key, provider, count)
-        conn.commit()
+    increment_tile_count(month_key, provider, count)
 
     return jsonify({"ok": True, "provider": provider, "count": count, "month_key": month_key})
 
@@ -3709,18 +4013,52 @@ def api_note():
     
     if success:
         log_audit("note", system_id, event_id, note=msg, success=True)
+        # Include the event's updated note list so the UI doesn't have to refetch it
+        with get_db() as conn:
+            notes = query_notes(conn, event_id=event_id)
         return jsonify({
             "success": True,
             "system_id": system_id,
             "event_id": event_id,
             "msg": msg,
-            "ts": ts
+            "ts": ts,
+            "notes": notes
         })
     else:
         log_audit("note", system_id, event_id, note=msg, success=False, error=error)
         return jsonify({"error": error}), 500
 
 
+def query_notes(conn: sqlite3.Connection, event_id: str = "", system_id: str = "",
+                limit: int = 50) -> List[Dict[str, Any]]:
+    """Newest notes for an event, else for a system, else across all systems."""
+    if event_id:
+        notes = conn.execute("""
+            SELECT id, timestamp, system_id, event_id, note
+            FROM audit_log
+            WHERE action = 'note' AND event_id = ?
+            ORDER BY timestamp DESC
+            LIMIT ?
+        """, (event_id, limit)).fetchall()
+    elif system_id:
+        notes = conn.execute("""
+            SELECT id, timestamp, system_id, event_id, note
+            FROM audit_log
+            WHERE action = 'note' AND system_id = ?
+            ORDER BY timestamp DESC
+            LIMIT ?
+        """, (system_id, limit)).fetchall()
+    else:
+        notes = conn.execute("""
+            SELECT id, timestamp, system_id, event_id, note
+            FROM audit_log
+            WHERE action = 'note'
+            ORDER BY timestamp DESC
+            LIMIT ?
+        """, (limit,)).fetchall()
+    return [dict(n) for n in notes]
+
+
 @app.route("/api/notes", methods=["GET"])
 def api_notes():
     """Get notes for an event or system."""
@@ -3729,33 +4067,8 @@ def api_notes():
     limit = int(request.args.get("limit", "50"))
     
     with get_db() as conn:
-        if event_id:
-            notes = conn.execute("""
-                SELECT id, timestamp, system_id, event_id, note
-                FROM audit_log
-                WHERE action = 'note' AND event_id = ?
-                ORDER BY timestamp DESC
-                LIMIT ?
-            """, (event_id, limit)).fetchall()
-        elif system_id:
-            notes = conn.execute("""
-                SELECT id, timestamp, system_id, event_id, note
-                FROM audit_log
-                WHERE action = 'note' AND system_id = ?
-                ORDER BY timestamp DESC
-                LIMIT ?
-            """, (system_id, limit)).fetchall()
-        else:
-            notes = conn.execute("""
-                SELECT id, timestamp, system_id, event_id, note
-                FROM audit_log
-                WHERE action = 'note'
-                ORDER BY timestamp DESC
-                LIMIT ?
-            """, (limit,)).fetchall()
-        
         return jsonify({
-            "notes": [dict(n) for n in notes]
+            "notes": query_notes(conn, event_id=event_id, system_id=system_id, limit=limit)
         })
 
 
@@ -3820,6 +4133,64 @@ def api_audit_delete():
         return jsonify({"error": str(e)}), 500
 
 
+@app.route("/api/audit/delete_batch", methods=["POST"])
+def api_audit_delete_batch():
+    """Delete several notes, by id or note text, in one transaction."""
+    if not check_api_key():
+        return jsonify({"error": "Invalid API key"}), 401
+    
+    data = request.get_json() or {}
+    items = data.get("items")
+    if not isinstance(items, list) or not items:
+        return jsonify({"error": "items required"}), 400
+    
+    deletes = []
+    for item in items:
+        if not isinstance(item, dict):
+            return jsonify({"error": "items must be objects"}), 400
+        note_id_raw = item.get("note_id")
+        if note_id_raw is not None and str(note_id_raw).strip() != "":
+            try:
+                deletes.append((
+                    "DELETE FROM audit_log WHERE id = ? AND action IN ('note', 'event_note')",
+                    (int(note_id_raw),)
+                ))
+            except (ValueError, TypeError):
+                return jsonify({"error": "note_id must be an integer"}), 400
+            continue
+        note_text = str(item.get("note_text") or "").strip()
+        if not note_text:
+            return jsonify({"error": "note_id or note_text required"}), 400
+        deletes.append((
+            "DELETE FROM audit_log WHERE system_id = ? AND event_id = ? AND note = ? AND action IN ('note', 'event_note')",
+            (
+                canonicalize_system_id(str(item.get("system_id") or "").strip()),
+                str(item.get("event_id") or "").strip(),
+                note_text,
+            )
+        ))
+    
+    try:
+        deleted_count = 0
+        missing_count = 0
+        with get_db() as conn:
+            for sql, params in deletes:
+                rowcount = conn.execute(sql, params).rowcount
+                deleted_count += rowcount
+                if rowcount == 0:
+                    missing_count += 1
+            conn.commit()
+        logger.info(f"Batch note delete: requested={len(deletes)}, deleted={deleted_count}, missing={missing_count}")
+        return jsonify({
+            "success": True,
+            "deleted_count": deleted_count,
+            "missing_count": missing_count
+        })
+    except Exception as e:
+        logger.exception(f"Error deleting audit entries: {e}")
+        return jsonify({"error": str(e)}), 500
+
+
 @app.route("/api/reports/generate", methods=["POST"])
 def api_reports_generate():
     """Generate a report for a completed event."""
@@ -3854,6 +4225,61 @@ def api_reports_generate():
         return jsonify({"error": str(e)}), 500
 
 
+# Parsed report summaries keyed by data.json path -> (mtime, summary)
+_report_index_cache: Dict[str, Tuple[float, Optional[Dict[str, Any]]]] = {}
+_report_index_lock = threading.Lock()
+
+
+def _load_report_summary(json_file: str, dir_name: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(json_file, "r") as f:
+            data = json.load(f)
+        return {
+            "event_id": data.get("event_id"),
+            "generated_at": data.get("generated_at"),
+            "duration_seconds": data.get("duration_seconds"),
+            "loggers": list(data.get("loggers", {}).keys()),
+            "report_dir": dir_name
+        }
+    except Exception as e:
+        logger.warning(f"Could not load report {json_file}: {e}")
+        return None
+
+
+def list_report_summaries() -> List[Dict[str, Any]]:
+    """Return report summaries newest first, re-parsing only reports whose data.json changed."""
+    reports = []
+    seen = set()
+    with os.scandir(REPORTS_PATH) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            json_file = os.path.join(entry.path, "data.json")
+            try:
+                mtime = os.stat(json_file).st_mtime
+            except OSError:
+                continue
+            seen.add(json_file)
+            with _report_index_lock:
+                cached = _report_index_cache.get(json_file)
+            if cached is not None and cached[0] == mtime:
+                summary = cached[1]
+            else:
+                summary = _load_report_summary(json_file, entry.name)
+                with _report_index_lock:
+                    _report_index_cache[json_file] = (mtime, summary)
+            if summary is not None:
+                reports.append(summary)
+
+    with _report_index_lock:
+        for stale in set(_report_index_cache) - seen:
+            del _report_index_cache[stale]
+
+    # Sort by generated_at descending (newest first)
+    reports.sort(key=lambda x: x.get("generated_at", 0), reverse=True)
+    return reports
+
+
 @app.route("/api/reports", methods=["GET"])
 def api_reports_list():
     """List all available reports."""
@@ -3863,29 +4289,20 @@ def api_reports_list():
     if not os.path.exists(REPORTS_PATH):
         return jsonify({"reports": []})
     
-    reports = []
-    for dir_name in os.listdir(REPORTS_PATH):
-        dir_path = os.path.join(REPORTS_PATH, dir_name)
-        if os.path.isdir(dir_path):
-            json_file = os.path.join(dir_path, "data.json")
-            if os.path.exists(json_file):
-                try:
-                    with open(json_file, "r") as f:
-                        data = json.load(f)
-                        reports.append({
-                            "event_id": data.get("event_id"),
-                            "generated_at": data.get("generated_at"),
-                            "duration_seconds": data.get("duration_seconds"),
-                            "loggers": list(data.get("loggers", {}).keys()),
-                            "report_dir": dir_name
-                        })
-                except Exception as e:
-                    logger.warning(f"Could not load report {json_file}: {e}")
-    
-    # Sort by generated_at descending (newest first)
-    reports.sort(key=lambda x: x.get("generated_at", 0), reverse=True)
-    
-    return jsonify({"reports": reports})
+    reports = list_report_summaries()
+
+    # Stream one entry at a time instead of serializing the whole list at once
+    def _gen():
+        yield b'{"reports":['
+        first = True
+        for entry in reports:
+            if not first:
+                yield b','
+            yield json.dumps(entry, separators=(",", ":")).encode("utf-8")
+            first = False
+        yield b']}'
+
+    return Response(_gen(), mimetype="application/json")
 
 
 @app.route("/api/reports/<event_id>", methods=["GET"])
@@ -4019,7 +4436,7 @@ def api_status():
                 LIMIT 50
             """).fetchall()
             
-            return jsonify({
+            return conditional_json({
                 "active_events": [dict(r) for r in active_events],
                 "events_grouped": events_grouped,
                 "recent_logs": [dict(r) for r in recent_logs]
@@ -4030,6 +4447,14 @@ def api_status():
 def api_summary():
     """Get summary metrics for the current system."""
     system_id = canonicalize_system_id(request.args.get("system_id", "").strip() or SYSTEM_ID)
+    resp = jsonify(build_summary(system_id))
+    resp.headers["Cache-Control"] = "no-store, max-age=0"
+    resp.headers["Pragma"] = "no-cache"
+    return resp
+
+
+def build_summary(system_id: str) -> Dict[str, Any]:
+    """Query SOC, AC in/out power and active alarms for a system."""
     label = escape_prom_label_value(system_id)
 
     # Try MQTT-based metrics first, fall back to legacy dbus2prom names
@@ -4071,17 +4496,101 @@ def api_summary():
         alerts.append(name)
 
     unique_alerts = sorted(set(alerts))
-    resp = jsonify({
+    return {
         "system_id": system_id,
         "soc": soc,
         "pin": pin,
         "pout": pout,
         "alerts": unique_alerts,
         "alerts_count": len(unique_alerts)
-    })
-    resp.headers["Cache-Control"] = "no-store, max-age=0"
-    resp.headers["Pragma"] = "no-cache"
-    return resp
+    }
+
+
+# ============================================================================
+# Summary Stream (Server-Sent Events)
+# ============================================================================
+
+SUMMARY_STREAM_INTERVAL = float(os.environ.get("SUMMARY_STREAM_INTERVAL", "1"))
+SUMMARY_STREAM_KEEPALIVE = 15
+# Streams are closed after this long; EventSource reconnects on its own,
+# which keeps a stalled proxy from pinning a worker thread forever.
+SUMMARY_STREAM_MAX_SECONDS = int(os.environ.get("SUMMARY_STREAM_MAX_SECONDS", "300"))
+# Each open stream holds a gunicorn thread for its whole life; past this many per
+# process, /api/stream answers 503 and the UI polls instead, leaving threads for /api/*
+SUMMARY_STREAM_MAX_SUBSCRIBERS = int(os.environ.get("SUMMARY_STREAM_MAX_SUBSCRIBERS", "4"))
+
+_summary_cond = threading.Condition()
+_summary_state: Dict[str, Any] = {"version": 0, "data": None, "subscribers": 0}
+
+
+def summary_stream_worker():
+    """Refresh the summary while any stream is open and wake subscribers on change.
+
+    One VictoriaMetrics round trip per interval per process, no matter how
+    many browsers are connected.
+    """
+    while not _heartbeat_stop.is_set():
+        with _summary_cond:
+            while _summary_state["subscribers"] == 0 and not _heartbeat_stop.is_set():
+                _summary_cond.wait(5)
+        try:
+            data = build_summary(SYSTEM_ID)
+        except Exception as e:
+            logger.warning(f"Summary stream refresh failed: {e}")
+            data = None
+        if data is not None:
+            with _summary_cond:
+                if data != _summary_state["data"]:
+                    _summary_state["data"] = data
+                    _summary_state["version"] += 1
+                    _summary_cond.notify_all()
+        _heartbeat_stop.wait(SUMMARY_STREAM_INTERVAL)
+
+
+def _summary_events():
+    """Yield SSE frames carrying only the summary fields that changed."""
+    deadline = time.monotonic() + SUMMARY_STREAM_MAX_SECONDS
+    sent: Dict[str, Any] = {}
+    version = 0
+    yield "retry: 3000\n\n"
+    while time.monotonic() < deadline:
+        with _summary_cond:
+            if _summary_state["version"] == version:
+                _summary_cond.wait(SUMMARY_STREAM_KEEPALIVE)
+            current = _summary_state["version"]
+            data = _summary_state["data"]
+        if current == version or data is None:
+            yield ": keepalive\n\n"
+            continue
+        version = current
+        delta = {k: v for k, v in data.items() if k not in sent or sent[k] != v}
+        sent = data
+        if delta:
+            yield f"event: summary\ndata: {json.dumps(delta, separators=(',', ':'))}\n\n"
+
+
+def _release_summary_subscriber():
+    with _summary_cond:
+        _summary_state["subscribers"] -= 1
+
+
+@app.route("/api/stream")
+def api_stream():
+    """Push summary updates for this system as server-sent events."""
+    # The slot is taken here and released when the server closes the response,
+    # even if the stream never started
+    with _summary_cond:
+        if _summary_state["subscribers"] >= SUMMARY_STREAM_MAX_SUBSCRIBERS:
+            return jsonify({"error": "Too many open streams; poll /api/status"}), 503
+        _summary_state["subscribers"] += 1
+        _summary_cond.notify_all()
+    response = Response(
+        _summary_events(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+    response.call_on_close(_release_summary_subscriber)
+    return response
 
 
 @app.route("/api/admin/cleanup", methods=["POST"])
@@ -4141,69 +4650,75 @@ def api_image_upload():
         location = request.form.get('location', '').strip()
         caption = request.form.get('caption', '').strip()
         
-        file_content = file.read()
-        file_size = len(file_content)
-        
-        if file_size > MAX_IMAGE_SIZE:
-            logger.warning(f"Image upload failed: File too large ({file_size} bytes)")
-            return jsonify({"error": f"Image too large (max {MAX_IMAGE_SIZE // (1024*1024)}MB)"}), 400
-        
-        file_hash = hashlib.sha256(file_content).hexdigest()[:16]
-        ts = int(time.time())
-        ext = file.filename.rsplit('.', 1)[1].lower()
-        filename = f"{system_id}_{ts}_{file_hash}.{ext}"
-        
         os.makedirs(IMAGES_PATH, exist_ok=True)
-        filepath = os.path.join(IMAGES_PATH, filename)
-        
+        # Copy the upload to disk in chunks, hashing as we go, so a 10MB photo is
+        # never held in memory; the final name depends on the hash.
+        hasher = hashlib.sha256()
+        file_size = 0
+        too_large = False
+        tmp = tempfile.NamedTemporaryFile(dir=IMAGES_PATH, prefix=".upload-", suffix=".tmp", delete=False)
+        tmp_path = tmp.name
         try:
-            with open(filepath, 'wb') as f:
-                f.write(file_content)
+            with tmp:
+                for chunk in iter(lambda: file.stream.read(IMAGE_UPLOAD_CHUNK_SIZE), b""):
+                    file_size += len(chunk)
+                    if file_size > MAX_IMAGE_SIZE:
+                        too_large = True
+                        break
+                    hasher.update(chunk)
+                    tmp.write(chunk)
+            if too_large:
+                os.remove(tmp_path)
+                logger.warning(f"Image upload failed: File too large (>{MAX_IMAGE_SIZE} bytes)")
+                return jsonify({"error": f"Image too large (max {MAX_IMAGE_SIZE // (1024*1024)}MB)"}), 400
+            
+            file_hash = hasher.hexdigest()[:16]
+            ts = int(time.time())
+            ext = file.filename.rsplit('.', 1)[1].lower()
+            filename = f"{system_id}_{ts}_{file_hash}.{ext}"
+            os.replace(tmp_path, os.path.join(IMAGES_PATH, filename))
         except Exception as e:
-            logger.error(f"Failed to save image {filename}: {e}")
+            logger.error(f"Failed to save uploaded image: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
             return jsonify({"error": f"Failed to save image: {str(e)}"}), 500
         
         ts_ns = ts * int(1e9)
+        meta = {
+            "filename": filename,
+            "original_filename": secure_filename(file.filename),
+            "system_id": system_id,
+            "event_id": event_id,
+            "location": location,
+            "caption": caption,
+            "timestamp": ts_ns,
+            "file_size": file_size,
+            "content_type": file.content_type
+        }
+        image_id = None
         try:
-            with get_db() as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO images 
-                    (filename, original_filename, system_id, event_id, location, caption, timestamp, file_size, content_type)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    filename,
-                    secure_filename(file.filename),
-                    system_id,
-                    event_id or None,
-                    location or None,
-                    caption or None,
-                    ts_ns,
-                    file_size,
-                    file.content_type
-                ))
-                image_id = cursor.lastrowid
-                conn.commit()
-        except Exception as e:
-            logger.error(f"Failed to save image metadata: {e}")
-            try:
-                os.remove(filepath)
-            except:
-                pass
-            return jsonify({"error": f"Failed to save metadata: {str(e)}"}), 500
-        
-        log_audit("image_upload", system_id, event_id, location, caption, True)
+            _image_insert_queue.put_nowait(meta)
+        except queue.Full:
+            # Worker is behind; store this row before answering
+            image_id = save_image_metadata(meta, attempts=1)
+            if image_id is None:
+                return jsonify({"error": "Failed to save image metadata"}), 500
         logger.info(f"Image uploaded: {filename} ({file_size} bytes) for {system_id}")
         
+        # Queued metadata is inserted by image_metadata_worker; poll /api/images?filename= for the id
+        pending = image_id is None
         return jsonify({
             "success": True,
             "id": image_id,
+            "pending": pending,
             "filename": filename,
             "system_id": system_id,
             "event_id": event_id,
             "size": file_size,
             "timestamp": ts_ns
-        })
+        }), 202 if pending else 200
     
     except Exception as e:
         logger.error(f"Unexpected error in image upload: {e}", exc_info=True)
@@ -4215,10 +4730,17 @@ def api_images_list():
     """List images with optional filters."""
     system_id = canonicalize_system_id(request.args.get("system_id", "").strip())
     event_id = request.args.get("event_id", "").strip()
+    filename = request.args.get("filename", "").strip()
     limit = int(request.args.get("limit", "50"))
     
     with get_db() as conn:
-        if system_id and event_id:
+        if filename:
+            images = conn.execute("""
+                SELECT id, filename, original_filename, system_id, event_id, location, caption, timestamp, file_size
+                FROM images
+                WHERE filename = ?
+            """, (filename,)).fetchall()
+        elif system_id and event_id:
             images = conn.execute("""
                 SELECT id, filename, original_filename, system_id, event_id, location, caption, timestamp, file_size
                 FROM images
@@ -4293,12 +4815,7 @@ def api_image_delete(image_id):
         filename = image["filename"]
         system_id = image["system_id"]
         
-        filepath = os.path.join(IMAGES_PATH, filename)
-        try:
-            if os.path.exists(filepath):
-                os.remove(filepath)
-        except Exception as e:
-            logger.error(f"Failed to delete image file: {e}")
+        remove_image_files(filename)
         
         conn.execute("DELETE FROM images WHERE id = ?", (image_id,))
         conn.commit()
@@ -4308,6 +4825,51 @@ def api_image_delete(image_id):
     return jsonify({"success": True, "id": image_id})
 
 
+@app.route("/api/images", methods=["DELETE"])
+def api_images_delete():
+    """Delete several images in one transaction; reports a status per id."""
+    if not check_api_key():
+        return jsonify({"error": "Invalid API key"}), 401
+    
+    data = request.get_json() or {}
+    ids_raw = data.get("ids")
+    if not isinstance(ids_raw, list) or not ids_raw:
+        return jsonify({"error": "ids required"}), 400
+    if len(ids_raw) > IMAGE_BULK_DELETE_MAX:
+        return jsonify({"error": f"At most {IMAGE_BULK_DELETE_MAX} ids per request"}), 400
+    try:
+        image_ids = list(dict.fromkeys(int(i) for i in ids_raw))
+    except (ValueError, TypeError):
+        return jsonify({"error": "ids must be integers"}), 400
+    
+    placeholders = ",".join("?" * len(image_ids))
+    with get_db() as conn:
+        images = conn.execute(
+            f"SELECT id, filename, system_id FROM images WHERE id IN ({placeholders})",
+            image_ids
+        ).fetchall()
+        found = {row["id"]: row for row in images}
+        
+        if found:
+            now_ns = int(time.time() * 1e9)
+            conn.execute(
+                f"DELETE FROM images WHERE id IN ({','.join('?' * len(found))})",
+                list(found)
+            )
+            conn.executemany("""
+                INSERT INTO audit_log (timestamp, action, system_id, success)
+                VALUES (?, 'image_delete', ?, 1)
+            """, [(now_ns, row["system_id"]) for row in found.values()])
+            conn.commit()
+    
+    # Files go only after the rows are committed
+    for row in found.values():
+        remove_image_files(row["filename"])
+    
+    results = {str(i): ("deleted" if i in found else "not_found") for i in image_ids}
+    return jsonify({"success": True, "deleted_count": len(found), "results": results})
+
+
 @app.route("/images/<filename>")
 def serve_image(filename):
     """Serve image file."""
@@ -4317,43 +4879,131 @@ def serve_image(filename):
     return send_from_directory(IMAGES_PATH, filename)
 
 
+@app.route("/images/thumb/<filename>")
+def serve_image_thumb(filename):
+    """Serve a small JPEG preview of an image, or the original if none can be made."""
+    if '..' in filename or '/' in filename:
+        return "Invalid filename", 400
+    
+    thumb_name = image_thumbnail(filename)
+    if thumb_name is None:
+        return send_from_directory(IMAGES_PATH, filename)
+    return send_from_directory(IMAGE_THUMBS_PATH, thumb_name)
+
+
 @app.route("/sw.js")
 def service_worker():
-    """Service worker for map tile caching."""
+    """Service worker: precached shell assets, cached map tiles, offline status."""
     tile_prefixes = MAP_TILE_CACHE_PREFIXES
     cache_enabled = len(tile_prefixes) > 0
-    
+    # Only same-origin assets; CDN fallbacks can't be precached without CORS
+    precache = [
+        url for url in (
+            APP_CSS_URL,
+            LOGO_URL,
+            LEAFLET_CSS_URL,
+            LEAFLET_JS_URL,
+            INTER_FONT_URL,
+        )
+        if url and url.startswith("/")
+    ]
+    # Static URLs carry content hashes, so the cache name only has to change
+    # when the asset set does; activate() then drops the previous cache.
+    static_cache = f"ovr-static-{body_etag(chr(10).join(precache).encode())[:8]}"
+    # Only fingerprinted paths are immutable; plain /static/ names revalidate
+    immutable_static = sorted(f"/static/{path}" for path in _STATIC_FINGERPRINTS)
+
     js = f"""
-const CACHE_NAME = "ovr-map-tiles-v1";
+const STATIC_CACHE = {json.dumps(static_cache)};
+const TILE_CACHE = "ovr-map-tiles-v1";
+const API_CACHE = "ovr-api-v1";
+const PRECACHE = {json.dumps(precache)};
+const IMMUTABLE_STATIC = new Set({json.dumps(immutable_static)});
 const TILE_PREFIXES = {json.dumps(tile_prefixes)};
 const CACHE_ENABLED = {json.dumps(cache_enabled)};
+// Cached tiles are served immediately; older than this they are refreshed in the background
+const TILE_MAX_AGE_MS = 30 * 24 * 60 * 60 * 1000;
+const NETWORK_FIRST = ["/", "/api/status", "/api/summary"];
 
 self.addEventListener("install", (event) => {{
-  event.waitUntil(caches.open(CACHE_NAME));
+  event.waitUntil(
+    caches.open(STATIC_CACHE).then((cache) => cache.addAll(PRECACHE)).catch(() => {{}})
+  );
   self.skipWaiting();
 }});
 
 self.addEventListener("activate", (event) => {{
-  event.waitUntil(self.clients.claim());
+  const keep = [STATIC_CACHE, TILE_CACHE, API_CACHE];
+  event.waitUntil(
+    caches.keys()
+      .then((names) => Promise.all(
+        names.filter((name) => !keep.includes(name)).map((name) => caches.delete(name))
+      ))
+      .then(() => self.clients.claim())
+  );
 }});
 
-self.addEventListener("fetch", (event) => {{
-  if (event.request.method !== "GET") return;
-  if (!CACHE_ENABLED) return;
-  const url = event.request.url || "";
-  if (!TILE_PREFIXES.some((prefix) => url.startsWith(prefix))) return;
-
-  event.respondWith(
-    caches.open(CACHE_NAME).then((cache) =>
-      cache.match(event.request).then((cached) => {{
-        if (cached) return cached;
-        return fetch(event.request).then((response) => {{
-          cache.put(event.request, response.clone());
-          return response;
-        }});
+function cacheFirst(request) {{
+  return caches.open(STATIC_CACHE).then((cache) =>
+    cache.match(request).then((cached) => {{
+      if (cached) return cached;
+      return fetch(request).then((response) => {{
+        if (response.ok) cache.put(request, response.clone());
+        return response;
+      }});
+    }})
+  );
+}}
+
+async function staleWhileRevalidate(event) {{
+  const request = event.request;
+  const cache = await caches.open(TILE_CACHE);
+  // Tile responses are usually opaque, so the fetch time is kept in a side entry
+  const stampUrl = request.url + (request.url.includes("?") ? "&" : "?") + "sw-cached-at";
+  const [cached, stamp] = await Promise.all([cache.match(request), cache.match(stampUrl)]);
+  const refresh = () => fetch(request).then((response) => {{
+    if (response.ok || response.type === "opaque") {{
+      cache.put(request, response.clone());
+      cache.put(stampUrl, new Response(String(Date.now())));
+    }}
+    return response;
+  }});
+  if (!cached) return refresh();
+  const cachedAt = stamp ? Number(await stamp.text()) : 0;
+  if (Date.now() - cachedAt > TILE_MAX_AGE_MS) {{
+    event.waitUntil(refresh().catch(() => {{}}));
+  }}
+  return cached;
+}}
+
+function networkFirst(request) {{
+  return caches.open(API_CACHE).then((cache) =>
+    fetch(request)
+      .then((response) => {{
+        if (response.ok) cache.put(request, response.clone());
+        return response;
       }})
-    )
+      .catch(() => cache.match(request).then((cached) => cached || Promise.reject(new Error("offline"))))
   );
+}}
+
+self.addEventListener("fetch", (event) => {{
+  const request = event.request;
+  if (request.method !== "GET") return;
+  const url = new URL(request.url);
+
+  if (url.origin === self.location.origin) {{
+    if (IMMUTABLE_STATIC.has(url.pathname)) {{
+      event.respondWith(cacheFirst(request));
+    }} else if (NETWORK_FIRST.includes(url.pathname)) {{
+      event.respondWith(networkFirst(request));
+    }}
+    return;
+  }}
+
+  if (CACHE_ENABLED && TILE_PREFIXES.some((prefix) => request.url.startsWith(prefix))) {{
+    event.respondWith(staleWhileRevalidate(event));
+  }}
 }});
 """
     resp = make_response(js)
@@ -4862,23 +5512,12 @@ def api_dashboard():
 # Web UI
 # ============================================================================
 
-WEB_UI_HTML = """
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1, maximum-scale=1, user-scalable=no">
-    <title>Overdrive Event Logger</title>
-    <link
-        rel="stylesheet"
-        href="https://unpkg.com/leaflet@1.9.4/dist/leaflet.css"
-        integrity="sha256-p4NxAoJBhIIN+hmNHrzRCf9tD/miZyoHS5obTRR9BMY="
-        crossorigin=""
-    />
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">
-    <style>
+# Services selectable for a logger in the web UI
+LOGGER_SERVICE_OPTIONS = ["Pro6005-2"] + [f"Logger {i}" for i in range(10)]
+LOGGER_OPTIONS_HTML = "".join(f'<option value="{name}">{name}</option>' for name in LOGGER_SERVICE_OPTIONS)
+
+# Rules needed for first paint (shell, tabs, summary cards); inlined into the page
+CRITICAL_CSS = """
         * { box-sizing: border-box; margin: 0; padding: 0; }
         body {
             font-family: 'Inter', -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
@@ -4913,7 +5552,6 @@ WEB_UI_HTML = """
             font-size: 24px;
             margin-bottom: 20px;
             color: #333;
-            display: none; /* Hidden - using logo instead */
         }
         .logo-header {
             text-align: center;
@@ -4924,6 +5562,149 @@ WEB_UI_HTML = """
             height: auto;
             filter: drop-shadow(0 2px 8px rgba(0,0,0,0.15));
         }
+        .btn {
+            width: 100%;
+            padding: 14px;
+            margin-bottom: 10px;
+            border: none;
+            border-radius: 4px;
+            font-size: 16px;
+            font-weight: 600;
+            cursor: pointer;
+            transition: opacity 0.2s;
+        }
+        .btn:active { opacity: 0.7; }
+        .btn-start { background: #10b981; color: white; }
+        .btn-end { background: #ef4444; color: white; }
+        .btn-location { background: #3b82f6; color: white; }
+        .btn-note { background: #8b5cf6; color: white; }
+        .btn-sm { padding: 8px 16px; font-size: 14px; }
+        .btn-danger { background: #ef4444; color: white; }
+        .btn-set { margin-top: 10px; }
+        .btn-gradient-purple { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); }
+        .btn-gradient-pink { background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); }
+        .btn-gradient-green { background: linear-gradient(135deg, #10b981 0%, #059669 100%); }
+        .note-field { position: relative; }
+        .note-service { margin-bottom: 8px; font-size: 14px; padding: 8px; }
+        .hidden { display: none !important; }
+        .tabs {
+            display: flex;
+            margin-bottom: 20px;
+            border-bottom: 2px solid #e5e7eb;
+        }
+        .tab {
+            padding: 10px 20px;
+            background: none;
+            border: none;
+            cursor: pointer;
+            font-size: 16px;
+            color: #6b7280;
+            border-bottom: 3px solid transparent;
+            transition: all 0.2s;
+            flex: 1;
+            text-align: center;
+        }
+        .tab.active {
+            color: #3b82f6;
+            border-bottom-color: #3b82f6;
+            font-weight: 600;
+        }
+        .tab-content {
+            display: none;
+        }
+        .tab-content.active {
+            display: block;
+        }
+        .top-summary {
+            display: grid;
+            grid-template-columns: 1fr;
+            gap: 10px;
+            margin-top: -10px;
+            margin-bottom: 16px;
+        }
+        @media (min-width: 640px) {
+            .top-summary {
+                grid-template-columns: 1fr 1fr;
+            }
+        }
+        @media (min-width: 1024px) {
+            body {
+                padding: 20px;
+            }
+            .container {
+                max-width: 1200px;
+                padding: 24px 28px;
+            }
+            .top-summary {
+                grid-template-columns: repeat(4, 1fr);
+            }
+            .events-layout {
+                display: grid;
+                grid-template-columns: 1.2fr 0.8fr;
+                gap: 24px;
+                align-items: start;
+            }
+            .note-entry-desktop {
+                display: block;
+            }
+            .note-entry-mobile {
+                display: none;
+            }
+            .note-button-desktop {
+                display: inline-block;
+            }
+            .note-button-mobile {
+                display: none;
+            }
+            .control-grid {
+                grid-template-columns: repeat(2, minmax(0, 1fr));
+            }
+        }
+        .summary-item {
+            background: #f9fafb;
+            border: 1px solid #e5e7eb;
+            border-radius: 8px;
+            padding: 12px 14px;
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            font-size: 14px;
+            gap: 10px;
+        }
+        .summary-item.soc-good {
+            background: #dcfce7;
+            border-color: #86efac;
+        }
+        .summary-item.soc-warn {
+            background: #fef9c3;
+            border-color: #fde047;
+        }
+        .summary-item.soc-bad {
+            background: #fee2e2;
+            border-color: #fecaca;
+        }
+        .summary-label {
+            color: #6b7280;
+        }
+        .summary-value {
+            color: #111827;
+            font-weight: 600;
+            text-align: right;
+        }
+        .summary-alert {
+            color: #b91c1c;
+        }
+        .summary-item.alert-bad {
+            background: #fee2e2;
+            border-color: #fecaca;
+        }
+        .summary-item.alert-bad .summary-value {
+            color: #b91c1c;
+        }
+"""
+
+# Everything else, served as the fingerprinted /static/app.<hash>.css without blocking first paint
+DEFERRED_CSS = """
         .form-group {
             margin-bottom: 15px;
         }
@@ -5034,22 +5815,6 @@ WEB_UI_HTML = """
             resize: vertical;
             min-height: 60px;
         }
-        .btn {
-            width: 100%;
-            padding: 14px;
-            margin-bottom: 10px;
-            border: none;
-            border-radius: 4px;
-            font-size: 16px;
-            font-weight: 600;
-            cursor: pointer;
-            transition: opacity 0.2s;
-        }
-        .btn:active { opacity: 0.7; }
-        .btn-start { background: #10b981; color: white; }
-        .btn-end { background: #ef4444; color: white; }
-        .btn-location { background: #3b82f6; color: white; }
-        .btn-note { background: #8b5cf6; color: white; }
         .status {
             margin-top: 20px;
             padding: 15px;
@@ -5082,34 +5847,6 @@ WEB_UI_HTML = """
             padding: 5px 0;
             color: #6b7280;
         }
-        .tabs {
-            display: flex;
-            margin-bottom: 20px;
-            border-bottom: 2px solid #e5e7eb;
-        }
-        .tab {
-            padding: 10px 20px;
-            background: none;
-            border: none;
-            cursor: pointer;
-            font-size: 16px;
-            color: #6b7280;
-            border-bottom: 3px solid transparent;
-            transition: all 0.2s;
-            flex: 1;
-            text-align: center;
-        }
-        .tab.active {
-            color: #3b82f6;
-            border-bottom-color: #3b82f6;
-            font-weight: 600;
-        }
-        .tab-content {
-            display: none;
-        }
-        .tab-content.active {
-            display: block;
-        }
         .control-item {
             background: #f9fafb;
             padding: 15px;
@@ -5194,131 +5931,383 @@ WEB_UI_HTML = """
         .info-item strong {
             color: #111827;
         }
-        .top-summary {
+        .map-container {
+            height: 320px;
+            border-radius: 10px;
+            overflow: hidden;
+            border: 1px solid #e5e7eb;
+            margin-top: 10px;
+        }
+        .map-actions {
+            display: flex;
+            gap: 10px;
+            margin-top: 12px;
+            align-items: center;
+            flex-wrap: wrap;
+        }
+        .map-actions a {
+            color: #1d4ed8;
+            font-weight: 600;
+            text-decoration: none;
+        }
+        .map-meta {
+            font-size: 12px;
+            color: #6b7280;
+            margin-top: 8px;
+        }
+        .spaced-group {
+            margin-top: 20px;
+        }
+        .section-header {
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            margin-bottom: 10px;
+        }
+        .section-title {
+            margin: 0;
+            color: white;
+        }
+        .section-actions {
+            display: flex;
+            gap: 10px;
+            align-items: center;
+        }
+        .notes-section {
+            margin-top: 30px;
+        }
+        .notes-section .section-header {
+            margin-bottom: 15px;
+        }
+        .notes-container {
+            max-height: 400px;
+            overflow-y: auto;
+            background: rgba(255,255,255,0.05);
+            border-radius: 12px;
+            padding: 15px;
+        }
+        .select-all-bar {
+            margin-bottom: 10px;
+            padding: 8px;
+            background: rgba(255,255,255,0.1);
+            border-radius: 6px;
+        }
+        .select-all-label {
+            color: white;
+            cursor: pointer;
+            display: flex;
+            align-items: center;
+            gap: 8px;
+        }
+        .checkbox-lg {
+            cursor: pointer;
+            width: 18px;
+            height: 18px;
+        }
+        .upload-field {
+            margin-bottom: 10px;
+        }
+        .preview-img {
+            max-width: 100%;
+            max-height: 200px;
+            border-radius: 8px;
+        }
+        .info-box-warn {
+            background: #fef3c7;
+            border: 1px solid #f59e0b;
+        }
+        select.control-input {
+            padding: 12px;
+        }
+        .gallery-grid {
             display: grid;
-            grid-template-columns: 1fr;
+            grid-template-columns: repeat(auto-fill, minmax(150px, 1fr));
             gap: 10px;
-            margin-top: -10px;
-            margin-bottom: 16px;
         }
-        @media (min-width: 640px) {
-            .top-summary {
-                grid-template-columns: 1fr 1fr;
-            }
+        .gallery-grid > div {
+            content-visibility: auto;
+            contain-intrinsic-size: auto 200px;
         }
-        @media (min-width: 1024px) {
-            body {
-                padding: 20px;
-            }
-            .container {
-                max-width: 1200px;
-                padding: 24px 28px;
-            }
-            .top-summary {
-                grid-template-columns: repeat(4, 1fr);
-            }
-            .events-layout {
-                display: grid;
-                grid-template-columns: 1.2fr 0.8fr;
-                gap: 24px;
-                align-items: start;
-            }
-            .note-entry-desktop {
-                display: block;
-            }
-            .note-entry-mobile {
-                display: none;
-            }
-            .note-button-desktop {
-                display: inline-block;
-            }
-            .note-button-mobile {
-                display: none;
-            }
-            .control-grid {
-                grid-template-columns: repeat(2, minmax(0, 1fr));
-            }
+        .gallery-empty {
+            color: #ccc;
+            grid-column: 1 / -1;
+        }
+        .gallery-card {
+            background: rgba(255,255,255,0.1);
+            border-radius: 8px;
+            padding: 8px;
+            position: relative;
+            cursor: pointer;
+        }
+        .gallery-card > img {
+            width: 100%;
+            height: 120px;
+            object-fit: cover;
+            border-radius: 4px;
+        }
+        .gallery-card .image-checkbox {
+            position: absolute;
+            top: 6px;
+            left: 6px;
+            width: 18px;
+            height: 18px;
+            cursor: pointer;
+        }
+        .gallery-caption-wrap {
+            display: flex;
+            flex-direction: column;
+            gap: 4px;
+        }
+        .gallery-caption {
+            color: white;
+            font-size: 12px;
+            margin-top: 5px;
+            overflow: hidden;
+            text-overflow: ellipsis;
+            white-space: nowrap;
+        }
+        .gallery-caption-edit {
+            background: none;
+            border: none;
+            padding: 0;
+            color: #93c5fd;
+            font-size: 12px;
+            cursor: pointer;
+            text-align: left;
+        }
+        .gallery-caption-form {
+            margin-top: 6px;
+        }
+        .gallery-card .gallery-caption-input {
+            width: 100%;
+            padding: 6px 8px;
+            border-radius: 6px;
+            border: 1px solid #d1d5db;
+            font-size: 12px;
+        }
+        .gallery-caption-actions {
+            display: flex;
+            gap: 6px;
+            margin-top: 6px;
+        }
+        .gallery-caption-save,
+        .gallery-caption-cancel {
+            background: #e5e7eb;
+            border: none;
+            border-radius: 6px;
+            padding: 6px 8px;
+            font-size: 12px;
+            cursor: pointer;
+        }
+        .gallery-caption-cancel {
+            background: #f3f4f6;
+        }
+        .gallery-date {
+            color: #ccc;
+            font-size: 10px;
+            margin-top: 2px;
+        }
+        .gallery-delete {
+            position: absolute;
+            top: 5px;
+            right: 5px;
+            background: rgba(255,0,0,0.8);
+            color: white;
+            border: none;
+            border-radius: 50%;
+            width: 24px;
+            height: 24px;
+            cursor: pointer;
+            font-size: 18px;
+            line-height: 1;
+        }
+        .image-viewer {
+            position: fixed;
+            top: 0;
+            left: 0;
+            width: 100%;
+            height: 100%;
+            background: rgba(0,0,0,0.9);
+            z-index: 1000;
+            display: flex;
+            flex-direction: column;
+            align-items: center;
+            justify-content: center;
+            padding: 20px;
+        }
+        .image-viewer-img {
+            max-width: 90%;
+            max-height: 70vh;
+            border-radius: 8px;
         }
-        .summary-item {
-            background: #f9fafb;
-            border: 1px solid #e5e7eb;
+        .image-viewer-caption {
+            color: white;
+            font-size: 16px;
+            margin-top: 20px;
+            max-width: 90%;
+            text-align: center;
+            background: rgba(0,0,0,0.7);
+            padding: 10px 20px;
             border-radius: 8px;
-            padding: 12px 14px;
+        }
+        .image-viewer-date {
+            color: #ccc;
+            font-size: 12px;
+            margin-top: 10px;
+        }
+        .note-item {
+            background: #f0fdf4;
+            padding: 12px;
+            border-radius: 6px;
+            margin-bottom: 10px;
+            border: 1px solid #86efac;
             display: flex;
             justify-content: space-between;
             align-items: center;
-            font-size: 14px;
-            gap: 10px;
         }
-        .summary-item.soc-good {
-            background: #dcfce7;
-            border-color: #86efac;
+        .note-item .note-checkbox {
+            cursor: pointer;
+            width: 18px;
+            height: 18px;
+            margin-right: 12px;
         }
-        .summary-item.soc-warn {
-            background: #fef9c3;
-            border-color: #fde047;
+        .note-info {
+            flex: 1;
         }
-        .summary-item.soc-bad {
-            background: #fee2e2;
-            border-color: #fecaca;
+        .note-meta {
+            color: #059669;
+            font-weight: 600;
+            font-size: 12px;
+            margin-bottom: 4px;
         }
-        .summary-label {
-            color: #6b7280;
+        .note-text {
+            color: #374151;
+            white-space: pre-wrap;
+            word-wrap: break-word;
+            line-height: 1.5;
         }
-        .summary-value {
-            color: #111827;
-            font-weight: 600;
-            text-align: right;
+        .note-delete {
+            background: #ef4444;
+            color: white;
+            border: none;
+            padding: 6px 12px;
+            border-radius: 4px;
+            cursor: pointer;
+            font-size: 12px;
+            margin-left: 10px;
+            flex-shrink: 0;
         }
-        .summary-alert {
-            color: #b91c1c;
+        .end-event-modal {
+            position: fixed;
+            top: 0;
+            left: 0;
+            width: 100%;
+            height: 100%;
+            background: rgba(0,0,0,0.7);
+            z-index: 2000;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            padding: 20px;
+            transition: opacity 0.3s;
         }
-        .summary-item.alert-bad {
-            background: #fee2e2;
-            border-color: #fecaca;
+        .end-event-modal.fading {
+            opacity: 0;
         }
-        .summary-item.alert-bad .summary-value {
-            color: #b91c1c;
+        .end-event-box {
+            background: linear-gradient(135deg, #10b981 0%, #059669 100%);
+            color: white;
+            padding: 30px 40px;
+            border-radius: 12px;
+            font-size: 18px;
+            font-weight: 600;
+            text-align: center;
+            box-shadow: 0 10px 40px rgba(0,0,0,0.5);
+            max-width: 90%;
         }
-        .map-container {
-            height: 320px;
-            border-radius: 10px;
-            overflow: hidden;
-            border: 1px solid #e5e7eb;
+        .end-event-box .end-event-msg {
+            margin-bottom: 20px;
+        }
+        .end-event-box .end-event-report {
+            background: white;
+            color: #059669;
+            padding: 12px 24px;
+            border: none;
+            border-radius: 8px;
+            font-size: 16px;
+            font-weight: 600;
+            cursor: pointer;
             margin-top: 10px;
         }
-        .map-actions {
+        .confirm-modal {
+            position: fixed;
+            top: 0;
+            left: 0;
+            width: 100%;
+            height: 100%;
+            background: rgba(0,0,0,0.5);
+            z-index: 2000;
             display: flex;
-            gap: 10px;
-            margin-top: 12px;
             align-items: center;
-            flex-wrap: wrap;
+            justify-content: center;
+            padding: 20px;
         }
-        .map-actions a {
-            color: #1d4ed8;
-            font-weight: 600;
-            text-decoration: none;
+        .confirm-box {
+            background: white;
+            padding: 24px;
+            border-radius: 12px;
+            box-shadow: 0 10px 40px rgba(0,0,0,0.3);
+            width: 100%;
+            max-width: 360px;
         }
-        .map-meta {
-            font-size: 12px;
-            color: #6b7280;
-            margin-top: 8px;
+        .confirm-msg {
+            font-size: 16px;
+            color: #111827;
+            margin-bottom: 20px;
         }
-    </style>
-    <script
-        src="https://unpkg.com/leaflet@1.9.4/dist/leaflet.js"
-        integrity="sha256-20nQCchB9co0qIjJZRGuk2/Z9VM+kNiyxNV1lvTlZBo="
-        crossorigin=""
-    ></script>
+        .confirm-actions {
+            display: flex;
+            gap: 10px;
+        }
+        .confirm-actions .btn {
+            margin-bottom: 0;
+        }
+        .confirm-cancel {
+            background: #e5e7eb;
+            color: #374151;
+        }
+"""
+
+WEB_UI_HTML = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1, maximum-scale=1, user-scalable=no">
+    <title>Overdrive Event Logger</title>
+    {% if INTER_FONT_URL %}<link rel="preload" href="{{ INTER_FONT_URL }}" as="font" type="font/woff2" crossorigin>{% endif %}
+    <!-- Leaflet is loaded on first visit to the Map tab; warm the cache while idle -->
+    <link rel="prefetch" href="{{ LEAFLET_CSS_URL }}" as="style" crossorigin="">
+    <link rel="prefetch" href="{{ LEAFLET_JS_URL }}" as="script" crossorigin="">
+    <style>
+{% if INTER_FONT_URL %}        @font-face {
+            font-family: 'Inter';
+            font-style: normal;
+            font-weight: 100 900;
+            font-display: swap;
+            src: url('{{ INTER_FONT_URL }}') format('woff2');
+        }
+{% endif %}{{ CRITICAL_CSS | safe }}    </style>
+    <link rel="stylesheet" href="{{ APP_CSS_URL }}" media="print" onload="this.media='all'">
+    <noscript><link rel="stylesheet" href="{{ APP_CSS_URL }}"></noscript>
 </head>
 <body>
     <div class="container">
         <div class="logo-header">
-            <img src="data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 640 640'%3E%3Crect fill='%23000' width='640' height='640'/%3E%3Ctext x='50%25' y='35%25' fill='%23fff' font-size='180' font-weight='900' text-anchor='middle' font-family='Arial, sans-serif'%3EOVR%3C/text%3E%3Crect x='82' y='275' width='476' height='20' fill='%2340C463'/%3E%3Ctext x='50%25' y='75%25' fill='%23fff' font-size='180' font-weight='900' text-anchor='middle' font-family='Arial, sans-serif'%3EDRV%3C/text%3E%3Ctext x='50%25' y='87%25' fill='%2340C463' font-size='32' font-weight='600' text-anchor='middle' font-family='Arial, sans-serif'%3EENERGY SOLUTIONS%3C/text%3E%3C/svg%3E" 
+            <img src="{{ LOGO_URL }}" width="280" height="280" loading="eager" decoding="async"
                  alt="Overdrive Energy Solutions" 
-                 onerror="this.style.display='none'; document.querySelector('h1').style.display='block';">
+                 onerror="this.style.display='none'; this.parentNode.insertAdjacentHTML('afterend', '<h1>OVR Event Marker</h1>');">
         </div>
-        <h1>OVR Event Marker</h1>
         <div class="top-summary">
             <div class="summary-item">
                 <span class="summary-label">SOC</span>
@@ -5339,13 +6328,13 @@ WEB_UI_HTML = """
         </div>
         
         <div class="tabs">
-            <button class="tab active" onclick="switchTab('events')">Events</button>
-            <button class="tab" onclick="switchTab('control')">GX Control</button>
-            <button class="tab" onclick="switchTab('map')">Map</button>
+            <button class="tab active" data-tab="events" onclick="switchTab('events')">Events</button>
+            <button class="tab" data-tab="control" onclick="switchTab('control')">GX Control</button>
+            <button class="tab" data-tab="map" onclick="switchTab('map')">Map</button>
         </div>
         
         <div id="tab-events" class="tab-content active">
-            <div class="info-box" id="statusBox" style="display:none;">
+            <div class="info-box hidden" id="statusBox">
                 <h3>Active Event: <span id="statusEventId">-</span></h3>
                 <div id="activeLoggersContainer"></div>
             </div>
@@ -5358,23 +6347,30 @@ WEB_UI_HTML = """
             <input type="text" id="eventId" placeholder="e.g., warehouse, customer_site_a">
         </div>
         
+        <template id="loggerEntryTpl">
+            <div class="logger-entry">
+                <div class="form-group">
+                    <div class="logger-header">
+                        <label data-for="service___IDX__">Service</label>
+                        <button type="button" class="remove-logger">Remove</button>
+                    </div>
+                    <select data-id="service___IDX__">
+                        <option value="">-- Select Service --</option>
+                        {{ LOGGER_OPTIONS_HTML | safe }}
+                    </select>
+                </div>
+                <div class="form-group">
+                    <label data-for="location___IDX__">Location (optional)</label>
+                    <input type="text" data-id="location___IDX__" placeholder="e.g., bay_3, north_yard" data-list="locationList___IDX__">
+                    <datalist data-id="locationList___IDX__"></datalist>
+                </div>
+            </div>
+        </template>
         <div id="loggersContainer">
             <div class="logger-entry" data-logger-index="0">
                 <div class="form-group">
                     <label for="service_0">Service</label>
-                    <select id="service_0" name="service_0">
-                        <option value="Pro6005-2">Pro6005-2</option>
-                        <option value="Logger 0">Logger 0</option>
-                        <option value="Logger 1">Logger 1</option>
-                        <option value="Logger 2">Logger 2</option>
-                        <option value="Logger 3">Logger 3</option>
-                        <option value="Logger 4">Logger 4</option>
-                        <option value="Logger 5">Logger 5</option>
-                        <option value="Logger 6">Logger 6</option>
-                        <option value="Logger 7">Logger 7</option>
-                        <option value="Logger 8">Logger 8</option>
-                        <option value="Logger 9">Logger 9</option>
-                    </select>
+                    <select id="service_0" name="service_0">{{ LOGGER_OPTIONS_HTML | safe }}</select>
                 </div>
                 <div class="form-group">
                     <label for="location_0">Location (optional)</label>
@@ -5388,18 +6384,16 @@ WEB_UI_HTML = """
         
         <div class="form-group note-entry note-entry-mobile">
             <label for="noteMobile">Note (optional)</label>
-            <div style="position: relative;">
-                <select id="noteServiceMobile" onchange="syncNoteFields('mobile')"
-                        style="margin-bottom: 8px; font-size: 14px; padding: 8px;">
+            <div class="note-field">
+                <select id="noteServiceMobile" class="note-service">
                     <option value="">General note (all loggers)</option>
                 </select>
-                <textarea id="noteMobile" placeholder="Add a note or observation..."
-                          oninput="syncNoteFields('mobile')"></textarea>
+                <textarea id="noteMobile" placeholder="Add a note or observation..."></textarea>
             </div>
         </div>
         
         <button class="btn btn-start" onclick="startEvent()">START EVENT</button>
-        <button class="btn btn-end" onclick="endAllLoggers()" style="display:none;">End Event</button>
+        <button class="btn btn-end hidden" onclick="endAllLoggers()">End Event</button>
         <button class="btn btn-location" onclick="setLocation()">SET LOCATION</button>
         <button class="btn btn-note note-button-mobile" onclick="addNote()">ADD NOTE</button>
         
@@ -5408,86 +6402,88 @@ WEB_UI_HTML = """
 
         <div class="form-group note-entry note-entry-desktop">
             <label for="noteDesktop">Note (optional)</label>
-            <div style="position: relative;">
-                <select id="noteServiceDesktop" onchange="syncNoteFields('desktop')"
-                        style="margin-bottom: 8px; font-size: 14px; padding: 8px;">
+            <div class="note-field">
+                <select id="noteServiceDesktop" class="note-service">
                     <option value="">General note (all loggers)</option>
                 </select>
-                <textarea id="noteDesktop" placeholder="Add a note or observation..."
-                          oninput="syncNoteFields('desktop')"></textarea>
+                <textarea id="noteDesktop" placeholder="Add a note or observation..."></textarea>
             </div>
             <button class="btn btn-note note-button-desktop" onclick="addNote()">ADD NOTE</button>
         </div>
         
         <!-- Notes History Section -->
-        <div id="notesSection" style="margin-top: 30px; display:none;">
-            <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 15px;">
-                <h3 style="color: white; margin: 0;">Event Notes</h3>
-                <div style="display: flex; gap: 10px; align-items: center;">
-                    <button id="deleteSelectedBtn" class="btn" onclick="deleteSelectedNotes()" 
-                            style="padding: 8px 16px; font-size: 14px; background: #ef4444; display: none;">
+        <div id="notesSection" class="notes-section hidden">
+            <div class="section-header">
+                <h3 class="section-title">Event Notes</h3>
+                <div class="section-actions">
+                    <button id="deleteSelectedBtn" class="btn btn-sm btn-danger hidden" onclick="deleteSelectedNotes()">
                         Delete Selected
                     </button>
-                    <button class="btn" onclick="toggleNotes()" style="padding: 8px 16px; font-size: 14px;">
+                    <button class="btn btn-sm" onclick="toggleNotes()">
                         <span id="notesToggleText">Hide Notes</span>
                     </button>
                 </div>
             </div>
-            <div id="notesContainer" style="max-height: 400px; overflow-y: auto; background: rgba(255,255,255,0.05); border-radius: 12px; padding: 15px;">
-                <div id="notesListHeader" style="display: none; margin-bottom: 10px; padding: 8px; background: rgba(255,255,255,0.1); border-radius: 6px;">
-                    <label style="color: white; cursor: pointer; display: flex; align-items: center; gap: 8px;">
-                        <input type="checkbox" id="selectAllNotes" onchange="toggleSelectAll()" style="cursor: pointer; width: 18px; height: 18px;">
+            <div id="notesContainer" class="notes-container">
+                <div id="notesListHeader" class="select-all-bar hidden">
+                    <label class="select-all-label">
+                        <input type="checkbox" id="selectAllNotes" class="checkbox-lg" onchange="toggleSelectAll()">
                         <span>Select All</span>
                     </label>
                 </div>
                 <div id="notesList"></div>
+                <template id="noteRowTpl">
+                    <div class="note-item">
+                        <input type="checkbox" class="note-checkbox">
+                        <div class="note-info">
+                            <div class="note-meta"></div>
+                            <div class="note-text"></div>
+                        </div>
+                        <button class="note-delete">Delete</button>
+                    </div>
+                </template>
             </div>
         </div>
         
-        <div class="form-group" style="margin-top: 20px;">
+        <div class="form-group spaced-group">
             <label for="imageFile">Upload Image (optional)</label>
-            <input type="file" id="imageFile" accept="image/*" capture="environment" 
-                   onchange="previewImage(event)" style="margin-bottom: 10px;">
-            <div id="imagePreview" style="display:none; margin-bottom: 10px;">
-                <img id="previewImg" style="max-width: 100%; max-height: 200px; border-radius: 8px;">
+            <input type="file" id="imageFile" class="upload-field" accept="image/*" capture="environment" 
+                   onchange="previewImage(event)">
+            <div id="imagePreview" class="upload-field hidden">
+                <img id="previewImg" class="preview-img">
             </div>
-            <input type="text" id="imageCaption" placeholder="Image caption (optional)" 
-                   style="margin-bottom: 10px;">
-            <button class="btn" onclick="uploadImage()" 
-                    style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);">
+            <input type="text" id="imageCaption" class="upload-field" placeholder="Image caption (optional)">
+            <button class="btn btn-gradient-purple" onclick="uploadImage()">
                 UPLOAD IMAGE
             </button>
         </div>
         
-        <div class="form-group" style="margin-top: 20px;">
-            <button class="btn" onclick="loadImages()" 
-                    style="background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);">
+        <div class="form-group spaced-group">
+            <button class="btn btn-gradient-pink" onclick="loadImages()">
                 VIEW IMAGES
             </button>
         </div>
         
-        <div id="imageGallery" style="display:none; margin-top: 20px;">
-            <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 10px;">
-                <h3 style="margin: 0; color: white;">Image Gallery</h3>
-                <button id="deleteSelectedImagesBtn" class="btn" onclick="deleteSelectedImages()"
-                        style="padding: 8px 16px; font-size: 14px; background: #ef4444; display: none;" disabled>
+        <div id="imageGallery" class="spaced-group hidden">
+            <div class="section-header">
+                <h3 class="section-title">Image Gallery</h3>
+                <button id="deleteSelectedImagesBtn" class="btn btn-sm btn-danger hidden" onclick="deleteSelectedImages()" disabled>
                     Delete Selected
                 </button>
             </div>
-            <div id="imagesListHeader" style="display: none; margin-bottom: 10px; padding: 8px; background: rgba(255,255,255,0.1); border-radius: 6px;">
-                <label style="color: white; cursor: pointer; display: flex; align-items: center; gap: 8px;">
-                    <input type="checkbox" id="selectAllImages" onchange="toggleSelectAllImages()" style="cursor: pointer; width: 18px; height: 18px;">
+            <div id="imagesListHeader" class="select-all-bar hidden">
+                <label class="select-all-label">
+                    <input type="checkbox" id="selectAllImages" class="checkbox-lg" onchange="toggleSelectAllImages()">
                     <span>Select All</span>
                 </label>
             </div>
-            <div id="galleryGrid" style="display: grid; grid-template-columns: repeat(auto-fill, minmax(150px, 1fr)); gap: 10px;">
+            <div id="galleryGrid" class="gallery-grid">
             </div>
         </div>
 
                 </div>
             </div>
 
-        <div id="statusMsg" style="display:none;"></div>
         </div>
 
         <div id="tab-map" class="tab-content">
@@ -5505,10 +6501,10 @@ WEB_UI_HTML = """
         </div>
         
         <div id="tab-control" class="tab-content">
-            <div class="info-box" style="background: #fef3c7; border: 1px solid #f59e0b;">
+            <div class="info-box info-box-warn">
                 <strong>Warning:</strong> Changes affect the GX device immediately. Use with caution.
             </div>
-            <div id="gxStatus" class="gx-status gx-info" style="display:none;"></div>
+            <div id="gxStatus" class="gx-status gx-info hidden"></div>
             
             <div class="control-grid">
             <div class="control-item">
@@ -5516,7 +6512,7 @@ WEB_UI_HTML = """
                 <div class="description">Maximum charging current from grid/generator (Amps)</div>
                 <div class="current-value" id="current_battery_charge_current">Current: Loading...</div>
                 <input type="number" id="input_battery_charge_current" class="control-input" placeholder="e.g., 50" min="0" max="600">
-                <button class="btn" onclick="setGXSetting('battery_charge_current', 'input_battery_charge_current')" style="width: 100%; margin-top: 10px;">
+                <button type="button" class="btn btn-set" data-setting="battery_charge_current" data-input="input_battery_charge_current">
                     SET
                 </button>
             </div>
@@ -5525,13 +6521,13 @@ WEB_UI_HTML = """
                 <label>Inverter Mode</label>
                 <div class="description">Control inverter operation mode</div>
                 <div class="current-value" id="current_inverter_mode">Current: Loading...</div>
-                <select id="input_inverter_mode" class="control-input" style="padding: 12px;">
+                <select id="input_inverter_mode" class="control-input">
                     <option value="on">On (Inverter + Charger)</option>
                     <option value="inverter_only">Inverter Only</option>
                     <option value="charger_only">Charger Only</option>
                     <option value="off">Off</option>
                 </select>
-                <button class="btn" onclick="setGXSettingSelect('inverter_mode', 'input_inverter_mode')" style="width: 100%; margin-top: 10px;">
+                <button type="button" class="btn btn-set" data-setting="inverter_mode" data-input="input_inverter_mode">
                     SET
                 </button>
             </div>
@@ -5541,7 +6537,7 @@ WEB_UI_HTML = """
                 <div class="description">Maximum current draw from AC input (Amps)</div>
                 <div class="current-value" id="current_ac_input_current_limit">Current: Loading...</div>
                 <input type="number" id="input_ac_input_current_limit" class="control-input" placeholder="e.g., 30" min="0" max="200" step="0.1">
-                <button class="btn" onclick="setGXSetting('ac_input_current_limit', 'input_ac_input_current_limit')" style="width: 100%; margin-top: 10px;">
+                <button type="button" class="btn btn-set" data-setting="ac_input_current_limit" data-input="input_ac_input_current_limit">
                     SET
                 </button>
             </div>
@@ -5551,18 +6547,35 @@ WEB_UI_HTML = """
                 <div class="description">AC output voltage setpoint (Volts)</div>
                 <div class="current-value" id="current_inverter_output_voltage">Current: Loading...</div>
                 <input type="number" id="input_inverter_output_voltage" class="control-input" placeholder="e.g., 120" min="100" max="240" step="1">
-                <button class="btn" onclick="setGXSetting('inverter_output_voltage', 'input_inverter_output_voltage')" style="width: 100%; margin-top: 10px;">
+                <button type="button" class="btn btn-set" data-setting="inverter_output_voltage" data-input="input_inverter_output_voltage">
                     SET
                 </button>
             </div>
             </div>
             
-            <button class="btn" onclick="loadGXSettings()" style="background: linear-gradient(135deg, #10b981 0%, #059669 100%);">
+            <button class="btn btn-gradient-green" onclick="loadGXSettings()">
                 REFRESH VALUES
             </button>
         </div>
         
-        <div id="statusMsg" style="display:none;"></div>
+        <div id="statusMsg" class="hidden"></div>
+    </div>
+    
+    <div id="endEventModal" class="end-event-modal hidden">
+        <div class="end-event-box">
+            <div id="endEventMsg" class="end-event-msg"></div>
+            <button id="endEventReportBtn" class="btn btn-primary end-event-report">View Report</button>
+        </div>
+    </div>
+    
+    <div id="confirmModal" class="confirm-modal hidden">
+        <div class="confirm-box" role="alertdialog" aria-labelledby="confirmMsg">
+            <div id="confirmMsg" class="confirm-msg"></div>
+            <div class="confirm-actions">
+                <button type="button" id="confirmCancelBtn" class="btn btn-sm confirm-cancel">Cancel</button>
+                <button type="button" id="confirmOkBtn" class="btn btn-sm btn-danger">Delete</button>
+            </div>
+        </div>
     </div>
     
     <script>
@@ -5570,11 +6583,42 @@ WEB_UI_HTML = """
         const MAP_TILE_URL = {{ MAP_TILE_URL | tojson }};
         const MAP_TILE_ATTRIBUTION = {{ MAP_TILE_ATTRIBUTION | tojson }};
         const MAP_DEFAULT_ZOOM = {{ MAP_DEFAULT_ZOOM }};
+        // Trace logging only when the service runs with DEBUG=1
+        const DEBUG = {{ DEBUG | tojson }};
+        const dlog = DEBUG ? console.log.bind(console) : () => {};
+        const LEAFLET_ASSETS = {
+            css: {{ LEAFLET_CSS_URL | tojson }},
+            cssIntegrity: {{ LEAFLET_CSS_SRI | tojson }},
+            js: {{ LEAFLET_JS_URL | tojson }},
+            jsIntegrity: {{ LEAFLET_JS_SRI | tojson }}
+        };
+        let leafletLoading = null;
         let mapInstance = null;
         let mapMarker = null;
         let mapInitialized = false;
         let lastGps = null;
 
+        // Elements touched on every update, looked up once. The script runs at the
+        // end of <body>, so they already exist.
+        const $ = {};
+        [
+            'summary_soc', 'summary_alerts', 'summary_pin', 'summary_pout',
+            'eventId', 'noteMobile', 'noteDesktop', 'noteServiceMobile', 'noteServiceDesktop',
+            'mapCoords', 'mapUpdated', 'mapLink', 'gxStatus', 'statusBox', 'statusEventId',
+            'activeLoggersContainer', 'notesList', 'galleryGrid', 'loggersContainer',
+            'endEventModal', 'endEventMsg', 'endEventReportBtn',
+            'confirmModal', 'confirmMsg', 'confirmOkBtn', 'confirmCancelBtn',
+            'notesSection', 'notesListHeader', 'deleteSelectedBtn', 'notesContainer', 'notesToggleText',
+            'selectAllNotes', 'systemIdList', 'locationList', 'mapNote',
+            'imageFile', 'imageCaption', 'imagePreview', 'previewImg', 'imageGallery',
+            'imagesListHeader', 'deleteSelectedImagesBtn', 'selectAllImages',
+            'current_battery_charge_current', 'current_inverter_mode',
+            'current_ac_input_current_limit', 'current_inverter_output_voltage', 'input_inverter_mode'
+        ].forEach((id) => { $[id] = document.getElementById(id); });
+        $.btnStart = document.querySelector('.btn-start');
+        $.btnEnd = document.querySelector('.btn-end');
+        $.eventIdGroup = $.eventId.closest('.form-group');
+
         if ('serviceWorker' in navigator) {
             navigator.serviceWorker.register('/sw.js').catch((err) => {
                 console.warn('Service worker registration failed:', err);
@@ -5585,6 +6629,7 @@ WEB_UI_HTML = """
             // Remove any existing status modals
             const existing = document.getElementById('statusModal');
             if (existing) existing.remove();
+            $.endEventModal.classList.add('hidden');
             
             // Create centered modal overlay
             const modal = document.createElement('div');
@@ -5626,49 +6671,56 @@ WEB_UI_HTML = """
         
         // Logger management
         let loggerCount = 1;
+        // Services attached to the active event, kept in sync by displayActiveLoggers
+        const activeServices = new Set();
+        
+        // Entry markup, options included, is parsed once; each row is a deep clone
+        const loggerEntryTpl = document.getElementById('loggerEntryTpl');
+        
+        // Live collection: stays current as entries are added and removed
+        const loggerEntries = $.loggersContainer.getElementsByClassName('logger-entry');
+        
+        // One pass over the form entries; each entry caches its select/input refs
+        function loggerRows() {
+            const rows = [];
+            for (let i = 0, n = loggerEntries.length; i < n; i++) {
+                const entry = loggerEntries[i];
+                if (!entry._selectEl) entry._selectEl = entry.querySelector('select');
+                if (!entry._locationEl) entry._locationEl = entry.querySelector('input[type="text"]');
+                rows.push({ index: entry.dataset.loggerIndex, select: entry._selectEl, location: entry._locationEl });
+            }
+            return rows;
+        }
+        
+        // Build a complete logger entry off-document: ids and options are all set
+        // before the caller inserts it with a single DOM write.
+        function buildLoggerEntry(index, removable = true) {
+            const fragment = loggerEntryTpl.content.cloneNode(true);
+            const entry = fragment.querySelector('.logger-entry');
+            entry.dataset.loggerIndex = index;
+            fragment.querySelectorAll('[data-id]').forEach(el => {
+                el.id = el.dataset.id.replace('__IDX__', index);
+                if ('name' in el) el.name = el.id;
+            });
+            fragment.querySelectorAll('[data-for]').forEach(label => {
+                label.htmlFor = label.dataset.for.replace('__IDX__', index);
+            });
+            fragment.querySelectorAll('[data-list]').forEach(input => {
+                input.setAttribute('list', input.dataset.list.replace('__IDX__', index));
+            });
+            const header = entry.querySelector('.logger-header');
+            if (removable) {
+                header.querySelector('.remove-logger').dataset.idx = index;
+            } else {
+                // The first entry can't be removed; it keeps a plain label
+                header.replaceWith(header.querySelector('label'));
+            }
+            entry._selectEl = entry.querySelector('select');
+            return fragment;
+        }
         
         function addLogger() {
-            const container = document.getElementById('loggersContainer');
-            const newLoggerHtml = `
-                <div class="logger-entry" data-logger-index="${loggerCount}">
-                    <div class="form-group">
-                        <div class="logger-header">
-                            <label for="service_${loggerCount}">Service</label>
-                            <button class="remove-logger" onclick="removeLogger(${loggerCount})">Remove</button>
-                        </div>
-                        <select id="service_${loggerCount}" name="service_${loggerCount}">
-                            <option value="">-- Select Service --</option>
-                            <option value="Pro6005-2">Pro6005-2</option>
-                            <option value="Logger 0">Logger 0</option>
-                            <option value="Logger 1">Logger 1</option>
-                            <option value="Logger 2">Logger 2</option>
-                            <option value="Logger 3">Logger 3</option>
-                            <option value="Logger 4">Logger 4</option>
-                            <option value="Logger 5">Logger 5</option>
-                            <option value="Logger 6">Logger 6</option>
-                            <option value="Logger 7">Logger 7</option>
-                            <option value="Logger 8">Logger 8</option>
-                            <option value="Logger 9">Logger 9</option>
-                        </select>
-                    </div>
-                    <div class="form-group">
-                        <label for="location_${loggerCount}">Location (optional)</label>
-                        <input type="text" id="location_${loggerCount}" name="location_${loggerCount}" 
-                               placeholder="e.g., bay_3, north_yard" list="locationList_${loggerCount}">
-                        <datalist id="locationList_${loggerCount}"></datalist>
-                    </div>
-                </div>
-            `;
-            container.insertAdjacentHTML('beforeend', newLoggerHtml);
-            
-            // Add change listener to new dropdown
-            const newSelect = document.getElementById(`service_${loggerCount}`);
-            if (newSelect) {
-                newSelect.addEventListener('change', (e) => { 
-                    if (e.isTrusted) updateServiceOptions(); 
-                });
-            }
-            
+            $.loggersContainer.appendChild(buildLoggerEntry(loggerCount));
             loggerCount++;
             updateServiceOptions(); // Disable already-selected services
         }
@@ -5683,99 +6735,87 @@ WEB_UI_HTML = """
             updateServiceOptions(); // Re-enable service in other dropdowns
         }
         
+        // Callers fire in bursts (change events, add/remove, status refresh);
+        // collapse them into one pass before the next paint.
+        let serviceOptionsPending = false;
         function updateServiceOptions() {
-            // Get all currently selected services (from form AND active loggers)
-            const selected = new Set();
-            
-            // Add services from active loggers in status area
-            document.querySelectorAll('.active-logger-label').forEach(label => {
-                const serviceName = label.textContent.trim();
-                console.log('Active logger found:', serviceName);
-                selected.add(serviceName);
+            if (serviceOptionsPending) return;
+            serviceOptionsPending = true;
+            requestAnimationFrame(() => {
+                serviceOptionsPending = false;
+                applyServiceOptions();
             });
+        }
+        
+        function applyServiceOptions() {
+            // Get all currently selected services (from form AND active loggers)
+            const selected = new Set(activeServices);
             
-            // Build map of which services are selected in which dropdowns
-            const dropdownSelections = new Map();
-            document.querySelectorAll('.logger-entry').forEach(entry => {
-                const index = entry.getAttribute('data-logger-index');
-                const select = document.getElementById(`service_${index}`);
+            // Map each service picked in the form to the dropdown that picked it
+            const rows = loggerRows();
+            const valueOwner = new Map();
+            rows.forEach(({ index, select }) => {
                 if (select && select.value) { // Only count if a real service is selected
-                    dropdownSelections.set(index, select.value);
+                    valueOwner.set(select.value, index);
                 }
             });
             
-            console.log('All selected services:', Array.from(selected));
-            console.log('Dropdown selections:', Object.fromEntries(dropdownSelections));
-            
-            // Update all dropdowns to disable already-selected options
-            document.querySelectorAll('.logger-entry').forEach(entry => {
-                const index = entry.getAttribute('data-logger-index');
-                const select = document.getElementById(`service_${index}`);
-                if (select) {
-                    const currentValue = select.value;
-                    Array.from(select.options).forEach(option => {
-                        // Skip the placeholder option
-                        if (option.value === '') {
-                            option.disabled = false;
-                            return;
-                        }
-                        
-                        // Disable if:
-                        // 1. It's in an active logger, OR
-                        // 2. It's selected in a DIFFERENT dropdown
-                        const inActiveLoggers = selected.has(option.value);
-                        const inOtherDropdown = Array.from(dropdownSelections.entries())
-                            .some(([idx, val]) => idx !== index && val === option.value);
-                        
-                        const shouldDisable = inActiveLoggers || inOtherDropdown;
-                        option.disabled = shouldDisable;
-                        
-                        if (shouldDisable) {
-                            console.log(`Disabling ${option.value} in dropdown ${index} (active=${inActiveLoggers}, other=${inOtherDropdown})`);
-                        }
-                    });
-                    
-                    // If current selection is now disabled (and not empty), switch to first available option
-                    if (currentValue && currentValue !== '') {
-                        const currentOption = Array.from(select.options).find(opt => opt.value === currentValue);
-                        if (currentOption && currentOption.disabled) {
-                            const firstAvailable = Array.from(select.options).find(opt => !opt.disabled && opt.value !== '');
-                            if (firstAvailable) {
-                                select.value = firstAvailable.value;
-                                console.log(`Switched dropdown ${index} from ${currentValue} to ${firstAvailable.value}`);
-                            }
-                        }
-                    } else if (currentValue === '') {
-                        // If placeholder is selected, auto-select first available
-                        const firstAvailable = Array.from(select.options).find(opt => !opt.disabled && opt.value !== '');
-                        if (firstAvailable) {
-                            select.value = firstAvailable.value;
-                            console.log(`Auto-selected ${firstAvailable.value} in dropdown ${index}`);
-                        }
+            // Read phase: work out every dropdown's disabled options and value first...
+            const plan = rows.filter(row => row.select).map(({ index, select }) => {
+                const options = select.options;
+                // Disable if it's in an active logger or selected in a DIFFERENT dropdown
+                const disabled = new Set();
+                let firstAvailable = '';
+                for (let i = 0, n = options.length; i < n; i++) {
+                    const value = options[i].value;
+                    if (value === '') continue;
+                    const owner = valueOwner.get(value);
+                    if (selected.has(value) || (owner !== undefined && owner !== index)) {
+                        disabled.add(value);
+                    } else if (firstAvailable === '') {
+                        firstAvailable = value;
                     }
                 }
+                
+                // Keep the current choice if still allowed; otherwise (or on the
+                // placeholder) pick the first available service
+                const current = select.value;
+                let value = current;
+                if ((value === '' || disabled.has(value)) && firstAvailable !== '') value = firstAvailable;
+                return { select, options, disabled, current, value };
+            });
+            
+            // ...then write phase, so no DOM read follows a DOM write
+            plan.forEach(({ select, options, disabled, current, value }) => {
+                for (let i = 0, n = options.length; i < n; i++) {
+                    options[i].disabled = disabled.has(options[i].value);
+                }
+                if (value !== current) select.value = value;
             });
         }
         
         function getAllLoggers() {
             const loggers = [];
-            const entries = document.querySelectorAll('.logger-entry');
-            entries.forEach((entry, idx) => {
-                const index = entry.getAttribute('data-logger-index');
-                const service = document.getElementById(`service_${index}`).value;
-                const location = document.getElementById(`location_${index}`).value.trim();
+            loggerRows().forEach(row => {
+                const service = row.select.value;
+                const location = row.location.value.trim();
                 // Only include if a service is actually selected (not the placeholder)
                 if (service && service !== '') {
-                    loggers.push({ service, location, index });
+                    loggers.push({ service, location, index: row.index });
                 }
             });
             return loggers;
         }
         
+        // A newer load aborts the one in flight so a stale response can't repaint the list
+        let activeLocationsCtl = null;
+        
         async function loadActiveLocations() {
             // Load active event and show in status area
+            if (activeLocationsCtl) activeLocationsCtl.abort();
+            const ctl = activeLocationsCtl = new AbortController();
             try {
-                const resp = await fetch('/api/status');
+                const resp = await fetch('/api/status', { signal: ctl.signal });
                 const data = await resp.json();
                 
                 const activeEvents = data.active_events || [];
@@ -5786,7 +6826,7 @@ WEB_UI_HTML = """
                 
                 // Get event_id from first active event
                 const currentEventId = activeEvents[0].event_id;
-                document.getElementById('eventId').value = currentEventId;
+                $.eventId.value = currentEventId;
                 
                 // Get all loggers for this event
                 const loggers = activeEvents.filter(e => e.event_id === currentEventId);
@@ -5802,83 +6842,88 @@ WEB_UI_HTML = """
                 // Load notes for this event
                 loadNotes();
                 
-                // Call updateServiceOptions after a small delay to ensure DOM is ready
-                setTimeout(() => updateServiceOptions(), 50);
+                updateServiceOptions();
             } catch (e) {
-                console.log('No active event:', e);
+                if (e.name === 'AbortError') return;
+                dlog('No active event:', e);
                 updateUIForNoEvent();
+            } finally {
+                if (activeLocationsCtl === ctl) activeLocationsCtl = null;
             }
         }
         
+        // Rendered active logger rows keyed by system_id: { row, locationEl, location }
+        const activeLoggerNodes = new Map();
+        
+        function buildActiveLoggerRow(systemId) {
+            const row = document.createElement('div');
+            row.className = 'active-logger-item';
+            row.innerHTML = `
+                <div class="active-logger-info">
+                    <div class="active-logger-label"></div>
+                    <div class="active-logger-location"></div>
+                </div>
+                <button class="btn-remove-logger">Remove</button>
+            `;
+            row.querySelector('.active-logger-label').textContent = systemId;
+            row.querySelector('.btn-remove-logger').dataset.systemId = systemId;
+            return { row, locationEl: row.querySelector('.active-logger-location'), location: null };
+        }
+        
         function displayActiveLoggers(eventId, loggers) {
-            const statusBox = document.getElementById('statusBox');
-            const container = document.getElementById('activeLoggersContainer');
+            if ($.statusEventId.textContent !== eventId) $.statusEventId.textContent = eventId;
             
-            document.getElementById('statusEventId').textContent = eventId;
-            
-            container.innerHTML = '';
-            loggers.forEach(logger => {
-                const div = document.createElement('div');
-                div.className = 'active-logger-item';
-                div.innerHTML = `
-                    <div class=\"active-logger-info\">
-                        <div class=\"active-logger-label\">${logger.system_id}</div>
-                        <div class="active-logger-location">Location: ${logger.location || 'No location set'}</div>
-                    </div>
-                    <button class=\"btn-remove-logger\" onclick=\"removeActiveLogger('${logger.system_id}')\">Remove</button>
-                `;
-                container.appendChild(div);
-            });
+            // Reconcile against the rendered rows so a steady poll writes nothing
+            const incoming = new Map(loggers.map(l => [l.system_id, l.location || 'No location set']));
+            let servicesChanged = false;
+            for (const [systemId, node] of activeLoggerNodes) {
+                if (incoming.has(systemId)) continue;
+                node.row.remove();
+                activeLoggerNodes.delete(systemId);
+                activeServices.delete(systemId);
+                servicesChanged = true;
+            }
+            const added = document.createDocumentFragment();
+            for (const [systemId, location] of incoming) {
+                let node = activeLoggerNodes.get(systemId);
+                if (!node) {
+                    node = buildActiveLoggerRow(systemId);
+                    activeLoggerNodes.set(systemId, node);
+                    activeServices.add(systemId);
+                    added.appendChild(node.row);
+                    servicesChanged = true;
+                }
+                if (node.location !== location) {
+                    node.locationEl.textContent = `Location: ${location}`;
+                    node.location = location;
+                }
+            }
+            if (added.hasChildNodes()) $.activeLoggersContainer.appendChild(added);
             
-            statusBox.style.display = 'block';
+            $.statusBox.classList.remove('hidden');
             
-            // Call updateServiceOptions after DOM update to disable active services
-            setTimeout(() => {
-                console.log('displayActiveLoggers: calling updateServiceOptions');
+            // Disable active services in the form and list them in the note selector
+            if (servicesChanged) {
                 updateServiceOptions();
-                updateNoteServiceOptions(); // Update note service selector
-            }, 10);
+                updateNoteServiceOptions();
+            }
         }
         
         function clearLoggerForm() {
-            // Reset form to single empty logger entry
-            const container = document.getElementById('loggersContainer');
-            container.innerHTML = `
-                <div class=\"logger-entry\" data-logger-index=\"0\">
-                    <div class=\"form-group\">
-                        <label for=\"service_0\">Service</label>
-                        <select id=\"service_0\" name=\"service_0\">
-                            <option value=\"\">-- Select Service --</option>
-                            <option value=\"Pro6005-2\">Pro6005-2</option>
-                            <option value=\"Logger 0\">Logger 0</option>
-                            <option value=\"Logger 1\">Logger 1</option>
-                            <option value=\"Logger 2\">Logger 2</option>
-                            <option value=\"Logger 3\">Logger 3</option>
-                            <option value=\"Logger 4\">Logger 4</option>
-                            <option value=\"Logger 5\">Logger 5</option>
-                            <option value=\"Logger 6\">Logger 6</option>
-                            <option value=\"Logger 7\">Logger 7</option>
-                            <option value=\"Logger 8\">Logger 8</option>
-                            <option value=\"Logger 9\">Logger 9</option>
-                        </select>
-                    </div>
-                    <div class=\"form-group\">
-                        <label for=\"location_0\">Location (optional)</label>
-                        <input type=\"text\" id=\"location_0\" name=\"location_0\" placeholder=\"e.g., bay_3, north_yard\" list=\"locationList_0\">
-                        <datalist id=\"locationList_0\"></datalist>
-                    </div>
-                </div>
-            `;
-            
-            // Re-add listener but PREVENT it from firing during programmatic changes
-            const select = document.getElementById('service_0');
-            select.addEventListener('change', (e) => {
-                // Only call updateServiceOptions if this was a user-initiated change
-                if (e.isTrusted) {
-                    updateServiceOptions();
+            // Reset form to a single empty logger entry, reusing the first row
+            while (loggerEntries.length > 1) loggerEntries[loggerEntries.length - 1].remove();
+            const [first] = loggerRows();
+            if (!first) {
+                $.loggersContainer.appendChild(buildLoggerEntry(0, false));
+            } else {
+                for (const option of first.select.options) option.disabled = false;
+                // The server-rendered row has no placeholder; a cleared form shows one
+                if (first.select.options[0]?.value !== '') {
+                    first.select.add(new Option('-- Select Service --', ''), 0);
                 }
-            });
-            
+                first.select.selectedIndex = 0;
+                first.location.value = '';
+            }
             loggerCount = 1;
         }
         
@@ -5887,37 +6932,48 @@ WEB_UI_HTML = """
             
             try {
                 await apiCall('/api/location/clear', { system_id: systemId });
+                activeServices.delete(systemId);
                 showStatus(`Removed ${systemId}`, false);
-                await loadActiveLocations();  // Refresh display
-                loadStatus();
+                refreshAfterChange(loadActiveLocations);
             } catch (e) {
                 showStatus('Error: ' + e.message, true);
             }
         }
         
         function updateUIForActiveEvent() {
-            document.querySelector('.btn-start').textContent = '+ ADD LOGGER';
-            document.querySelector('.btn-start').onclick = addLoggerToEvent;
-            document.querySelector('.btn-end').style.display = 'inline-block';
+            $.btnStart.textContent = '+ ADD LOGGER';
+            $.btnStart.onclick = addLoggerToEvent;
+            $.btnEnd.classList.remove('hidden');
             
             // Hide event ID field and label
-            const eventIdGroup = document.getElementById('eventId').closest('.form-group');
-            if (eventIdGroup) eventIdGroup.style.display = 'none';
+            $.eventIdGroup.classList.add('hidden');
         }
         
         function updateUIForNoEvent() {
-            document.querySelector('.btn-start').textContent = 'START EVENT';
-            document.querySelector('.btn-start').onclick = startEvent;
-            document.querySelector('.btn-end').style.display = 'none';
-            document.getElementById('statusBox').style.display = 'none';
+            $.btnStart.textContent = 'START EVENT';
+            $.btnStart.onclick = startEvent;
+            $.btnEnd.classList.add('hidden');
+            $.statusBox.classList.add('hidden');
+            $.activeLoggersContainer.replaceChildren();
+            activeLoggerNodes.clear();
+            activeServices.clear();
             
             // Show event ID field
-            const eventIdGroup = document.getElementById('eventId').closest('.form-group');
-            if (eventIdGroup) eventIdGroup.style.display = 'block';
+            $.eventIdGroup.classList.remove('hidden');
             
             clearLoggerForm();
         }
         
+        // A body can only be read once, so read it as text and parse from there
+        async function parseError(resp, fallback = 'Request failed') {
+            const text = await resp.text();
+            try {
+                return JSON.parse(text).error || text || resp.statusText || fallback;
+            } catch (jsonErr) {
+                return text || resp.statusText || fallback;
+            }
+        }
+        
         async function apiCall(endpoint, data) {
             try {
                 const resp = await fetch(endpoint, {
@@ -5943,74 +6999,141 @@ WEB_UI_HTML = """
                 throw e;
             }
         }
+        
+        // Post one payload per logger concurrently; resolves to "system: error" for each failure
+        async function apiCallAll(endpoint, payloads) {
+            const results = await Promise.allSettled(payloads.map(data => apiCall(endpoint, data)));
+            return results
+                .map((r, i) => r.status === 'rejected' ? `${payloads[i].system_id}: ${r.reason.message}` : null)
+                .filter(Boolean);
+        }
+        
+        // Fire follow-up refreshes together; the caller's status message never waits on them
+        function refreshAfterChange(...loaders) {
+            Promise.all(loaders.map(load => load())).catch(e => console.warn('Refresh failed:', e));
+        }
 
+        // Summary values arrive as JSON numbers or null; one typeof check covers
+        // null/undefined and `value !== value` catches NaN
         function formatPercent(value) {
-            if (value === null || value === undefined || Number.isNaN(value)) return '--';
-            return `${Number(value).toFixed(1)}%`;
+            if (typeof value !== 'number' || value !== value) return '--';
+            return `${value.toFixed(1)}%`;
         }
 
         function formatPower(value) {
-            if (value === null || value === undefined || Number.isNaN(value)) return '--';
-            const num = Number(value);
-            const abs = Math.abs(num);
+            if (typeof value !== 'number' || value !== value) return '--';
+            const abs = value < 0 ? -value : value;
             if (abs >= 1000) {
-                return `${(num / 1000).toFixed(2)} kW`;
+                return `${(value / 1000).toFixed(2)} kW`;
             }
-            return `${num.toFixed(0)} W`;
+            return `${Math.round(value)} W`;
         }
 
+        // One reusable formatter (same fields as toLocaleString) and a memo of the
+        // strings it produced; notes and images re-render the same timestamps
+        const timestampFormat = new Intl.DateTimeFormat(undefined, {
+            year: 'numeric', month: 'numeric', day: 'numeric',
+            hour: 'numeric', minute: 'numeric', second: 'numeric'
+        });
+        const formattedTimestamps = new Map();
+
         function formatTimestampNs(tsNs) {
             if (!tsNs) return '-';
-            const date = new Date(tsNs / 1000000);
-            return date.toLocaleString();
+            let text = formattedTimestamps.get(tsNs);
+            if (text === undefined) {
+                if (formattedTimestamps.size >= 500) formattedTimestamps.clear();
+                text = timestampFormat.format(new Date(tsNs / 1000000));
+                formattedTimestamps.set(tsNs, text);
+            }
+            return text;
         }
 
-        function updateAlerts(alerts) {
-            const el = document.getElementById('summary_alerts');
-            const card = el ? el.closest('.summary-item') : null;
-            if (card) card.classList.remove('alert-bad');
-            if (!alerts || alerts.length === 0) {
-                el.textContent = 'None';
-                el.title = '';
-                return;
+        // Batched, diffed text writes: unchanged values are skipped and the rest
+        // land together in the next animation frame
+        const _lastVals = {};
+        let _pendingText = {};
+        let _textFrame = 0;
+
+        function setText(id, value) {
+            if (_lastVals[id] === value) return;
+            _lastVals[id] = value;
+            _pendingText[id] = value;
+            if (!_textFrame) _textFrame = requestAnimationFrame(flushText);
+        }
+
+        function flushText() {
+            const pending = _pendingText;
+            _pendingText = {};
+            _textFrame = 0;
+            for (const id in pending) {
+                const el = $[id] || document.getElementById(id);
+                if (el) el.textContent = pending[id];
             }
-            if (card) card.classList.add('alert-bad');
-            const list = alerts.join(', ');
-            el.title = list;
-            el.textContent = alerts.length <= 2 ? list : `${alerts.length} active`;
         }
 
+        function updateAlerts(alerts) {
+            const el = $.summary_alerts;
+            if (!el) return;
+            const card = el.closest('.summary-item');
+            const hasAlerts = Boolean(alerts && alerts.length);
+            if (card) card.classList.toggle('alert-bad', hasAlerts);
+            const list = hasAlerts ? alerts.join(', ') : '';
+            if (el.title !== list) el.title = list;
+            setText('summary_alerts', !hasAlerts ? 'None' : (alerts.length <= 2 ? list : `${alerts.length} active`));
+        }
+
+        let socLevel = '';
+
         function updateSocIndicator(value) {
-            const socEl = document.getElementById('summary_soc');
+            const socEl = $.summary_soc;
             if (!socEl) return;
             const card = socEl.closest('.summary-item');
             if (!card) return;
-            card.classList.remove('soc-good', 'soc-warn', 'soc-bad');
 
-            if (value === null || value === undefined || Number.isNaN(value)) {
-                return;
+            let level = '';
+            if (value !== null && value !== undefined && !Number.isNaN(value)) {
+                const soc = Number(value);
+                level = soc >= 40 ? 'soc-good' : (soc >= 25 ? 'soc-warn' : 'soc-bad');
             }
-
-            const soc = Number(value);
-            if (soc >= 40) {
-                card.classList.add('soc-good');
-            } else if (soc >= 25) {
-                card.classList.add('soc-warn');
+            if (level === socLevel) return;
+            if (socLevel && level) {
+                card.classList.replace(socLevel, level);
+            } else if (socLevel) {
+                card.classList.remove(socLevel);
             } else {
-                card.classList.add('soc-bad');
+                card.classList.add(level);
             }
+            socLevel = level;
+        }
+
+        // Fast and slow polls share one request; a result stays fresh for 500ms
+        let summaryInFlight = null;
+        let summaryCache = null;
+        function fetchSummary() {
+            if (summaryCache && performance.now() - summaryCache.at < 500) {
+                return Promise.resolve(summaryCache.data);
+            }
+            if (summaryInFlight) return summaryInFlight;
+            summaryInFlight = fetch('/api/summary', { cache: 'no-store' })
+                .then(resp => {
+                    if (!resp.ok) throw new Error('Failed to load summary');
+                    return resp.json();
+                })
+                .then(data => {
+                    summaryCache = { data, at: performance.now() };
+                    return data;
+                })
+                .finally(() => { summaryInFlight = null; });
+            return summaryInFlight;
         }
 
         async function loadSummary() {
             try {
-            const resp = await fetch('/api/summary', { cache: 'no-store' });
-                if (!resp.ok) throw new Error('Failed to load summary');
-                const data = await resp.json();
-
-                document.getElementById('summary_soc').textContent = formatPercent(data.soc);
+                const data = await fetchSummary();
+                setText('summary_soc', formatPercent(data.soc));
                 updateSocIndicator(data.soc);
-                document.getElementById('summary_pin').textContent = formatPower(data.pin);
-                document.getElementById('summary_pout').textContent = formatPower(data.pout);
+                setText('summary_pin', formatPower(data.pin));
+                setText('summary_pout', formatPower(data.pout));
                 updateAlerts(data.alerts || []);
             } catch (e) {
                 console.warn('Failed to load summary:', e);
@@ -6020,12 +7143,9 @@ WEB_UI_HTML = """
         async function loadSummaryFast() {
             // Fast update: Pin, Pout, Alerts only
             try {
-            const resp = await fetch('/api/summary', { cache: 'no-store' });
-                if (!resp.ok) throw new Error('Failed to load summary');
-                const data = await resp.json();
-
-                document.getElementById('summary_pin').textContent = formatPower(data.pin);
-                document.getElementById('summary_pout').textContent = formatPower(data.pout);
+                const data = await fetchSummary();
+                setText('summary_pin', formatPower(data.pin));
+                setText('summary_pout', formatPower(data.pout));
                 updateAlerts(data.alerts || []);
             } catch (e) {
                 console.warn('Failed to load summary:', e);
@@ -6035,21 +7155,132 @@ WEB_UI_HTML = """
         async function loadSummarySlow() {
             // Slow update: SOC only
             try {
-            const resp = await fetch('/api/summary', { cache: 'no-store' });
-                if (!resp.ok) throw new Error('Failed to load summary');
-                const data = await resp.json();
-
-                document.getElementById('summary_soc').textContent = formatPercent(data.soc);
+                const data = await fetchSummary();
+                setText('summary_soc', formatPercent(data.soc));
                 updateSocIndicator(data.soc);
             } catch (e) {
                 console.warn('Failed to load summary:', e);
             }
         }
 
+        function applySummary(data) {
+            // Stream frames only carry changed fields
+            if ('soc' in data) {
+                setText('summary_soc', formatPercent(data.soc));
+                updateSocIndicator(data.soc);
+            }
+            if ('pin' in data) setText('summary_pin', formatPower(data.pin));
+            if ('pout' in data) setText('summary_pout', formatPower(data.pout));
+            if ('alerts' in data) updateAlerts(data.alerts || []);
+        }
+
+        // One frame-driven loop for both polls. rAF doesn't run in background
+        // tabs, and the visibility check covers tabs that are open but hidden.
+        let summaryPolling = false;
+        function startSummaryPolling() {
+            if (summaryPolling) return;
+            summaryPolling = true;
+            let lastFast = 0;
+            let lastSlow = 0;
+            function tick(now) {
+                if (document.visibilityState === 'visible') {
+                    if (now - lastFast >= 1000) {  // Pin, Pout, Alerts every 1 second
+                        lastFast = now;
+                        loadSummaryFast();
+                    }
+                    if (now - lastSlow >= 10000) {  // SOC every 10 seconds
+                        lastSlow = now;
+                        loadSummarySlow();
+                    }
+                }
+                requestAnimationFrame(tick);
+            }
+            requestAnimationFrame(tick);
+            document.addEventListener('visibilitychange', () => {
+                if (!document.hidden) loadSummary();
+            });
+        }
+
+        function startSummaryUpdates() {
+            if (typeof EventSource === 'undefined') {
+                startSummaryPolling();
+                return;
+            }
+            let es = null;
+            let streamErrors = 0;
+            function openStream() {
+                // A fresh connection starts with the full summary, so nothing is missed
+                es = new EventSource('/api/stream');
+                es.addEventListener('summary', (e) => {
+                    streamErrors = 0;
+                    applySummary(JSON.parse(e.data));
+                });
+                es.onerror = () => {
+                    // EventSource retries by itself; give up only if it keeps failing
+                    streamErrors += 1;
+                    if (es.readyState === EventSource.CLOSED || streamErrors >= 5) {
+                        es.close();
+                        es = null;
+                        document.removeEventListener('visibilitychange', onVisibilityChange);
+                        startSummaryPolling();
+                    }
+                };
+            }
+            // Hidden tabs drop the stream; the server stops querying once nobody listens
+            function onVisibilityChange() {
+                if (document.hidden) {
+                    if (es) es.close();
+                    es = null;
+                } else if (!es) {
+                    openStream();
+                }
+            }
+            document.addEventListener('visibilitychange', onVisibilityChange);
+            if (!document.hidden) openStream();
+        }
+        
+        // Call fn now and every ms while the page is visible. A hidden tab makes no
+        // requests and catches up as soon as it is shown again.
+        function pollWhileVisible(fn, ms) {
+            let timer = 0;
+            function tick() {
+                clearTimeout(timer);
+                timer = 0;
+                if (document.visibilityState !== 'visible') return;
+                fn();
+                timer = setTimeout(tick, ms);
+            }
+            document.addEventListener('visibilitychange', tick);
+            tick();
+        }
+
+        function loadLeaflet() {
+            // Stylesheet and script load in parallel; the stylesheet must be in
+            // place before the first marker so Leaflet can find its icon path.
+            if (leafletLoading) return leafletLoading;
+            const load = (el) => new Promise((resolve, reject) => {
+                el.integrity = el.tagName === 'LINK' ? LEAFLET_ASSETS.cssIntegrity : LEAFLET_ASSETS.jsIntegrity;
+                el.crossOrigin = '';
+                el.onload = resolve;
+                el.onerror = reject;
+                document.head.appendChild(el);
+            });
+            const link = document.createElement('link');
+            link.rel = 'stylesheet';
+            link.href = LEAFLET_ASSETS.css;
+            const script = document.createElement('script');
+            script.src = LEAFLET_ASSETS.js;
+            leafletLoading = Promise.all([load(link), load(script)]).catch((err) => {
+                leafletLoading = null;
+                throw err;
+            });
+            return leafletLoading;
+        }
+
         function initMap() {
             if (mapInitialized) return;
             if (typeof L === 'undefined') {
-                document.getElementById('mapNote').textContent = 'Map library failed to load.';
+                $.mapNote.textContent = 'Map library failed to load.';
                 return;
             }
             mapInstance = L.map('map', { zoomControl: true });
@@ -6073,14 +7304,18 @@ WEB_UI_HTML = """
         }
 
         function updateMapLink(lat, lon) {
-            const link = document.getElementById('mapLink');
+            const link = $.mapLink;
             link.href = `https://www.google.com/maps/dir/?api=1&destination=${lat},${lon}`;
         }
 
+        let gpsCtl = null;
+        
         async function loadGps(refresh = false) {
+            if (gpsCtl) gpsCtl.abort();
+            const ctl = gpsCtl = new AbortController();
             try {
                 const url = refresh ? '/api/gx/gps?refresh=1' : '/api/gx/gps';
-                const resp = await fetch(url);
+                const resp = await fetch(url, { signal: ctl.signal });
                 const data = await resp.json();
                 if (!resp.ok || data.error) {
                     throw new Error(data.error || 'GPS not available');
@@ -6092,14 +7327,17 @@ WEB_UI_HTML = """
                     throw new Error('Invalid GPS coordinates');
                 }
                 lastGps = { latitude: lat, longitude: lon, updated_at: data.updated_at };
-                document.getElementById('mapCoords').textContent = `${lat.toFixed(6)}, ${lon.toFixed(6)}`;
-                document.getElementById('mapUpdated').textContent = formatTimestampNs(data.updated_at);
+                $.mapCoords.textContent = `${lat.toFixed(6)}, ${lon.toFixed(6)}`;
+                $.mapUpdated.textContent = formatTimestampNs(data.updated_at);
                 updateMapLink(lat, lon);
                 updateMapPin(lat, lon);
             } catch (e) {
-                document.getElementById('mapCoords').textContent = 'No GPS fix';
-                document.getElementById('mapUpdated').textContent = '-';
+                if (e.name === 'AbortError') return;
+                $.mapCoords.textContent = 'No GPS fix';
+                $.mapUpdated.textContent = '-';
                 console.warn('Failed to load GPS:', e);
+            } finally {
+                if (gpsCtl === ctl) gpsCtl = null;
             }
         }
 
@@ -6108,7 +7346,7 @@ WEB_UI_HTML = """
         }
         
         async function startEvent() {
-            const event_id = document.getElementById('eventId').value.trim();
+            const event_id = $.eventId.value.trim();
             const noteField = getVisibleField('noteDesktop', 'noteMobile');
             const note = noteField ? noteField.value.trim() : '';
             
@@ -6119,7 +7357,7 @@ WEB_UI_HTML = """
             
             // Get all loggers
             const loggers = getAllLoggers();
-            console.log('Starting event with loggers:', loggers);
+            dlog('Starting event with loggers:', loggers);
             
             if (loggers.length === 0) {
                 showStatus('At least one logger required', true);
@@ -6127,22 +7365,21 @@ WEB_UI_HTML = """
             }
             
             try {
-                // Start event with each logger
-                for (const logger of loggers) {
-                    console.log('Starting logger:', logger);
-                    await apiCall('/api/event/start', {
-                        system_id: logger.service,
-                        event_id,
-                        location: logger.location || '',
-                        note: note && logger === loggers[0] ? note : ''  // Only add note to first logger
-                    });
-                }
+                // Start every logger at once
+                const failures = await apiCallAll('/api/event/start', loggers.map((logger, i) => ({
+                    system_id: logger.service,
+                    event_id,
+                    location: logger.location || '',
+                    note: note && i === 0 ? note : ''  // Only add note to first logger
+                })));
                 
-                showStatus(`Event "${event_id}" started with ${loggers.length} logger(s)`, false);
-                resetNoteFields();  // Clear note field after use
-                await loadActiveLocations();  // Refresh UI
-                loadStatus();
-                refreshGps();
+                if (failures.length) {
+                    showStatus(`Failed to start ${failures.length} of ${loggers.length} logger(s): ${failures.join('; ')}`, true);
+                } else {
+                    showStatus(`Event "${event_id}" started with ${loggers.length} logger(s)`, false);
+                    resetNoteFields();  // Clear note field after use
+                }
+                refreshAfterChange(loadActiveLocations, refreshGps);
             } catch (e) {
                 console.error('Start event error:', e);
                 showStatus('Error: ' + e.message, true);
@@ -6151,117 +7388,73 @@ WEB_UI_HTML = """
         
         async function addLoggerToEvent() {
             // Add new loggers to existing event
-            const event_id = document.getElementById('eventId').value.trim();
+            const event_id = $.eventId.value.trim();
             const loggers = getAllLoggers();
             
             try {
-                for (const logger of loggers) {
-                    await apiCall('/api/event/start', {
-                        system_id: logger.service,
-                        event_id,
-                        location: logger.location || ''
-                    });
-                }
+                const failures = await apiCallAll('/api/event/start', loggers.map(logger => ({
+                    system_id: logger.service,
+                    event_id,
+                    location: logger.location || ''
+                })));
                 
-                showStatus(`${loggers.length} logger(s) added to event "${event_id}"`, false);
-                await loadActiveLocations();
-                loadStatus();
+                if (failures.length) {
+                    showStatus(`Failed to add ${failures.length} of ${loggers.length} logger(s): ${failures.join('; ')}`, true);
+                } else {
+                    showStatus(`${loggers.length} logger(s) added to event "${event_id}"`, false);
+                }
+                refreshAfterChange(loadActiveLocations);
             } catch (e) {
                 showStatus('Error: ' + e.message, true);
             }
         }
         
         async function endAllLoggers() {
-            const event_id = document.getElementById('eventId').value.trim();
+            const event_id = $.eventId.value.trim();
             
             if (!event_id) {
                 showStatus('Event ID not found', true);
                 return;
             }
             
-            console.log(`Ending event: "${event_id}"`);
+            dlog(`Ending event: "${event_id}"`);
             
             if (!confirm(`End ALL loggers for event "${event_id}"?`)) return;
             
             try {
                 const result = await apiCall('/api/event/end_all', { event_id });
-                console.log('End all result:', result);
+                dlog('End all result:', result);
                 
-                // Create custom success message with report button
+                // Success message with report button: the modal is in the markup, just fill and show it
                 const reportLink = result.report_url;
                 if (reportLink) {
-                    const modal = document.createElement('div');
-                    modal.id = 'statusModal';
-                    modal.style.cssText = 'position: fixed; top: 0; left: 0; width: 100%; height: 100%; background: rgba(0,0,0,0.7); z-index: 2000; display: flex; align-items: center; justify-content: center; padding: 20px;';
-                    
-                    const msgBox = document.createElement('div');
-                    msgBox.style.cssText = `
-                        background: linear-gradient(135deg, #10b981 0%, #059669 100%);
-                        color: white;
-                        padding: 30px 40px;
-                        border-radius: 12px;
-                        font-size: 18px;
-                        font-weight: 600;
-                        text-align: center;
-                        box-shadow: 0 10px 40px rgba(0,0,0,0.5);
-                        max-width: 90%;
-                    `;
-                    
-                    const message = document.createElement('div');
-                    message.textContent = `Event "${event_id}" ended (${result.loggers_ended} loggers)`;
-                    message.style.marginBottom = '20px';
-                    
-                    const reportBtn = document.createElement('button');
-                    reportBtn.className = 'btn btn-primary';
-                    reportBtn.textContent = 'View Report';
-                    reportBtn.style.cssText = 'background: white; color: #059669; padding: 12px 24px; border: none; border-radius: 8px; font-size: 16px; font-weight: 600; cursor: pointer; margin-top: 10px;';
-                    reportBtn.onclick = (e) => {
-                        e.stopPropagation();
-                        window.open(reportLink, '_blank');
-                    };
-                    
-                    msgBox.appendChild(message);
-                    msgBox.appendChild(reportBtn);
-                    modal.appendChild(msgBox);
-                    document.body.appendChild(modal);
-                    
-                    // Dismiss on click (but not on button click)
-                    modal.onclick = () => {
-                        modal.style.opacity = '0';
-                        modal.style.transition = 'opacity 0.3s';
-                        setTimeout(() => modal.remove(), 300);
-                    };
+                    $.endEventMsg.textContent = `Event "${event_id}" ended (${result.loggers_ended} loggers)`;
+                    $.endEventReportBtn.dataset.href = reportLink;
+                    $.endEventModal.classList.remove('hidden', 'fading');
                 } else {
                     showStatus(`Event "${event_id}" ended (${result.loggers_ended} loggers)`, false);
                 }
                 
                 // Clear form
-                document.getElementById('eventId').value = '';
+                $.eventId.value = '';
                 document.getElementById('location_0').value = '';
                 resetNoteFields();
                 
-                // Remove extra loggers from UI
-                const container = document.getElementById('loggersContainer');
-                const entries = container.querySelectorAll('.logger-entry');
-                for (let i = 1; i < entries.length; i++) entries[i].remove();
-                loggerCount = 1;
-                
+                // updateUIForNoEvent resets the form to a single logger entry
                 updateUIForNoEvent();
-                loadStatus();
             } catch (e) {
                 showStatus('Error: ' + e.message, true);
             }
         }
         
         async function endEvent() {
-            const event_id = document.getElementById('eventId').value.trim();
+            const event_id = $.eventId.value.trim();
             
             try {
                 const result = await apiCall('/api/event/end', {
                     event_id: event_id || undefined
                 });
                 showStatus('Event ended', false);
-                loadStatus();
                 updateNoteServiceOptions(); // Clear service dropdown when event ends
             } catch (e) {
                 showStatus('Error: ' + e.message, true);
@@ -6270,101 +7463,111 @@ WEB_UI_HTML = """
         
         async function setLocation() {
             // Update locations for all loggers
-            const loggers = getAllLoggers();
-            let successCount = 0;
+            const payloads = getAllLoggers()
+                .filter(logger => logger.location)
+                .map(logger => ({ system_id: logger.service, location: logger.location }));
             
             try {
-                for (const logger of loggers) {
-                    if (logger.location) {
-                        await apiCall('/api/location/set', { 
-                            system_id: logger.service,
-                            location: logger.location 
-                        });
-                        successCount++;
-                    }
-                }
+                const failures = await apiCallAll('/api/location/set', payloads);
+                const successCount = payloads.length - failures.length;
                 
-                if (successCount > 0) {
+                if (failures.length) {
+                    showStatus(`Failed to set ${failures.length} location(s): ${failures.join('; ')}`, true);
+                } else if (successCount > 0) {
                     showStatus(`${successCount} location(s) set`, false);
                 } else {
                     showStatus('No locations to set', true);
                 }
-                loadStatus();
+                refreshAfterChange(loadActiveLocations);
             } catch (e) {
                 showStatus('Error: ' + e.message, true);
             }
         }
         
+        // Same breakpoint the CSS uses, so no layout read (offsetParent) is needed
         function getVisibleField(desktopId, mobileId) {
-            const desktop = document.getElementById(desktopId);
-            if (desktop && desktop.offsetParent !== null) return desktop;
-            const mobile = document.getElementById(mobileId);
-            return mobile || desktop;
-        }
-
-        function syncNoteFields(source) {
-            const noteMobile = document.getElementById('noteMobile');
-            const noteDesktop = document.getElementById('noteDesktop');
-            const serviceMobile = document.getElementById('noteServiceMobile');
-            const serviceDesktop = document.getElementById('noteServiceDesktop');
-
-            if (source === 'mobile') {
-                if (noteMobile && noteDesktop) noteDesktop.value = noteMobile.value;
-                if (serviceMobile && serviceDesktop) serviceDesktop.value = serviceMobile.value;
-            } else if (source === 'desktop') {
-                if (noteDesktop && noteMobile) noteMobile.value = noteDesktop.value;
-                if (serviceDesktop && serviceMobile) serviceMobile.value = serviceDesktop.value;
-            }
+            return desktopLayout.matches ? $[desktopId] : $[mobileId];
+        }
+
+        // Run fn at most once per animation frame, however often it's requested
+        function perFrame(fn) {
+            let frame = 0;
+            return () => {
+                if (frame) return;
+                frame = requestAnimationFrame(() => {
+                    frame = 0;
+                    fn();
+                });
+            };
         }
+        
+        // The note entry exists twice, and CSS shows the desktop pair from 1024px up.
+        // Only the visible pair is typed into, so values are carried over once when
+        // the layout switches instead of being mirrored on every keystroke.
+        const desktopLayout = window.matchMedia('(min-width: 1024px)');
+        desktopLayout.addEventListener('change', (e) => {
+            const [from, to] = e.matches ? ['Mobile', 'Desktop'] : ['Desktop', 'Mobile'];
+            $['note' + to].value = $['note' + from].value;
+            $['noteService' + to].value = $['noteService' + from].value;
+        });
 
         function resetNoteFields() {
-            const noteMobile = document.getElementById('noteMobile');
-            const noteDesktop = document.getElementById('noteDesktop');
-            const serviceMobile = document.getElementById('noteServiceMobile');
-            const serviceDesktop = document.getElementById('noteServiceDesktop');
+            const noteMobile = $.noteMobile;
+            const noteDesktop = $.noteDesktop;
+            const serviceMobile = $.noteServiceMobile;
+            const serviceDesktop = $.noteServiceDesktop;
             if (noteMobile) noteMobile.value = '';
             if (noteDesktop) noteDesktop.value = '';
             if (serviceMobile) serviceMobile.value = '';
             if (serviceDesktop) serviceDesktop.value = '';
         }
 
+        // Services the note selectors were last built for; unchanged means nothing to do
+        let noteServicesKey = null;
+        
         function updateNoteServiceOptions() {
             const selects = [
-                document.getElementById('noteServiceMobile'),
-                document.getElementById('noteServiceDesktop')
+                $.noteServiceMobile,
+                $.noteServiceDesktop
             ].filter(Boolean);
             if (selects.length === 0) return;
             
-            const activeLoggers = document.querySelectorAll('.active-logger-label');
+            const key = Array.from(activeServices).join('|');
+            if (key === noteServicesKey) return;
+            noteServicesKey = key;
+            
+            // Build the option list once and give each select its own copy
+            const options = document.createDocumentFragment();
+            const general = document.createElement('option');
+            general.value = '';
+            general.textContent = 'General note (all loggers)';
+            options.appendChild(general);
+            activeServices.forEach(serviceName => {
+                const option = document.createElement('option');
+                option.value = serviceName;
+                option.textContent = serviceName;
+                options.appendChild(option);
+            });
             
             selects.forEach(select => {
                 const currentValue = select.value; // Preserve selection
-                select.innerHTML = '<option value="">General note (all loggers)</option>';
-                
-                // Add active loggers as options
-                activeLoggers.forEach(label => {
-                    const serviceName = label.textContent.trim();
-                    const option = document.createElement('option');
-                    option.value = serviceName;
-                    option.textContent = serviceName;
-                    select.appendChild(option);
-                });
+                select.replaceChildren(options.cloneNode(true));
                 
                 // Restore previous selection if still valid
-                if (currentValue && Array.from(select.options).some(opt => opt.value === currentValue)) {
+                if (currentValue && activeServices.has(currentValue)) {
                     select.value = currentValue;
                 }
             });
         }
         
         async function addNote() {
-            const event_id = document.getElementById('eventId').value.trim();
+            const event_id = $.eventId.value.trim();
             const noteField = getVisibleField('noteDesktop', 'noteMobile');
             const serviceField = getVisibleField('noteServiceDesktop', 'noteServiceMobile');
             let msg = noteField ? noteField.value.trim() : '';
             const selectedService = serviceField ? serviceField.value : '';
             
-            console.log('addNote called - event_id:', event_id, 'msg:', msg, 'service:', selectedService);
+            dlog('addNote called - event_id:', event_id, 'msg:', msg, 'service:', selectedService);
             
             if (!msg) {
                 showStatus('Note required', true);
@@ -6377,105 +7580,128 @@ WEB_UI_HTML = """
             }
             
             try {
-                console.log('Calling /api/note with:', { event_id: event_id || undefined, msg });
+                dlog('Calling /api/note with:', { event_id: event_id || undefined, msg });
                 const result = await apiCall('/api/note', {
                     event_id: event_id || undefined, msg
                 });
-                console.log('Note added successfully:', result);
+                dlog('Note added successfully:', result);
                 showStatus('Note added', false);
                 resetNoteFields();
-                loadNotes(); // Refresh notes display
-                loadStatus();
+                // The response carries the event's updated notes; refetch only if it's
+                // for a different event than the one on screen
+                if (result.notes && result.event_id === $.eventId.value.trim()) {
+                    if (notesCtl) notesCtl.abort();
+                    renderNotes(result.notes);
+                } else {
+                    loadNotes();
+                }
             } catch (e) {
                 console.error('addNote error:', e);
                 showStatus('Error: ' + e.message, true);
             }
         }
         
+        // Checkboxes of the rendered notes/images, captured at render time so the
+        // selection handlers never have to query the document
+        let noteCheckboxes = [];
+        let imageCheckboxes = [];
+        // Ids of the ticked image checkboxes, kept current by their change handler
+        const selectedImageIds = new Set();
+        
+        // Notes, images and the systems list are reloaded after every change;
+        // each newer load aborts the one in flight, like loadActiveLocations
+        let notesCtl = null;
+        let imagesCtl = null;
+        let allSystemsCtl = null;
+        
         async function loadNotes() {
-            const event_id = document.getElementById('eventId').value.trim();
+            if (notesCtl) notesCtl.abort();
+            const event_id = $.eventId.value.trim();
             if (!event_id) {
-                document.getElementById('notesSection').style.display = 'none';
+                renderNotes([]);
                 return;
             }
             
+            const ctl = notesCtl = new AbortController();
             try {
-                const resp = await fetch(`/api/notes?event_id=${encodeURIComponent(event_id)}&limit=50`);
+                const resp = await fetch(`/api/notes?event_id=${encodeURIComponent(event_id)}&limit=50`, { signal: ctl.signal });
                 const data = await resp.json();
-                
-                const notesList = document.getElementById('notesList');
-                const notesSection = document.getElementById('notesSection');
-                
-                if (!data.notes || data.notes.length === 0) {
-                    notesSection.style.display = 'none';
-                    return;
-                }
-                
-                notesSection.style.display = 'block';
-                
-                // Show/hide multi-select controls if more than one note
-                const showMultiSelect = data.notes.length > 1;
-                document.getElementById('notesListHeader').style.display = showMultiSelect ? 'block' : 'none';
-                document.getElementById('deleteSelectedBtn').style.display = showMultiSelect ? 'block' : 'none';
-                
-                notesList.innerHTML = data.notes.map((note, index) => {
-                    const date = new Date(note.timestamp / 1e6); // Convert from nanoseconds to milliseconds
-                    const dateStr = date.toLocaleString();
-                    const checkboxHtml = showMultiSelect ? `
-                        <input type="checkbox" class="note-checkbox" data-note-index="${index}" data-note-id="${note.id}" 
-                               data-system-id="${escapeHtml(note.system_id)}" 
-                               data-event-id="${escapeHtml(note.event_id)}"
-                               data-note-text="${escapeHtml(note.note)}"
-                               onchange="updateDeleteButton()"
-                               style="cursor: pointer; width: 18px; height: 18px; margin-right: 12px;">
-                    ` : '';
-                    return `
-                        <div style="background: #f0fdf4; padding: 12px; border-radius: 6px; margin-bottom: 10px; border: 1px solid #86efac; display: flex; justify-content: space-between; align-items: center;">
-                            ${checkboxHtml}
-                            <div style="flex: 1;">
-                                <div style="color: #059669; font-weight: 600; font-size: 12px; margin-bottom: 4px;">${escapeHtml(note.system_id)} - ${dateStr}</div>
-                                <div style="color: #374151; white-space: pre-wrap; word-wrap: break-word; line-height: 1.5;">${escapeHtml(note.note)}</div>
-                            </div>
-                            <button onclick="deleteNote(${note.id})" 
-                                    data-note-id="${note.id}" data-system-id="${escapeHtml(note.system_id)}" 
-                                    data-event-id="${escapeHtml(note.event_id)}"
-                                    data-note-text="${escapeHtml(note.note)}"
-                                    style="background: #ef4444; color: white; border: none; padding: 6px 12px; border-radius: 4px; cursor: pointer; font-size: 12px; margin-left: 10px; flex-shrink: 0;">
-                                Delete
-                            </button>
-                        </div>
-                    `;
-                }).join('');
+                renderNotes(data.notes || []);
             } catch (e) {
+                if (e.name === 'AbortError') return;
                 console.error('Failed to load notes:', e);
+            } finally {
+                if (notesCtl === ctl) notesCtl = null;
             }
         }
         
-        function toggleNotes() {
-            const container = document.getElementById('notesContainer');
-            const toggleText = document.getElementById('notesToggleText');
-            if (container.style.display === 'none') {
-                container.style.display = 'block';
-                toggleText.textContent = 'Hide Notes';
-            } else {
-                container.style.display = 'none';
-                toggleText.textContent = 'Show Notes';
+        // Row markup is parsed once; renderNotes deep-clones it per note
+        const noteRowTpl = document.getElementById('noteRowTpl').content.firstElementChild;
+        
+        function renderNotes(notes) {
+            const notesList = $.notesList;
+            const notesSection = $.notesSection;
+            
+            if (notes.length === 0) {
+                notesSection.classList.add('hidden');
+                noteCheckboxes = [];
+                return;
             }
+            
+            // Show multi-select controls only if there is more than one note
+            const showMultiSelect = notes.length > 1;
+            
+            // Build every row off-document first, each a clone of the parsed template...
+            const fragment = document.createDocumentFragment();
+            const checkboxes = [];
+            notes.forEach((note, index) => {
+                const row = noteRowTpl.cloneNode(true);
+                const [checkbox, info, deleteBtn] = row.children;
+                if (showMultiSelect) {
+                    checkbox.dataset.noteIndex = index;
+                    setNoteData(checkbox, note);
+                    checkboxes.push(checkbox);
+                } else {
+                    checkbox.remove();
+                }
+                info.firstElementChild.textContent = `${note.system_id ?? ''} - ${formatTimestampNs(note.timestamp)}`;
+                info.lastElementChild.textContent = note.note ?? '';
+                setNoteData(deleteBtn, note);
+                fragment.appendChild(row);
+            });
+            
+            // ...then make every page write back to back, with no reads in between
+            $.notesListHeader.classList.toggle('hidden', !showMultiSelect);
+            $.deleteSelectedBtn.classList.toggle('hidden', !showMultiSelect);
+            notesList.replaceChildren(fragment);
+            noteCheckboxes = checkboxes;
+            notesSection.classList.remove('hidden');
+        }
+        
+        // Attributes read back by deleteNote / deleteSelectedNotes
+        function setNoteData(el, note) {
+            el.dataset.noteId = note.id;
+            el.dataset.systemId = note.system_id ?? '';
+            el.dataset.eventId = note.event_id ?? '';
+            el.dataset.noteText = note.note ?? '';
+        }
+        
+        function toggleNotes() {
+            const container = $.notesContainer;
+            const toggleText = $.notesToggleText;
+            const hidden = container.classList.toggle('hidden');
+            toggleText.textContent = hidden ? 'Show Notes' : 'Hide Notes';
         }
         
-        async function deleteNote(noteId) {
+        async function deleteNote(button) {
             if (!confirm('Delete this note?')) return;
             
             try {
-                // Get data from button's data attributes
-                const button = event.target;
-                const system_id = button.getAttribute('data-system-id');
-                const event_id = button.getAttribute('data-event-id');
-                const note_id = button.getAttribute('data-note-id') || noteId;
-                const note_text = button.getAttribute('data-note-text');
+                // Everything needed is in the button's data attributes
+                const { systemId: system_id, eventId: event_id, noteId: note_id, noteText: note_text } = button.dataset;
                 
-                console.log('deleteNote - Raw values:', { system_id, event_id, note_id, note_text });
-                console.log('deleteNote - note_text length:', note_text ? note_text.length : 'null');
+                dlog('deleteNote - Raw values:', { system_id, event_id, note_id, note_text });
+                dlog('deleteNote - note_text length:', note_text ? note_text.length : 'null');
                 
                 if (!note_id && !note_text) {
                     console.error('note_id and note_text are empty!');
@@ -6491,7 +7717,7 @@ WEB_UI_HTML = """
                 if (note_text) {
                     requestBody.note_text = note_text;
                 }
-                console.log('Sending delete request:', requestBody);
+                dlog('Sending delete request:', requestBody);
                 
                 const resp = await fetch('/api/audit/delete', {
                     method: 'POST',
@@ -6501,7 +7727,7 @@ WEB_UI_HTML = """
                 
                 if (resp.ok) {
                     const result = await resp.json();
-                    console.log('Delete result:', result);
+                    dlog('Delete result:', result);
                     showStatus('Note deleted', false);
                     loadNotes();
                 } else {
@@ -6515,33 +7741,36 @@ WEB_UI_HTML = """
             }
         }
         
+        // One string pass, no throwaway DOM node; quotes are escaped too, so the
+        // result is safe inside attribute values
+        const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+        const HTML_ESCAPE_RE = /[&<>"']/g;
+        
         function escapeHtml(text) {
-            const div = document.createElement('div');
-            div.textContent = text;
-            return div.innerHTML;
+            return text == null ? '' : String(text).replace(HTML_ESCAPE_RE, c => HTML_ESCAPES[c]);
         }
         
         function toggleSelectAll() {
-            const selectAllCheckbox = document.getElementById('selectAllNotes');
-            const checkboxes = document.querySelectorAll('.note-checkbox');
-            checkboxes.forEach(cb => {
-                cb.checked = selectAllCheckbox.checked;
-            });
+            const checked = $.selectAllNotes.checked;
+            for (let i = 0; i < noteCheckboxes.length; i++) noteCheckboxes[i].checked = checked;
             updateDeleteButton();
         }
         
-        function updateDeleteButton() {
-            const checkboxes = document.querySelectorAll('.note-checkbox');
-            const anyChecked = Array.from(checkboxes).some(cb => cb.checked);
-            const deleteBtn = document.getElementById('deleteSelectedBtn');
+        // Coalesced: ticking several boxes in one frame updates the button once
+        const updateDeleteButton = perFrame(() => {
+            let anyChecked = false;
+            for (let i = 0; i < noteCheckboxes.length; i++) {
+                if (noteCheckboxes[i].checked) { anyChecked = true; break; }
+            }
+            const deleteBtn = $.deleteSelectedBtn;
             if (deleteBtn) {
                 deleteBtn.disabled = !anyChecked;
                 deleteBtn.style.opacity = anyChecked ? '1' : '0.5';
             }
-        }
+        });
         
         async function deleteSelectedNotes() {
-            const checkboxes = document.querySelectorAll('.note-checkbox:checked');
+            const checkboxes = noteCheckboxes.filter(cb => cb.checked);
             if (checkboxes.length === 0) {
                 showStatus('No notes selected', true);
                 return;
@@ -6552,39 +7781,34 @@ WEB_UI_HTML = """
                 return;
             }
             
+            // One request and one transaction for the whole selection
+            const items = checkboxes.map((checkbox) => {
+                const { systemId: system_id, eventId: event_id, noteId: note_id, noteText: note_text } = checkbox.dataset;
+                const item = { system_id, event_id };
+                if (note_id) {
+                    item.note_id = note_id;
+                }
+                if (note_text) {
+                    item.note_text = note_text;
+                }
+                return item;
+            });
+            
             let successCount = 0;
             let failCount = 0;
-            
-            for (const checkbox of checkboxes) {
-                try {
-                    const system_id = checkbox.getAttribute('data-system-id');
-                    const event_id = checkbox.getAttribute('data-event-id');
-                    const note_id = checkbox.getAttribute('data-note-id');
-                    const note_text = checkbox.getAttribute('data-note-text');
-                    
-                    const requestBody = { system_id, event_id };
-                    if (note_id) {
-                        requestBody.note_id = note_id;
-                    }
-                    if (note_text) {
-                        requestBody.note_text = note_text;
-                    }
-                    const resp = await fetch('/api/audit/delete', {
-                        method: 'POST',
-                        headers: { 'Content-Type': 'application/json' },
-                        body: JSON.stringify(requestBody)
-                    });
-                    
-                    if (resp.ok) {
-                        successCount++;
-                    } else {
-                        failCount++;
-                        console.error('Failed to delete note:', note_text);
-                    }
-                } catch (e) {
-                    failCount++;
-                    console.error('Delete error:', e);
-                }
+            try {
+                const resp = await fetch('/api/audit/delete_batch', {
+                    method: 'POST',
+                    headers: { 'Content-Type': 'application/json' },
+                    body: JSON.stringify({ items })
+                });
+                if (!resp.ok) throw new Error(await parseError(resp, 'Delete failed'));
+                const result = await resp.json();
+                failCount = result.missing_count || 0;
+                successCount = items.length - failCount;
+            } catch (e) {
+                console.error('Delete error:', e);
+                failCount = items.length;
             }
             
             if (successCount > 0) {
@@ -6596,68 +7820,127 @@ WEB_UI_HTML = """
             }
         }
         
-        async function loadStatus() {
-            // Status is now displayed in the active loggers area
-            // This function is kept for compatibility but does nothing
-        }
-        
-        // Load status on page load
-        loadStatus();
+        // Initial load
         loadSummary();
         loadGps(false);
         loadActiveLocations();
-        setInterval(loadSummaryFast, 1000);  // Update Pin, Pout, Alerts every 1 second
-        setInterval(loadSummarySlow, 10000); // Update SOC every 10 seconds
+        startSummaryUpdates();
+        
+        // Service dropdowns on every form row: only user changes re-run the exclusivity check
+        $.loggersContainer.addEventListener('change', (e) => {
+            if (e.isTrusted && e.target.tagName === 'SELECT') updateServiceOptions();
+        });
+        
+        // End-event modal: the report button opens the report, anywhere else dismisses
+        $.endEventReportBtn.addEventListener('click', (e) => {
+            e.stopPropagation();
+            window.open($.endEventReportBtn.dataset.href, '_blank');
+        });
+        $.endEventModal.addEventListener('click', () => {
+            $.endEventModal.classList.add('fading');
+            setTimeout(() => {
+                // Skip if it was reopened while fading out
+                if ($.endEventModal.classList.contains('fading')) $.endEventModal.classList.add('hidden');
+            }, 300);
+        });
+        
+        // In-page confirmation: unlike confirm(), it leaves the page running while open
+        let confirmResolve = null;
+        
+        function showConfirm(message) {
+            if (confirmResolve) confirmResolve(false);
+            $.confirmMsg.textContent = message;
+            $.confirmModal.classList.remove('hidden');
+            $.confirmOkBtn.focus();
+            return new Promise(resolve => { confirmResolve = resolve; });
+        }
+        
+        function closeConfirm(result) {
+            $.confirmModal.classList.add('hidden');
+            const resolve = confirmResolve;
+            confirmResolve = null;
+            if (resolve) resolve(result);
+        }
+        
+        $.confirmOkBtn.addEventListener('click', () => closeConfirm(true));
+        $.confirmCancelBtn.addEventListener('click', () => closeConfirm(false));
+        $.confirmModal.addEventListener('click', (e) => {
+            if (e.target === $.confirmModal) closeConfirm(false);
+        });
+        document.addEventListener('keydown', (e) => {
+            if (e.key === 'Escape' && confirmResolve) closeConfirm(false);
+        });
         
-        // Add change listener to primary service dropdown (only for user changes)
-        document.getElementById('service_0').addEventListener('change', (e) => {
-            if (e.isTrusted) updateServiceOptions();
+        // Note rows: one listener each for delete buttons and selection checkboxes
+        $.notesList.addEventListener('click', (e) => {
+            const btn = e.target.closest('.note-delete');
+            if (btn) deleteNote(btn);
+        });
+        $.notesList.addEventListener('change', (e) => {
+            if (e.target.classList.contains('note-checkbox')) updateDeleteButton();
+        });
+        
+        // Remove buttons on form rows and active loggers: one delegated listener each
+        $.loggersContainer.addEventListener('click', (e) => {
+            const btn = e.target.closest('.remove-logger');
+            if (btn) removeLogger(btn.dataset.idx);
+        });
+        $.activeLoggersContainer.addEventListener('click', (e) => {
+            const btn = e.target.closest('.btn-remove-logger');
+            if (btn) removeActiveLogger(btn.dataset.systemId);
         });
         
         // Load all systems for datalist
+        let allSystemsEtag = '';
+        let systemIdsKey = null;
+        let locationIdsKey = null;
+        
+        // Replaces the datalist's options; returns the key so unchanged lists are skipped
+        function fillDatalist(datalist, values, lastKey) {
+            const key = Array.from(values).join('|');
+            if (!datalist || key === lastKey) return lastKey;
+            const fragment = document.createDocumentFragment();
+            values.forEach(value => {
+                const option = document.createElement('option');
+                option.value = value;
+                fragment.appendChild(option);
+            });
+            datalist.replaceChildren(fragment);
+            return key;
+        }
+        
         async function loadAllSystems() {
+            if (allSystemsCtl) allSystemsCtl.abort();
+            const ctl = allSystemsCtl = new AbortController();
             try {
-                const resp = await fetch('/api/status');
+                const resp = await fetch('/api/status', {
+                    headers: allSystemsEtag ? { 'If-None-Match': allSystemsEtag } : {},
+                    signal: ctl.signal
+                });
+                if (resp.status === 304) return;
                 const data = await resp.json();
+                allSystemsEtag = resp.headers.get('ETag') || '';
                 
                 const systemIds = new Set();
-                if (data.active_events) {
-                    data.active_events.forEach(e => systemIds.add(e.system_id));
-                }
-                
-                const datalist = document.getElementById('systemIdList');
-                if (datalist) {
-                    datalist.innerHTML = '';
-                    systemIds.forEach(id => {
-                        const option = document.createElement('option');
-                        option.value = id;
-                        datalist.appendChild(option);
-                    });
-                }
-                
                 const locationIds = new Set();
                 if (data.active_events) {
                     data.active_events.forEach(e => {
+                        systemIds.add(e.system_id);
                         if (e.location) locationIds.add(e.location);
                     });
                 }
                 
-                const locationList = document.getElementById('locationList');
-                if (locationList) {
-                    locationList.innerHTML = '';
-                    locationIds.forEach(loc => {
-                        const option = document.createElement('option');
-                        option.value = loc;
-                        locationList.appendChild(option);
-                    });
-                }
+                systemIdsKey = fillDatalist($.systemIdList, systemIds, systemIdsKey);
+                locationIdsKey = fillDatalist($.locationList, locationIds, locationIdsKey);
             } catch (e) {
+                if (e.name === 'AbortError') return;
                 console.error('Failed to load systems:', e);
+            } finally {
+                if (allSystemsCtl === ctl) allSystemsCtl = null;
             }
         }
         
-        loadAllSystems();
-        setInterval(loadAllSystems, 30000);  // Refresh every 30s
+        pollWhileVisible(loadAllSystems, 30000);  // Refresh every 30s while visible
         
         // ========== Image Upload Functions ==========
         
@@ -6669,12 +7952,17 @@ WEB_UI_HTML = """
             
             selectedImageFile = file;
             
-            const reader = new FileReader();
-            reader.onload = function(e) {
-                document.getElementById('previewImg').src = e.target.result;
-                document.getElementById('imagePreview').style.display = 'block';
-            };
-            reader.readAsDataURL(file);
+            // Object URLs reference the file directly instead of base64-encoding it
+            const img = $.previewImg;
+            releaseImagePreview();
+            img.src = URL.createObjectURL(file);
+            $.imagePreview.classList.remove('hidden');
+        }
+
+        function releaseImagePreview() {
+            const img = $.previewImg;
+            if (img.src.startsWith('blob:')) URL.revokeObjectURL(img.src);
+            img.removeAttribute('src');
         }
         
         async function uploadImage() {
@@ -6683,9 +7971,9 @@ WEB_UI_HTML = """
                 return;
             }
             
-            const eventIdEl = document.getElementById('eventId');
+            const eventIdEl = $.eventId;
             const event_id = eventIdEl ? eventIdEl.value.trim() : '';
-            const caption = document.getElementById('imageCaption').value.trim();
+            const caption = $.imageCaption.value.trim();
             
             const formData = new FormData();
             formData.append('image', selectedImageFile);
@@ -6698,101 +7986,100 @@ WEB_UI_HTML = """
                     body: formData
                 });
                 
-                if (!resp.ok) {
-                    let errorMsg = 'Upload failed';
-                    try {
-                        const err = await resp.json();
-                        errorMsg = err.error || errorMsg;
-                    } catch (jsonErr) {
-                        errorMsg = await resp.text() || resp.statusText || errorMsg;
-                    }
-                    throw new Error(errorMsg);
-                }
+                if (!resp.ok) throw new Error(await parseError(resp, 'Upload failed'));
                 
                 const result = await resp.json();
-                showStatus(`Image uploaded (${(result.size / 1024).toFixed(1)}KB)`, false);
                 
-                document.getElementById('imageFile').value = '';
-                document.getElementById('imageCaption').value = '';
-                document.getElementById('imagePreview').style.display = 'none';
+                $.imageFile.value = '';
+                $.imageCaption.value = '';
+                $.imagePreview.classList.add('hidden');
+                releaseImagePreview();
                 selectedImageFile = null;
                 
-                if (document.getElementById('imageGallery').style.display !== 'none') {
-                    loadImages();
+                // A 202 only means the file arrived; report success once its row is listed
+                if (result.pending && !(await waitForImage(result.filename))) {
+                    showStatus('Image received but still processing. Check the gallery shortly; if it does not appear, upload it again.', true);
+                    return;
                 }
+                showStatus(`Image uploaded (${(result.size / 1024).toFixed(1)}KB)`, false);
+                if (!$.imageGallery.classList.contains('hidden')) loadImages();
             } catch (e) {
                 showStatus('Upload error: ' + e.message, true);
             }
         }
 
+        // Upload metadata is stored in the background; wait until the row is listed
+        async function waitForImage(filename, attempts = 10) {
+            for (let i = 0; i < attempts; i++) {
+                try {
+                    const resp = await fetch(`/api/images?filename=${encodeURIComponent(filename)}`);
+                    const data = await resp.json();
+                    if (data.images && data.images.length) return data.images[0];
+                } catch (e) {
+                    // Retry below
+                }
+                await new Promise(resolve => setTimeout(resolve, 200 * (i + 1)));
+            }
+            return null;
+        }
+
         async function updateImageCaption(imageId, caption) {
             const resp = await fetch(`/api/image/${imageId}/caption`, {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
                 body: JSON.stringify({ caption })
             });
-            if (!resp.ok) {
-                let errorMsg = 'Update failed';
-                try {
-                    const err = await resp.json();
-                    errorMsg = err.error || errorMsg;
-                } catch (jsonErr) {
-                    errorMsg = await resp.text() || resp.statusText || errorMsg;
-                }
-                throw new Error(errorMsg);
-            }
+            if (!resp.ok) throw new Error(await parseError(resp, 'Update failed'));
             return resp.json();
         }
         
         async function loadImages() {
+            if (imagesCtl) imagesCtl.abort();
+            const ctl = imagesCtl = new AbortController();
             try {
-                const resp = await fetch('/api/images?limit=50');
+                const resp = await fetch('/api/images?limit=50', { signal: ctl.signal });
                 const data = await resp.json();
                 
-                const gallery = document.getElementById('imageGallery');
-                const grid = document.getElementById('galleryGrid');
-                const listHeader = document.getElementById('imagesListHeader');
-                const deleteSelectedBtn = document.getElementById('deleteSelectedImagesBtn');
-                const selectAllImages = document.getElementById('selectAllImages');
+                const gallery = $.imageGallery;
+                const grid = $.galleryGrid;
+                const listHeader = $.imagesListHeader;
+                const deleteSelectedBtn = $.deleteSelectedImagesBtn;
+                const selectAllImages = $.selectAllImages;
                 
                 if (data.images.length === 0) {
-                    grid.innerHTML = '<p style="color: #ccc; grid-column: 1/-1;">No images uploaded yet</p>';
-                    if (listHeader) listHeader.style.display = 'none';
-                    if (deleteSelectedBtn) deleteSelectedBtn.style.display = 'none';
-                    gallery.style.display = 'block';
+                    grid.innerHTML = '<p class="gallery-empty">No images uploaded yet</p>';
+                    imageCheckboxes = [];
+                    selectedImageIds.clear();
+                    if (listHeader) listHeader.classList.add('hidden');
+                    if (deleteSelectedBtn) deleteSelectedBtn.classList.add('hidden');
+                    gallery.classList.remove('hidden');
                     return;
                 }
                 
                 const showMultiSelect = data.images.length > 1;
-                if (listHeader) listHeader.style.display = showMultiSelect ? 'block' : 'none';
-                if (deleteSelectedBtn) {
-                    deleteSelectedBtn.style.display = showMultiSelect ? 'block' : 'none';
-                    deleteSelectedBtn.disabled = true;
-                    deleteSelectedBtn.style.opacity = '0.5';
-                }
-                if (selectAllImages) selectAllImages.checked = false;
                 
-                grid.innerHTML = '';
+                // Build every tile off-document first...
+                const fragment = document.createDocumentFragment();
+                const checkboxes = [];
                 data.images.forEach(img => {
                     const div = document.createElement('div');
-                    div.style.cssText = 'background: rgba(255,255,255,0.1); border-radius: 8px; padding: 8px; position: relative; cursor: pointer;';
+                    div.className = 'gallery-card';
                     div.onclick = () => {
                         const modal = document.createElement('div');
-                        modal.style.cssText = 'position: fixed; top: 0; left: 0; width: 100%; height: 100%; background: rgba(0,0,0,0.9); z-index: 1000; display: flex; flex-direction: column; align-items: center; justify-content: center; padding: 20px;';
+                        modal.className = 'image-viewer';
                         modal.onclick = () => modal.remove();
                         
                         const imgEl = document.createElement('img');
                         imgEl.src = '/images/' + img.filename;
-                        imgEl.style.cssText = 'max-width: 90%; max-height: 70vh; border-radius: 8px;';
+                        imgEl.className = 'image-viewer-img';
                         
                         const captionDiv = document.createElement('div');
-                        captionDiv.style.cssText = 'color: white; font-size: 16px; margin-top: 20px; max-width: 90%; text-align: center; background: rgba(0,0,0,0.7); padding: 10px 20px; border-radius: 8px;';
+                        captionDiv.className = 'image-viewer-caption';
                         captionDiv.textContent = img.caption || img.original_filename;
                         
                         const dateDiv = document.createElement('div');
-                        dateDiv.style.cssText = 'color: #ccc; font-size: 12px; margin-top: 10px;';
-                        const date = new Date(img.timestamp / 1e6);
-                        dateDiv.textContent = date.toLocaleString();
+                        dateDiv.className = 'image-viewer-date';
+                        dateDiv.textContent = formatTimestampNs(img.timestamp);
                         
                         modal.appendChild(imgEl);
                         modal.appendChild(captionDiv);
@@ -6805,45 +8092,46 @@ WEB_UI_HTML = """
                         checkbox.type = 'checkbox';
                         checkbox.className = 'image-checkbox';
                         checkbox.setAttribute('data-image-id', img.id);
-                        checkbox.style.cssText = 'position: absolute; top: 6px; left: 6px; width: 18px; height: 18px; cursor: pointer;';
-                        checkbox.onchange = updateImageDeleteButton;
+                        checkbox.onchange = onImageCheckboxChange;
                         checkbox.onclick = (e) => e.stopPropagation();
                         div.appendChild(checkbox);
+                        checkboxes.push(checkbox);
                     }
                     
-                    const imgEl = document.createElement('img');
-                    imgEl.src = '/images/' + img.filename;
-                    imgEl.style.cssText = 'width: 100%; height: 120px; object-fit: cover; border-radius: 4px;';
+                    const imgEl = new Image(160, 120);
+                    imgEl.loading = 'lazy';
+                    imgEl.decoding = 'async';
+                    imgEl.src = '/images/thumb/' + img.filename;  // Full size only in the viewer
                     
                     const captionWrap = document.createElement('div');
-                    captionWrap.style.cssText = 'display: flex; flex-direction: column; gap: 4px;';
+                    captionWrap.className = 'gallery-caption-wrap';
 
                     const caption = document.createElement('div');
-                    caption.style.cssText = 'color: white; font-size: 12px; margin-top: 5px; overflow: hidden; text-overflow: ellipsis; white-space: nowrap;';
+                    caption.className = 'gallery-caption';
                     caption.textContent = img.caption || img.original_filename;
                     caption.title = img.caption || img.original_filename;
                     captionWrap.appendChild(caption);
 
                     const editBtn = document.createElement('button');
                     editBtn.textContent = img.caption ? 'Edit caption' : 'Add caption';
-                    editBtn.style.cssText = 'background: none; border: none; padding: 0; color: #93c5fd; font-size: 12px; cursor: pointer; text-align: left;';
+                    editBtn.className = 'gallery-caption-edit';
 
                     const editWrap = document.createElement('div');
-                    editWrap.style.cssText = 'display: none; margin-top: 6px;';
+                    editWrap.className = 'gallery-caption-form hidden';
 
                     const captionInput = document.createElement('input');
                     captionInput.type = 'text';
                     captionInput.value = img.caption || '';
                     captionInput.placeholder = 'Add a caption...';
-                    captionInput.style.cssText = 'width: 100%; padding: 6px 8px; border-radius: 6px; border: 1px solid #d1d5db; font-size: 12px;';
+                    captionInput.className = 'gallery-caption-input';
                     captionInput.onclick = (e) => e.stopPropagation();
 
                     const editActions = document.createElement('div');
-                    editActions.style.cssText = 'display: flex; gap: 6px; margin-top: 6px;';
+                    editActions.className = 'gallery-caption-actions';
 
                     const saveBtn = document.createElement('button');
                     saveBtn.textContent = 'Save';
-                    saveBtn.style.cssText = 'background: #e5e7eb; border: none; border-radius: 6px; padding: 6px 8px; font-size: 12px; cursor: pointer;';
+                    saveBtn.className = 'gallery-caption-save';
                     saveBtn.onclick = async (e) => {
                         e.stopPropagation();
                         try {
@@ -6857,18 +8145,18 @@ WEB_UI_HTML = """
 
                     const cancelBtn = document.createElement('button');
                     cancelBtn.textContent = 'Cancel';
-                    cancelBtn.style.cssText = 'background: #f3f4f6; border: none; border-radius: 6px; padding: 6px 8px; font-size: 12px; cursor: pointer;';
+                    cancelBtn.className = 'gallery-caption-cancel';
                     cancelBtn.onclick = (e) => {
                         e.stopPropagation();
-                        editWrap.style.display = 'none';
-                        captionWrap.style.display = 'flex';
+                        editWrap.classList.add('hidden');
+                        captionWrap.classList.remove('hidden');
                     };
 
                     editBtn.onclick = (e) => {
                         e.stopPropagation();
                         captionInput.value = img.caption || '';
-                        editWrap.style.display = 'block';
-                        captionWrap.style.display = 'none';
+                        editWrap.classList.remove('hidden');
+                        captionWrap.classList.add('hidden');
                         captionInput.focus();
                     };
 
@@ -6879,16 +8167,15 @@ WEB_UI_HTML = """
                     captionWrap.appendChild(editBtn);
                     
                     const timestamp = document.createElement('div');
-                    timestamp.style.cssText = 'color: #ccc; font-size: 10px; margin-top: 2px;';
-                    const date = new Date(img.timestamp / 1e6);
-                    timestamp.textContent = date.toLocaleString();
+                    timestamp.className = 'gallery-date';
+                    timestamp.textContent = formatTimestampNs(img.timestamp);
                     
                     const delBtn = document.createElement('button');
                     delBtn.textContent = 'x';
-                    delBtn.style.cssText = 'position: absolute; top: 5px; right: 5px; background: rgba(255,0,0,0.8); color: white; border: none; border-radius: 50%; width: 24px; height: 24px; cursor: pointer; font-size: 18px; line-height: 1;';
+                    delBtn.className = 'gallery-delete';
                     delBtn.onclick = (e) => {
                         e.stopPropagation();
-                        deleteImage(img.id);
+                        deleteImage(img.id, div);
                     };
                     
                     div.appendChild(imgEl);
@@ -6896,42 +8183,66 @@ WEB_UI_HTML = """
                     div.appendChild(editWrap);
                     div.appendChild(timestamp);
                     div.appendChild(delBtn);
-                    grid.appendChild(div);
+                    fragment.appendChild(div);
                 });
                 
-                gallery.style.display = 'block';
+                // ...then make every page write back to back, with no reads in between
+                if (listHeader) listHeader.classList.toggle('hidden', !showMultiSelect);
+                if (deleteSelectedBtn) {
+                    deleteSelectedBtn.classList.toggle('hidden', !showMultiSelect);
+                    deleteSelectedBtn.disabled = true;
+                    deleteSelectedBtn.style.opacity = '0.5';
+                }
+                if (selectAllImages) selectAllImages.checked = false;
+                grid.replaceChildren(fragment);
+                imageCheckboxes = checkboxes;
+                selectedImageIds.clear();
+                gallery.classList.remove('hidden');
             } catch (e) {
+                if (e.name === 'AbortError') return;
                 showStatus('Failed to load images: ' + e.message, true);
+            } finally {
+                if (imagesCtl === ctl) imagesCtl = null;
+            }
+        }
+        
+        function onImageCheckboxChange(e) {
+            const imageId = e.target.getAttribute('data-image-id');
+            if (e.target.checked) {
+                selectedImageIds.add(imageId);
+            } else {
+                selectedImageIds.delete(imageId);
             }
+            updateImageDeleteButton();
         }
         
         function toggleSelectAllImages() {
-            const selectAllCheckbox = document.getElementById('selectAllImages');
-            const checkboxes = document.querySelectorAll('.image-checkbox');
-            checkboxes.forEach(cb => {
-                cb.checked = selectAllCheckbox.checked;
-            });
+            const checked = $.selectAllImages.checked;
+            selectedImageIds.clear();
+            for (let i = 0; i < imageCheckboxes.length; i++) {
+                imageCheckboxes[i].checked = checked;
+                if (checked) selectedImageIds.add(imageCheckboxes[i].getAttribute('data-image-id'));
+            }
             updateImageDeleteButton();
         }
         
-        function updateImageDeleteButton() {
-            const checkboxes = document.querySelectorAll('.image-checkbox');
-            const anyChecked = Array.from(checkboxes).some(cb => cb.checked);
-            const deleteBtn = document.getElementById('deleteSelectedImagesBtn');
+        // Coalesced: ticking several boxes in one frame updates the button once
+        const updateImageDeleteButton = perFrame(() => {
+            const anyChecked = selectedImageIds.size > 0;
+            const deleteBtn = $.deleteSelectedImagesBtn;
             if (deleteBtn) {
                 deleteBtn.disabled = !anyChecked;
                 deleteBtn.style.opacity = anyChecked ? '1' : '0.5';
             }
-        }
+        });
         
         async function deleteSelectedImages() {
-            const checkboxes = document.querySelectorAll('.image-checkbox:checked');
-            if (checkboxes.length === 0) {
+            if (selectedImageIds.size === 0) {
                 showStatus('No images selected', true);
                 return;
             }
             
-            const imageCount = checkboxes.length;
+            const imageCount = selectedImageIds.size;
             if (!confirm(`Delete ${imageCount} image${imageCount > 1 ? 's' : ''}?`)) {
                 return;
             }
@@ -6939,23 +8250,27 @@ WEB_UI_HTML = """
             let successCount = 0;
             let failCount = 0;
             
-            for (const checkbox of checkboxes) {
-                try {
-                    const imageId = checkbox.getAttribute('data-image-id');
-                    const resp = await fetch('/api/image/' + imageId, {
-                        method: 'DELETE'
-                    });
-                    
-                    if (resp.ok) {
+            // One request and one transaction for the whole selection
+            const ids = Array.from(selectedImageIds, Number);
+            try {
+                const resp = await fetch('/api/images', {
+                    method: 'DELETE',
+                    headers: { 'Content-Type': 'application/json' },
+                    body: JSON.stringify({ ids })
+                });
+                if (!resp.ok) throw new Error(await parseError(resp, 'Delete failed'));
+                const result = await resp.json();
+                Object.entries(result.results || {}).forEach(([imageId, status]) => {
+                    if (status === 'deleted') {
                         successCount++;
                     } else {
                         failCount++;
-                        console.error('Failed to delete image:', imageId);
+                        console.error('Failed to delete image:', imageId, status);
                     }
-                } catch (e) {
-                    failCount++;
-                    console.error('Delete error:', e);
-                }
+                });
+            } catch (e) {
+                failCount = ids.length;
+                console.error('Delete error:', e);
             }
             
             if (successCount > 0) {
@@ -6968,71 +8283,81 @@ WEB_UI_HTML = """
             loadImages();
         }
         
-        async function deleteImage(imageId) {
-            if (!confirm('Delete this image?')) return;
+        async function deleteImage(imageId, card) {
+            if (!await showConfirm('Delete this image?')) return;
             
+            // Take the card out right away; a failed delete re-renders the gallery
+            if (card) card.remove();
             try {
                 const resp = await fetch('/api/image/' + imageId, {
                     method: 'DELETE'
                 });
                 
-                if (!resp.ok) {
-                    let errorMsg = 'Delete failed';
-                    try {
-                        const err = await resp.json();
-                        errorMsg = err.error || errorMsg;
-                    } catch (jsonErr) {
-                        errorMsg = await resp.text() || resp.statusText || errorMsg;
-                    }
-                    throw new Error(errorMsg);
-                }
+                if (!resp.ok) throw new Error(await parseError(resp, 'Delete failed'));
                 
                 showStatus('Image deleted', false);
-                loadImages();
+                if (!card || !$.galleryGrid.firstElementChild) {
+                    loadImages();
+                } else {
+                    imageCheckboxes = imageCheckboxes.filter(cb => cb.isConnected);
+                    selectedImageIds.delete(String(imageId));
+                    updateImageDeleteButton();
+                }
             } catch (e) {
                 showStatus('Delete error: ' + e.message, true);
+                loadImages();
             }
         }
         
         // Tab switching
+        // Each tab's button and content, looked up once
+        const tabParts = {};
+        document.querySelectorAll('.tab').forEach(button => {
+            tabParts[button.dataset.tab] = [button, document.getElementById('tab-' + button.dataset.tab)];
+        });
+        let activeTab = 'events';
+        
         function switchTab(tabName) {
-            // Hide all tabs
-            document.querySelectorAll('.tab-content').forEach(el => {
-                el.classList.remove('active');
-            });
-            document.querySelectorAll('.tab').forEach(el => {
-                el.classList.remove('active');
-            });
-            
-            // Show selected tab
-            document.getElementById('tab-' + tabName).classList.add('active');
-            document.querySelector('.tab[onclick*="' + tabName + '"]').classList.add('active');
+            // Only the outgoing and incoming tab change class
+            if (tabName !== activeTab) {
+                tabParts[activeTab].forEach(el => el.classList.remove('active'));
+                tabParts[tabName].forEach(el => el.classList.add('active'));
+                activeTab = tabName;
+            }
             
             // Load GX settings when switching to control tab
             if (tabName === 'control') {
                 loadGXSettings();
             }
             if (tabName === 'map') {
-                initMap();
-                if (lastGps) {
-                    updateMapPin(lastGps.latitude, lastGps.longitude);
-                } else {
-                    loadGps(false);
-                }
-                setTimeout(() => {
-                    if (mapInstance) mapInstance.invalidateSize();
-                }, 200);
+                loadLeaflet().catch((err) => console.warn('Failed to load map library:', err)).then(() => {
+                    // Build the map in the frame the tab is shown, then resize it on the
+                    // next one, once that layout is committed
+                    requestAnimationFrame(() => {
+                        initMap();
+                        if (lastGps) {
+                            updateMapPin(lastGps.latitude, lastGps.longitude);
+                        } else {
+                            loadGps(false);
+                        }
+                        requestAnimationFrame(() => {
+                            if (mapInstance) mapInstance.invalidateSize();
+                        });
+                    });
+                });
             }
         }
         
         // GX Control Functions
         let gxPollHandle = null;
         let gxPollStartedAt = 0;
+        let gxPollCtl = null;
         const GX_POLL_INTERVAL_MS = 2000;
+        const GX_POLL_FETCH_TIMEOUT_MS = 1500;
         const GX_POLL_TIMEOUT_MS = 20000;
 
         function setGxStatus(message, level) {
-            const el = document.getElementById('gxStatus');
+            const el = $.gxStatus;
             if (!el) return;
             el.textContent = message || '';
             el.classList.remove('gx-info', 'gx-warn', 'gx-success');
@@ -7043,23 +8368,36 @@ WEB_UI_HTML = """
             } else {
                 el.classList.add('gx-info');
             }
-            el.style.display = message ? 'block' : 'none';
+            el.classList.toggle('hidden', !message);
         }
 
-        async function fetchGXSettings() {
-            const resp = await fetch('/api/gx/settings', { cache: 'no-store' });
+        async function fetchGXSettings(signal) {
+            const resp = await fetch('/api/gx/settings', { cache: 'no-store', signal });
             if (!resp.ok) throw new Error('Failed to load settings');
             return resp.json();
         }
 
-        function formatAge(tsNs) {
+        // Last age string per setting; reused while the shown number stays the same
+        const formattedAges = new Map();
+        
+        function formatAge(tsNs, key) {
             if (!tsNs) return '';
             const ageSec = Math.max(0, Math.round((Date.now() - (tsNs / 1e6)) / 1000));
-            if (ageSec < 60) return ` (updated ${ageSec}s ago)`;
+            // Seconds, then minutes, then hours: one bucket per distinct string
             const ageMin = Math.round(ageSec / 60);
-            if (ageMin < 60) return ` (updated ${ageMin}m ago)`;
-            const ageHr = Math.round(ageMin / 60);
-            return ` (updated ${ageHr}h ago)`;
+            const bucket = ageSec < 60 ? ageSec : ageMin < 60 ? -ageMin : -10000 - Math.round(ageMin / 60);
+            const cached = formattedAges.get(key);
+            if (cached && cached.tsNs === tsNs && cached.bucket === bucket) return cached.text;
+            let text;
+            if (ageSec < 60) {
+                text = ` (updated ${ageSec}s ago)`;
+            } else if (ageMin < 60) {
+                text = ` (updated ${ageMin}m ago)`;
+            } else {
+                text = ` (updated ${Math.round(ageMin / 60)}h ago)`;
+            }
+            formattedAges.set(key, { tsNs, bucket, text });
+            return text;
         }
 
         function formatGxValue(value, suffix) {
@@ -7067,35 +8405,37 @@ WEB_UI_HTML = """
             return `${value} ${suffix}`;
         }
 
+        const GX_MODE_LABELS = {3: 'On', 2: 'Inverter Only', 1: 'Charger Only', 4: 'Off'};
+        const GX_MODE_INPUTS = {'3': 'on', '1': 'charger_only', '2': 'inverter_only', '4': 'off'};
+        const GX_MODE_NUMBERS = {on: 3, charger_only: 1, inverter_only: 2, off: 4};
+        
         function applyGXSettings(settings) {
             if (settings.battery_charge_current) {
-                const age = formatAge(settings.battery_charge_current.updated_at);
-                document.getElementById('current_battery_charge_current').textContent =
-                    `Current: ${formatGxValue(settings.battery_charge_current.value, 'A')}${age}`;
+                const age = formatAge(settings.battery_charge_current.updated_at, 'battery_charge_current');
+                setText('current_battery_charge_current',
+                    `Current: ${formatGxValue(settings.battery_charge_current.value, 'A')}${age}`);
             }
 
             if (settings.inverter_mode) {
-                const modeLabels = {3: 'On', 2: 'Inverter Only', 1: 'Charger Only', 4: 'Off'};
                 const modeValue = Number(settings.inverter_mode.value);
-                const modeLabel = modeLabels[modeValue] || 'Unknown';
-                const age = formatAge(settings.inverter_mode.updated_at);
-                document.getElementById('current_inverter_mode').textContent =
-                    `Current: ${modeLabel}${age}`;
-                const modeMap = {'3': 'on', '1': 'charger_only', '2': 'inverter_only', '4': 'off'};
-                document.getElementById('input_inverter_mode').value =
-                    modeMap[settings.inverter_mode.value] || 'on';
+                const modeLabel = GX_MODE_LABELS[modeValue] || 'Unknown';
+                const age = formatAge(settings.inverter_mode.updated_at, 'inverter_mode');
+                setText('current_inverter_mode', `Current: ${modeLabel}${age}`);
+                const modeSelect = $.input_inverter_mode;
+                const mode = GX_MODE_INPUTS[settings.inverter_mode.value] || 'on';
+                if (modeSelect.value !== mode) modeSelect.value = mode;
             }
 
             if (settings.ac_input_current_limit) {
-                const age = formatAge(settings.ac_input_current_limit.updated_at);
-                document.getElementById('current_ac_input_current_limit').textContent =
-                    `Current: ${formatGxValue(settings.ac_input_current_limit.value, 'A')}${age}`;
+                const age = formatAge(settings.ac_input_current_limit.updated_at, 'ac_input_current_limit');
+                setText('current_ac_input_current_limit',
+                    `Current: ${formatGxValue(settings.ac_input_current_limit.value, 'A')}${age}`);
             }
 
             if (settings.inverter_output_voltage) {
-                const age = formatAge(settings.inverter_output_voltage.updated_at);
-                document.getElementById('current_inverter_output_voltage').textContent =
-                    `Current: ${formatGxValue(settings.inverter_output_voltage.value, 'V')}${age}`;
+                const age = formatAge(settings.inverter_output_voltage.updated_at, 'inverter_output_voltage');
+                setText('current_inverter_output_voltage',
+                    `Current: ${formatGxValue(settings.inverter_output_voltage.value, 'V')}${age}`);
             }
         }
 
@@ -7111,9 +8451,8 @@ WEB_UI_HTML = """
 
         function normalizeExpectedValue(settingName, value) {
             if (settingName === 'inverter_mode') {
-                const modeMap = {on: 3, charger_only: 1, inverter_only: 2, off: 4};
-                if (typeof value === 'string' && value in modeMap) {
-                    return modeMap[value];
+                if (typeof value === 'string' && value in GX_MODE_NUMBERS) {
+                    return GX_MODE_NUMBERS[value];
                 }
             }
             const num = Number(value);
@@ -7134,6 +8473,11 @@ WEB_UI_HTML = """
                 clearTimeout(gxPollHandle);
                 gxPollHandle = null;
             }
+            if (gxPollCtl) {
+                const ctl = gxPollCtl;
+                gxPollCtl = null;
+                ctl.abort();
+            }
         }
 
         function startGxSettingPoll(settingName, expectedValue) {
@@ -7143,8 +8487,13 @@ WEB_UI_HTML = """
             setGxStatus('Update sent. Current values may take a moment to refresh. Polling for confirmation...', 'info');
 
             const tick = async () => {
+                // One request at a time, given up after GX_POLL_FETCH_TIMEOUT_MS so a
+                // hung backend can't stall the poll
+                const ctl = gxPollCtl = new AbortController();
+                const timer = setTimeout(() => ctl.abort(), GX_POLL_FETCH_TIMEOUT_MS);
                 try {
-                    const settings = await fetchGXSettings();
+                    const settings = await fetchGXSettings(ctl.signal);
+                    if (gxPollCtl !== ctl) return;
                     applyGXSettings(settings);
                     if (expected !== null && isSettingApplied(settingName, expected, settings)) {
                         setGxStatus('Current value updated.', 'success');
@@ -7152,8 +8501,13 @@ WEB_UI_HTML = """
                         return;
                     }
                 } catch (e) {
+                    // Stopped or superseded by a newer poll; a timeout keeps polling
+                    if (gxPollCtl !== ctl) return;
                     console.warn('GX settings poll failed:', e);
+                } finally {
+                    clearTimeout(timer);
                 }
+                gxPollCtl = null;
 
                 if (Date.now() - gxPollStartedAt >= GX_POLL_TIMEOUT_MS) {
                     setGxStatus('Update sent. Current values may still be syncing. Refreshing the page to re-sync...', 'warn');
@@ -7168,6 +8522,18 @@ WEB_UI_HTML = """
             gxPollHandle = setTimeout(tick, 1000);
         }
         
+        // One delegated handler for every SET button in the control tab
+        document.getElementById('tab-control').addEventListener('click', (e) => {
+            const button = e.target.closest('button[data-setting]');
+            if (!button) return;
+            const input = document.getElementById(button.dataset.input);
+            if (input && input.tagName === 'SELECT') {
+                setGXSettingSelect(button.dataset.setting, button.dataset.input);
+            } else {
+                setGXSetting(button.dataset.setting, button.dataset.input);
+            }
+        });
+        
         async function setGXSetting(settingName, inputId) {
             const value = document.getElementById(inputId).value.trim();
             if (!value) {
@@ -7232,16 +8598,210 @@ WEB_UI_HTML = """
 """
 
 
+# ============================================================================
+# Static Assets
+# ============================================================================
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+# static/vendor is populated at image build time (see Dockerfile); Leaflet falls back to the CDN when absent
+LEAFLET_VERSION = "1.9.4"
+LEAFLET_CDN_URL = f"https://unpkg.com/leaflet@{LEAFLET_VERSION}/dist"
+LEAFLET_CSS_SRI = "sha256-p4NxAoJBhIIN+hmNHrzRCf9tD/miZyoHS5obTRR9BMY="
+LEAFLET_JS_SRI = "sha256-20nQCchB9co0qIjJZRGuk2/Z9VM+kNiyxNV1lvTlZBo="
+
+STATIC_MIMETYPES = {
+    ".css": "text/css",
+    ".js": "application/javascript",
+    ".woff2": "font/woff2",
+    ".png": "image/png",
+    ".svg": "image/svg+xml",
+}
+COMPRESSIBLE_MIMETYPES = {"text/css", "application/javascript", "image/svg+xml"}
+
+
+def load_static_assets(root: str) -> Dict[str, Tuple[Dict[str, bytes], str, str]]:
+    """Read every file under root into {relative path: (variants, mimetype, etag)}."""
+    assets = {}
+    if not os.path.isdir(root):
+        return assets
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            mimetype = STATIC_MIMETYPES.get(os.path.splitext(name)[1].lower())
+            if not mimetype:
+                continue
+            path = os.path.join(dirpath, name)
+            with open(path, "rb") as handle:
+                data = handle.read()
+            variants = precompress(data) if mimetype in COMPRESSIBLE_MIMETYPES else {"identity": data}
+            rel_path = os.path.relpath(path, root).replace(os.sep, "/")
+            assets[rel_path] = (variants, mimetype, body_etag(data))
+    return assets
+
+
+_STATIC_ASSETS = load_static_assets(STATIC_DIR)
+
+
+def fingerprint_name(name: str, etag: str) -> str:
+    """Insert a content hash before the extension: vendor/leaflet.css -> vendor/leaflet.<hash>.css."""
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{etag[:10]}{ext}"
+
+
+def static_url(name: str, fallback: Optional[str] = None) -> Optional[str]:
+    """Fingerprinted URL for a bundled static file, so it can be cached forever."""
+    asset = _STATIC_ASSETS.get(name)
+    if asset is None:
+        return fallback
+    return f"/static/{fingerprint_name(name, asset[2])}"
+
+
+LOGO_URL = static_url("logo.svg")
+LEAFLET_CSS_URL = static_url(f"vendor/leaflet-{LEAFLET_VERSION}.css", f"{LEAFLET_CDN_URL}/leaflet.css")
+LEAFLET_JS_URL = static_url(f"vendor/leaflet-{LEAFLET_VERSION}.js", f"{LEAFLET_CDN_URL}/leaflet.js")
+# Without a local copy the UI uses the system font stack rather than a third-party font host
+INTER_FONT_URL = static_url("vendor/Inter-var.woff2")
+
+
+_CSS_STRING = r"\"(?:[^\"\\\\]|\\\\.)*\"|'(?:[^'\\\\]|\\\\.)*'"
+_CSS_STRING_OR_COMMENT_RE = re.compile(rf"({_CSS_STRING})|/\*.*?\*/", re.S)
+_CSS_STRING_SPLIT_RE = re.compile(rf"({_CSS_STRING})", re.S)
+# Bodies whose text is significant; minify_html copies them through as-is
+_HTML_RAW_TEXT_RE = re.compile(r"<(script|style|pre|textarea)\b.*?</\1\s*>", re.S | re.I)
+
+
+def _minify_css_text(css: str) -> str:
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    return re.sub(r":\s+", ":", css)
+
+
+def minify_css(css: str) -> str:
+    """Drop comments and insignificant whitespace from a stylesheet; quoted strings are kept."""
+    css = _CSS_STRING_OR_COMMENT_RE.sub(lambda m: m.group(1) or "", css)
+    # Odd-numbered parts are the quoted strings
+    parts = _CSS_STRING_SPLIT_RE.split(css)
+    css = "".join(part if i % 2 else _minify_css_text(part) for i, part in enumerate(parts))
+    return css.replace(";}", "}").strip()
+
+
+def _minify_markup(html: str) -> str:
+    html = re.sub(r"<!--.*?-->", "", html, flags=re.S)
+    text = "\n".join(line.strip() for line in html.splitlines() if line.strip())
+    # A whitespace boundary next to a raw-text block stays a (single) separator
+    if text and html[:1].isspace():
+        text = "\n" + text
+    if text and html[-1:].isspace():
+        text += "\n"
+    return text
+
+
+def minify_html(html: str) -> str:
+    """Drop HTML comments, indentation and blank lines outside <script>, <style>, <pre> and <textarea>."""
+    out = []
+    pos = 0
+    for match in _HTML_RAW_TEXT_RE.finditer(html):
+        out.append(_minify_markup(html[pos:match.start()]))
+        out.append(match.group(0))
+        pos = match.end()
+    out.append(_minify_markup(html[pos:]))
+    return "".join(out)
+
+
+if not DEBUG:
+    CRITICAL_CSS = minify_css(CRITICAL_CSS)
+    DEFERRED_CSS = minify_css(DEFERRED_CSS)
+
+
+_APP_CSS_BODY = DEFERRED_CSS.encode("utf-8")
+_APP_CSS_VARIANTS = precompress(_APP_CSS_BODY)
+_APP_CSS_ETAG = body_etag(_APP_CSS_BODY)
+_STATIC_ASSETS["app.css"] = (_APP_CSS_VARIANTS, "text/css", _APP_CSS_ETAG)
+APP_CSS_URL = static_url("app.css")
+
+# Fingerprinted path -> asset name. Only these URLs are immutable; a deploy that
+# changes a file changes its URL, so long-lived caches never serve stale bytes.
+_STATIC_FINGERPRINTS = {
+    fingerprint_name(name, etag): name
+    for name, (_, _, etag) in _STATIC_ASSETS.items()
+}
+
+
+# Compiled once with Flask's Jinja environment so filters like tojson keep their Flask behavior
+_WEB_UI_TEMPLATE = app.jinja_env.from_string(
+    WEB_UI_HTML if DEBUG else minify_html(WEB_UI_HTML)
+)
+
+
+def _render_web_ui(template, system_id: str, tile_url: str, attribution: str, zoom: int) -> str:
+    with app.app_context():
+        return template.render(
+            SYSTEM_ID=system_id,
+            MAP_TILE_URL=tile_url,
+            MAP_TILE_ATTRIBUTION=attribution,
+            MAP_DEFAULT_ZOOM=zoom,
+            CRITICAL_CSS=CRITICAL_CSS,
+            LOGGER_OPTIONS_HTML=LOGGER_OPTIONS_HTML,
+            LOGO_URL=LOGO_URL,
+            APP_CSS_URL=APP_CSS_URL,
+            LEAFLET_CSS_URL=LEAFLET_CSS_URL,
+            LEAFLET_CSS_SRI=LEAFLET_CSS_SRI,
+            LEAFLET_JS_URL=LEAFLET_JS_URL,
+            LEAFLET_JS_SRI=LEAFLET_JS_SRI,
+            INTER_FONT_URL=INTER_FONT_URL,
+            DEBUG=DEBUG
+        )
+
+
+@lru_cache(maxsize=4)
+def _web_ui_page(system_id: str, tile_url: str, attribution: str,
+                 zoom: int) -> Tuple[Dict[str, bytes], str]:
+    """Render and compress the web UI for one configuration; returns (variants, etag)."""
+    html = _render_web_ui(_WEB_UI_TEMPLATE, system_id, tile_url, attribution, zoom)
+    body = html.encode("utf-8")
+    return precompress(body), body_etag(body)
+
+
+# Warm the cache so the first page load does not pay for rendering and brotli
+_web_ui_page(SYSTEM_ID, MAP_TILE_URL, MAP_TILE_ATTRIBUTION, MAP_DEFAULT_ZOOM)
+
+# Let the browser start fetching subresources before it has parsed the <head>.
+# gunicorn cannot send 103 Early Hints, so these ride on the 200/304.
+_WEB_UI_PRELOADS = [
+    (APP_CSS_URL, "style", False),
+    (LOGO_URL, "image", False),
+    (INTER_FONT_URL, "font", True),
+]
+WEB_UI_LINK_HEADER = ", ".join(
+    f"<{url}>; rel=preload; as={kind}" + ("; crossorigin=anonymous" if cors else "")
+    for url, kind, cors in _WEB_UI_PRELOADS
+    if url
+)
+
+
 @app.route("/", methods=["GET"])
 def web_ui():
     """Serve the touch-friendly web UI."""
-    return render_template_string(
-        WEB_UI_HTML,
-        SYSTEM_ID=SYSTEM_ID,
-        MAP_TILE_URL=MAP_TILE_URL,
-        MAP_TILE_ATTRIBUTION=MAP_TILE_ATTRIBUTION,
-        MAP_DEFAULT_ZOOM=MAP_DEFAULT_ZOOM
-    )
+    variants, etag = _web_ui_page(SYSTEM_ID, MAP_TILE_URL, MAP_TILE_ATTRIBUTION, MAP_DEFAULT_ZOOM)
+    response = precompressed_response(variants, "text/html", etag=etag)
+    # Always revalidate the shell; unchanged pages come back as a 304
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["Link"] = WEB_UI_LINK_HEADER
+    return response
+
+
+@app.route("/static/<path:filename>", methods=["GET"])
+def static_asset(filename):
+    """Serve bundled static files (web UI stylesheet, logo, self-hosted Leaflet and Inter)."""
+    name = _STATIC_FINGERPRINTS.get(filename)
+    immutable = name is not None
+    asset = _STATIC_ASSETS.get(name or filename)
+    if asset is None:
+        return jsonify({"error": "Not found"}), 404
+    variants, mimetype, etag = asset
+    response = precompressed_response(variants, mimetype, etag=etag)
+    # Plain names (e.g. Leaflet's relative marker images) revalidate against the ETag
+    response.headers["Cache-Control"] = "public, max-age=31536000, immutable" if immutable else "no-cache"
+    return response
 
 
 @app.route("/health", methods=["GET"])
@@ -7270,8 +8830,18 @@ logger.info("Report upload worker started")
 
 tile_usage_thread = threading.Thread(target=tile_usage_sync_worker, daemon=True, name="tile-usage-sync")
 tile_usage_thread.start()
+atexit.register(_flush_tile_counts)  # Counts buffered since the last flush
 logger.info("Tile usage sync worker started")
 
+image_metadata_thread = threading.Thread(target=image_metadata_worker, daemon=True, name="image-metadata")
+image_metadata_thread.start()
+atexit.register(_drain_image_inserts)  # Uploads still queued at shutdown
+logger.info("Image metadata worker started")
+
+summary_stream_thread = threading.Thread(target=summary_stream_worker, daemon=True, name="summary-stream")
+summary_stream_thread.start()
+logger.info("Summary stream worker started")
+
 # Start MQTT realtime subscriber thread
 if PAHO_AVAILABLE:
     mqtt_realtime_thread = threading.Thread(target=_mqtt_realtime_worker, daemon=True, name="mqtt-realtime")
@@ -7297,7 +8867,7 @@ logger.info("ACUVIM realtime worker started")
 
 if __name__ == "__main__":
     # Only used for local development: python app.py
-    # Production uses: gunicorn -w 2 -b 0.0.0.0:8088 app:app
+    # Production uses: gunicorn -w 2 --threads 8 -b 0.0.0.0:8088 app:app
     logger.info("OVR Event Service starting (dev mode)...")
     logger.info(f"VictoriaMetrics write URL: {VM_WRITE_URL}")
     logger.info(f"Database: {DB_PATH}")
@@ -1,16 +1,44 @@
 from __future__ import annotations
 
+import threading
 import time
+from collections import Counter
 from datetime import datetime, timezone
-from typing import Dict, Optional
+from fractions import Fraction
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
 PROVIDERS = ("mapbox", "esri")
+_OTHER_PROVIDER = {PROVIDERS[0]: PROVIDERS[1], PROVIDERS[1]: PROVIDERS[0]}
+
+# Tile views counted since the last flush, keyed by (month_key, provider)
+_pending_counts: "Counter[Tuple[str, str]]" = Counter()
+_pending_lock = threading.Lock()
+
+# Same SQL text on every call, so sqlite3's per-connection statement cache
+# reuses the prepared statement; rows are read by position
+_SELECT_TILE_COUNTS = "SELECT provider, count FROM map_tile_counts WHERE month_key = ?"
+_SELECT_TILE_SYNC_TOTALS = "SELECT provider, sent_total FROM map_tile_sync WHERE month_key = ?"
+
+# Reads served from memory for this long; local writes refresh them sooner
+READ_CACHE_TTL = 5.0
+_stored_counts_cache: Dict[str, Tuple[float, Dict[str, int]]] = {}
+_preferred_cache: Dict[str, object] = {"value": None, "ts": None}
+
+
+# Current month key, recomputed once per UTC day (months start on day boundaries)
+_month_key_cache: Dict[str, object] = {"day": None, "key": ""}
 
 
 def utc_month_key(value: Optional[datetime] = None) -> str:
     if value is None:
-        current = datetime.now(timezone.utc)
-    elif isinstance(value, datetime):
+        day = int(time.time()) // 86400
+        if day != _month_key_cache["day"]:
+            current = datetime.now(timezone.utc)
+            _month_key_cache["key"] = f"{current.year:04d}-{current.month:02d}"
+            _month_key_cache["day"] = day
+        return _month_key_cache["key"]
+    if isinstance(value, datetime):
         current = value.astimezone(timezone.utc)
     else:
         raise TypeError("utc_month_key expects datetime or None")
@@ -55,43 +83,80 @@ def init_map_tables(conn) -> None:
     )
 
 
-def increment_tile_count(conn, month_key: str, provider: str, count: int) -> None:
+# Counted in memory; flush_tile_counts writes the totals out
+def increment_tile_count(month_key: str, provider: str, count: int) -> None:
+    with _pending_lock:
+        _pending_counts[(month_key, provider)] += count
+
+
+# The lock only covers the buffer swap, so increments never wait on SQLite.
+# While the write is in flight, get_tile_counts may briefly miss those counts.
+def flush_tile_counts(conn) -> int:
+    global _pending_counts
+    with _pending_lock:
+        if not _pending_counts:
+            return 0
+        pending, _pending_counts = _pending_counts, Counter()
     now = int(time.time())
-    conn.execute(
-        """
-        INSERT INTO map_tile_counts (month_key, provider, count, updated_at)
-        VALUES (?, ?, ?, ?)
-        ON CONFLICT(month_key, provider) DO UPDATE SET
-            count = count + excluded.count,
-            updated_at = excluded.updated_at
-        """,
-        (month_key, provider, count, now),
-    )
+    try:
+        with conn:
+            conn.executemany(
+                """
+                INSERT INTO map_tile_counts (month_key, provider, count, updated_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(month_key, provider) DO UPDATE SET
+                    count = count + excluded.count,
+                    updated_at = excluded.updated_at
+                """,
+                [
+                    (month_key, provider, count, now)
+                    for (month_key, provider), count in pending.items()
+                ],
+            )
+    except Exception:
+        # Keep the counts for the next flush
+        with _pending_lock:
+            _pending_counts.update(pending)
+        raise
+    for month_key, _ in pending:
+        _stored_counts_cache.pop(month_key, None)
+    return sum(pending.values())
 
 
-def get_tile_counts(conn, month_key: str) -> Dict[str, int]:
-    rows = conn.execute(
-        "SELECT provider, count FROM map_tile_counts WHERE month_key = ?",
-        (month_key,),
-    ).fetchall()
-    counts = {provider: 0 for provider in PROVIDERS}
-    for row in rows:
-        provider = row["provider"]
+# Flushed counts read straight from the table; the cloud sync compares these
+# with sent totals, so they must be current and the same in every process
+def get_stored_tile_counts(conn, month_key: str) -> Dict[str, int]:
+    counts = dict.fromkeys(PROVIDERS, 0)
+    for provider, count in conn.execute(_SELECT_TILE_COUNTS, (month_key,)):
         if provider in counts:
-            counts[provider] = int(row["count"] or 0)
+            counts[provider] = int(count or 0)
+    return counts
+
+
+def _stored_tile_counts(conn, month_key: str) -> Dict[str, int]:
+    cached = _stored_counts_cache.get(month_key)
+    if cached and time.monotonic() - cached[0] < READ_CACHE_TTL:
+        return cached[1]
+    counts = get_stored_tile_counts(conn, month_key)
+    _stored_counts_cache[month_key] = (time.monotonic(), counts)
+    return counts
+
+
+# Stored counts plus any not yet flushed, for the guardrail and the UI
+def get_tile_counts(conn, month_key: str) -> Dict[str, int]:
+    counts = dict(_stored_tile_counts(conn, month_key))
+    with _pending_lock:
+        for (pending_month, provider), count in _pending_counts.items():
+            if pending_month == month_key and provider in counts:
+                counts[provider] += count
     return counts
 
 
 def get_tile_sync_totals(conn, month_key: str) -> Dict[str, int]:
-    rows = conn.execute(
-        "SELECT provider, sent_total FROM map_tile_sync WHERE month_key = ?",
-        (month_key,),
-    ).fetchall()
-    totals = {provider: 0 for provider in PROVIDERS}
-    for row in rows:
-        provider = row["provider"]
+    totals = dict.fromkeys(PROVIDERS, 0)
+    for provider, sent_total in conn.execute(_SELECT_TILE_SYNC_TOTALS, (month_key,)):
         if provider in totals:
-            totals[provider] = int(row["sent_total"] or 0)
+            totals[provider] = int(sent_total or 0)
     return totals
 
 
@@ -121,22 +186,30 @@ def set_preferred_provider(conn, provider: str) -> None:
         """,
         (provider, now),
     )
+    _preferred_cache["value"] = provider if provider in PROVIDERS else None
+    _preferred_cache["ts"] = time.monotonic()
 
 
 def get_preferred_provider(conn) -> Optional[str]:
+    ts = _preferred_cache["ts"]
+    if ts is not None and time.monotonic() - ts < READ_CACHE_TTL:
+        return _preferred_cache["value"]
     row = conn.execute(
         "SELECT value FROM map_provider_settings WHERE key = 'preferred_provider'"
     ).fetchone()
-    if not row:
-        return None
-    value = row["value"]
-    return value if value in PROVIDERS else None
+    value = row["value"] if row else None
+    if value not in PROVIDERS:
+        value = None
+    _preferred_cache["value"] = value
+    _preferred_cache["ts"] = time.monotonic()
+    return value
 
 
-def _pct(value: Optional[float], threshold: Optional[float]) -> Optional[float]:
-    if value is None or threshold in (None, 0):
-        return None
-    return (float(value) / float(threshold)) * 100
+# Guardrail fraction as integers, so the blocked check is exact integer math
+@lru_cache(maxsize=8)
+def _guardrail_ratio(guardrail_pct: float) -> Tuple[int, int]:
+    ratio = Fraction(guardrail_pct).limit_denominator(10000)
+    return ratio.numerator, ratio.denominator
 
 
 def build_guardrail_status(
@@ -148,20 +221,22 @@ def build_guardrail_status(
 ) -> Dict[str, object]:
     pct: Dict[str, Optional[float]] = {}
     blocked: Dict[str, bool] = {}
+    pct_num, pct_den = _guardrail_ratio(guardrail_pct)
 
     for provider in PROVIDERS:
         total = fleet_counts.get(provider)
         threshold = thresholds.get(provider)
-        pct[provider] = _pct(total, threshold)
         if total is None or threshold is None:
+            pct[provider] = None
             blocked[provider] = False
         else:
-            blocked[provider] = total >= (float(threshold) * guardrail_pct)
+            pct[provider] = (float(total) / float(threshold)) * 100 if threshold else None
+            blocked[provider] = total * pct_den >= threshold * pct_num
 
     recommended = preferred_provider if preferred_provider in PROVIDERS else PROVIDERS[0]
     warning = None
     if blocked.get(recommended):
-        other = PROVIDERS[0] if recommended == PROVIDERS[1] else PROVIDERS[1]
+        other = _OTHER_PROVIDER[recommended]
         if not blocked.get(other):
             recommended = other
         else:
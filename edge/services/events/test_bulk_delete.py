@@ -0,0 +1,181 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import app as events_app
+
+
+class TempDatabaseTestCase(unittest.TestCase):
+    def setUp(self):
+        # app reads its paths at import time; point them at a scratch directory
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        images_path = os.path.join(tmp, "images")
+        paths = {
+            "DB_PATH": os.path.join(tmp, "events.db"),
+            "IMAGES_PATH": images_path,
+            "IMAGE_THUMBS_PATH": os.path.join(images_path, "thumbs"),
+            "REPORTS_PATH": os.path.join(tmp, "reports"),
+            "API_KEY": "",
+        }
+        for name, value in paths.items():
+            patcher = mock.patch.object(events_app, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        # The test client runs requests on this thread, so they share its connection
+        self._drop_connection()
+        self.addCleanup(self._drop_connection)
+        events_app.init_db()
+        self.client = events_app.app.test_client()
+
+    @staticmethod
+    def _drop_connection():
+        conn = getattr(events_app._db_local, "conn", None)
+        if conn is not None:
+            conn.close()
+            del events_app._db_local.conn
+
+    def query(self, sql, params=()):
+        with sqlite3.connect(events_app.DB_PATH) as conn:
+            return conn.execute(sql, params).fetchall()
+
+
+class ImageBulkDeleteTests(TempDatabaseTestCase):
+    def add_image(self, filename):
+        with open(os.path.join(events_app.IMAGES_PATH, filename), "wb") as f:
+            f.write(b"image")
+        with events_app.get_db() as conn:
+            cursor = conn.execute(
+                """
+                INSERT INTO images (filename, original_filename, system_id, timestamp, file_size)
+                VALUES (?, ?, 'system-1', ?, 5)
+                """,
+                (filename, filename, int(time.time() * 1e9)),
+            )
+            conn.commit()
+        return cursor.lastrowid
+
+    def delete(self, ids):
+        return self.client.delete("/api/images", json={"ids": ids})
+
+    def test_deletes_rows_and_files_and_reports_missing_ids(self):
+        first = self.add_image("first.jpg")
+        second = self.add_image("second.jpg")
+        response = self.delete([first, second, 9999])
+        self.assertEqual(response.status_code, 200)
+        body = response.get_json()
+        self.assertEqual(body["deleted_count"], 2)
+        self.assertEqual(
+            body["results"],
+            {str(first): "deleted", str(second): "deleted", "9999": "not_found"},
+        )
+        self.assertEqual(self.query("SELECT id FROM images"), [])
+        self.assertEqual(
+            self.query("SELECT COUNT(*) FROM audit_log WHERE action = 'image_delete'"), [(2,)]
+        )
+        self.assertFalse(os.path.exists(os.path.join(events_app.IMAGES_PATH, "first.jpg")))
+        self.assertFalse(os.path.exists(os.path.join(events_app.IMAGES_PATH, "second.jpg")))
+
+    def test_files_removed_after_rows_committed(self):
+        image_id = self.add_image("photo.jpg")
+        committed_rows = []
+        remove_image_files = events_app.remove_image_files
+
+        def check_committed(filename):
+            # A separate connection only sees committed changes
+            committed_rows.append(
+                self.query("SELECT id FROM images WHERE filename = ?", (filename,))
+            )
+            remove_image_files(filename)
+
+        with mock.patch.object(events_app, "remove_image_files", check_committed):
+            response = self.delete([image_id])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(committed_rows, [[]])
+        self.assertFalse(os.path.exists(os.path.join(events_app.IMAGES_PATH, "photo.jpg")))
+
+    def test_duplicate_ids_reported_once(self):
+        image_id = self.add_image("photo.jpg")
+        response = self.delete([image_id, image_id, str(image_id)])
+        self.assertEqual(response.status_code, 200)
+        body = response.get_json()
+        self.assertEqual(body["deleted_count"], 1)
+        self.assertEqual(body["results"], {str(image_id): "deleted"})
+
+    def test_rejects_more_than_max_ids(self):
+        image_id = self.add_image("photo.jpg")
+        too_many = [image_id] + list(range(10000, 10000 + events_app.IMAGE_BULK_DELETE_MAX))
+        response = self.delete(too_many)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(len(self.query("SELECT id FROM images")), 1)
+
+        at_limit = self.delete(too_many[:events_app.IMAGE_BULK_DELETE_MAX])
+        self.assertEqual(at_limit.status_code, 200)
+        self.assertEqual(at_limit.get_json()["deleted_count"], 1)
+
+    def test_rejects_non_integer_ids(self):
+        image_id = self.add_image("photo.jpg")
+        for ids in ([image_id, "abc"], [image_id, None], [], "1,2"):
+            response = self.delete(ids)
+            self.assertEqual(response.status_code, 400, ids)
+        self.assertEqual(len(self.query("SELECT id FROM images")), 1)
+        self.assertTrue(os.path.exists(os.path.join(events_app.IMAGES_PATH, "photo.jpg")))
+
+
+class AuditBatchDeleteTests(TempDatabaseTestCase):
+    def add_audit(self, action, system_id, event_id, note):
+        with events_app.get_db() as conn:
+            cursor = conn.execute(
+                """
+                INSERT INTO audit_log (timestamp, action, system_id, event_id, note, success)
+                VALUES (?, ?, ?, ?, ?, 1)
+                """,
+                (int(time.time() * 1e9), action, system_id, event_id, note),
+            )
+            conn.commit()
+        return cursor.lastrowid
+
+    def delete_batch(self, items):
+        return self.client.post("/api/audit/delete_batch", json={"items": items})
+
+    def test_counts_deleted_and_missing_notes(self):
+        system_id = events_app.canonicalize_system_id("system-1")
+        by_id = self.add_audit("note", system_id, "event-1", "first")
+        self.add_audit("event_note", system_id, "event-1", "second")
+        start_id = self.add_audit("start", system_id, "event-1", None)
+        response = self.delete_batch([
+            {"note_id": by_id},
+            {"system_id": system_id, "event_id": "event-1", "note_text": "second"},
+            {"note_id": 9999},
+            # Only notes can be deleted; other audit rows count as missing
+            {"note_id": start_id},
+            {"system_id": system_id, "event_id": "event-1", "note_text": "never written"},
+        ])
+        self.assertEqual(response.status_code, 200)
+        body = response.get_json()
+        self.assertEqual(body["deleted_count"], 2)
+        self.assertEqual(body["missing_count"], 3)
+        self.assertEqual(self.query("SELECT id FROM audit_log"), [(start_id,)])
+
+    def test_repeated_item_counts_as_missing(self):
+        note_id = self.add_audit("note", "system-1", "event-1", "first")
+        response = self.delete_batch([{"note_id": note_id}, {"note_id": str(note_id)}])
+        self.assertEqual(response.status_code, 200)
+        body = response.get_json()
+        self.assertEqual(body["deleted_count"], 1)
+        self.assertEqual(body["missing_count"], 1)
+
+    def test_invalid_items_delete_nothing(self):
+        note_id = self.add_audit("note", "system-1", "event-1", "first")
+        for items in ([{"note_id": note_id}, {"note_id": "abc"}], [{"note_id": note_id}, "x"], []):
+            response = self.delete_batch(items)
+            self.assertEqual(response.status_code, 400, items)
+        self.assertEqual(self.query("SELECT id FROM audit_log"), [(note_id,)])
+
+
+if __name__ == "__main__":
+    unittest.main()
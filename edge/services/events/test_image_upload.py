@@ -0,0 +1,78 @@
+import io
+import os
+import queue
+import unittest
+from unittest import mock
+
+import app as events_app
+from test_bulk_delete import TempDatabaseTestCase
+
+
+class _FullQueue(queue.Queue):
+    def put_nowait(self, item):
+        raise queue.Full
+
+
+class ImageUploadTests(TempDatabaseTestCase):
+    def upload(self, name="photo.jpg"):
+        return self.client.post(
+            "/api/image/upload",
+            data={"image": (io.BytesIO(b"not really a jpeg"), name), "system_id": "system-1"},
+        )
+
+    def meta(self, filename):
+        return {
+            "filename": filename,
+            "original_filename": filename,
+            "system_id": "system-1",
+            "event_id": "",
+            "location": "",
+            "caption": "",
+            "timestamp": 1,
+            "file_size": 1,
+            "content_type": "image/jpeg",
+        }
+
+    def test_full_queue_inserts_before_responding(self):
+        with mock.patch.object(events_app, "_image_insert_queue", _FullQueue()):
+            response = self.upload()
+        self.assertEqual(response.status_code, 200)
+        body = response.get_json()
+        self.assertFalse(body["pending"])
+        self.assertEqual(
+            self.query("SELECT id, filename FROM images"), [(body["id"], body["filename"])]
+        )
+
+    def test_failed_insert_keeps_file(self):
+        path = os.path.join(events_app.IMAGES_PATH, "photo.jpg")
+        with open(path, "wb") as f:
+            f.write(b"image")
+
+        def fail(conn, meta):
+            raise RuntimeError("database is locked")
+
+        with mock.patch.object(events_app, "_insert_image_metadata", fail), \
+                mock.patch.object(events_app.time, "sleep") as sleep:
+            self.assertIsNone(events_app.save_image_metadata(self.meta("photo.jpg")))
+        self.assertEqual(sleep.call_count, events_app.IMAGE_INSERT_ATTEMPTS - 1)
+        self.assertTrue(os.path.exists(path))
+
+    def test_retry_saves_row(self):
+        insert = events_app._insert_image_metadata
+        calls = []
+
+        def fail_once(conn, meta):
+            calls.append(meta["filename"])
+            if len(calls) == 1:
+                raise RuntimeError("database is locked")
+            return insert(conn, meta)
+
+        with mock.patch.object(events_app, "_insert_image_metadata", fail_once), \
+                mock.patch.object(events_app.time, "sleep"):
+            image_id = events_app.save_image_metadata(self.meta("photo.jpg"))
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(self.query("SELECT id FROM images"), [(image_id,)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,16 +1,26 @@
 import sqlite3
 import unittest
 
+import map_tiles
 from map_tiles import (
     build_guardrail_status,
+    flush_tile_counts,
+    get_preferred_provider,
+    get_stored_tile_counts,
     get_tile_counts,
     increment_tile_count,
     init_map_tables,
+    set_preferred_provider,
 )
 
 
 class MapTileTests(unittest.TestCase):
     def setUp(self):
+        # Buffered counts and read caches are module state; start each test clean
+        # so results don't depend on test order or on how tests are split across workers
+        map_tiles._pending_counts.clear()
+        map_tiles._stored_counts_cache.clear()
+        map_tiles._preferred_cache.update(value=None, ts=None)
         self.conn = sqlite3.connect(":memory:")
         self.conn.row_factory = sqlite3.Row
         init_map_tables(self.conn)
@@ -19,9 +29,9 @@ class MapTileTests(unittest.TestCase):
         self.conn.close()
 
     def test_month_rollover_separates_counts(self):
-        increment_tile_count(self.conn, "2026-01", "mapbox", 5)
-        increment_tile_count(self.conn, "2026-02", "mapbox", 2)
-        self.conn.commit()
+        increment_tile_count("2026-01", "mapbox", 5)
+        increment_tile_count("2026-02", "mapbox", 2)
+        flush_tile_counts(self.conn)
 
         jan = get_tile_counts(self.conn, "2026-01")
         feb = get_tile_counts(self.conn, "2026-02")
@@ -29,6 +39,43 @@ class MapTileTests(unittest.TestCase):
         self.assertEqual(jan["mapbox"], 5)
         self.assertEqual(feb["mapbox"], 2)
 
+    def test_unflushed_counts_are_included(self):
+        increment_tile_count("2026-03", "esri", 4)
+        flush_tile_counts(self.conn)
+        increment_tile_count("2026-03", "esri", 3)
+
+        self.assertEqual(get_tile_counts(self.conn, "2026-03")["esri"], 7)
+        self.assertEqual(flush_tile_counts(self.conn), 3)
+        self.assertEqual(get_tile_counts(self.conn, "2026-03")["esri"], 7)
+
+    def test_stored_counts_skip_cache_and_buffer(self):
+        increment_tile_count("2026-04", "mapbox", 2)
+        flush_tile_counts(self.conn)
+        self.assertEqual(get_tile_counts(self.conn, "2026-04")["mapbox"], 2)
+
+        # Written by another process: the cached read lags, the stored read does not
+        self.conn.execute(
+            "UPDATE map_tile_counts SET count = 10 WHERE month_key = '2026-04' AND provider = 'mapbox'"
+        )
+        increment_tile_count("2026-04", "mapbox", 1)
+        self.assertEqual(get_stored_tile_counts(self.conn, "2026-04")["mapbox"], 10)
+
+    def test_failed_flush_keeps_counts(self):
+        increment_tile_count("2026-05", "esri", 6)
+        broken = sqlite3.connect(":memory:")  # no tables, so the write fails
+        with self.assertRaises(sqlite3.OperationalError):
+            flush_tile_counts(broken)
+        broken.close()
+
+        self.assertEqual(flush_tile_counts(self.conn), 6)
+        self.assertEqual(get_stored_tile_counts(self.conn, "2026-05")["esri"], 6)
+
+    def test_preferred_provider_read_after_write(self):
+        set_preferred_provider(self.conn, "esri")
+        self.assertEqual(get_preferred_provider(self.conn), "esri")
+        set_preferred_provider(self.conn, "mapbox")
+        self.assertEqual(get_preferred_provider(self.conn), "mapbox")
+
     def test_guardrail_blocks_at_threshold(self):
         status = build_guardrail_status(
             "mapbox",
@@ -39,6 +86,16 @@ class MapTileTests(unittest.TestCase):
         self.assertTrue(status["blocked"]["mapbox"])
         self.assertEqual(status["recommended_provider"], "esri")
 
+    def test_guardrail_allows_below_threshold(self):
+        status = build_guardrail_status(
+            "mapbox",
+            {"mapbox": 94, "esri": 0},
+            {"mapbox": 100, "esri": 100},
+            0.95,
+        )
+        self.assertFalse(status["blocked"]["mapbox"])
+        self.assertEqual(status["recommended_provider"], "mapbox")
+
 
 if __name__ == "__main__":
     unittest.main()
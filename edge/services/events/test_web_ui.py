@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the rendered web UI page.
+"""
+
+import sys
+import os
+import re
+from collections import Counter
+from html.parser import HTMLParser
+from unittest import mock
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import app as events_app
+from app import app
+
+
+class _PageSummary(HTMLParser):
+    """Collects element ids and inline script bodies."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.ids = Counter()
+        self.scripts = []
+        self._in_script = False
+
+    def handle_starttag(self, tag, attrs):
+        for name, value in attrs:
+            if name == "id":
+                self.ids[value] += 1
+        if tag == "script":
+            self._in_script = True
+            self.scripts.append("")
+
+    def handle_endtag(self, tag):
+        if tag == "script":
+            self._in_script = False
+
+    def handle_data(self, data):
+        if self._in_script:
+            self.scripts[-1] += data
+
+
+def _summarize(html):
+    parser = _PageSummary()
+    parser.feed(html)
+    parser.close()
+    return parser
+
+
+def test_element_ids_unique():
+    """Every id in the rendered page appears once, so getElementById is unambiguous."""
+    html = app.test_client().get("/").get_data(as_text=True)
+    # Markup only; ids inside inline scripts are templates for nodes built at runtime
+    markup = re.sub(r"<script\b.*?</script>", "", html, flags=re.S)
+    ids = re.findall(r'\bid="([^"]+)"', markup)
+    assert ids
+    duplicates = sorted(name for name, count in Counter(ids).items() if count > 1)
+    assert duplicates == [], f"duplicate ids: {duplicates}"
+
+    print("✓ test_element_ids_unique passed")
+
+
+def test_minified_page_keeps_markup_and_scripts():
+    """Minifying the template drops whitespace only; ids and inline scripts are unchanged."""
+    args = ("test-system", "https://tiles.example/{z}/{x}/{y}.png", "Example", 12)
+    env = app.jinja_env
+    raw = events_app._render_web_ui(env.from_string(events_app.WEB_UI_HTML), *args)
+    minified = events_app._render_web_ui(
+        env.from_string(events_app.minify_html(events_app.WEB_UI_HTML)), *args
+    )
+    assert len(minified) < len(raw)
+
+    raw_page, minified_page = _summarize(raw), _summarize(minified)
+    assert minified_page.ids == raw_page.ids
+    assert len(minified_page.scripts) == len(raw_page.scripts)
+    assert minified_page.scripts == raw_page.scripts
+
+    print("✓ test_minified_page_keeps_markup_and_scripts passed")
+
+
+def test_page_etag_per_encoding():
+    """Each content-coding of the page has its own ETag and only revalidates against it."""
+    client = app.test_client()
+    gzip_page = client.get("/", headers={"Accept-Encoding": "gzip"})
+    plain_page = client.get("/", headers={"Accept-Encoding": "identity"})
+    assert gzip_page.headers["Content-Encoding"] == "gzip"
+    gzip_tag, plain_tag = gzip_page.headers["ETag"], plain_page.headers["ETag"]
+    assert gzip_tag != plain_tag
+
+    cached = client.get("/", headers={"Accept-Encoding": "gzip", "If-None-Match": gzip_tag})
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == gzip_tag
+    switched = client.get("/", headers={"Accept-Encoding": "identity", "If-None-Match": gzip_tag})
+    assert switched.status_code == 200
+
+    print("✓ test_page_etag_per_encoding passed")
+
+
+def test_stream_subscriber_limit():
+    """Streams past the per-process limit get a 503; closing one frees its slot."""
+    client = app.test_client()
+    state = events_app._summary_state
+    before = state["subscribers"]
+    with mock.patch.object(events_app, "SUMMARY_STREAM_MAX_SUBSCRIBERS", before + 1):
+        stream = client.get("/api/stream", buffered=False)
+        assert stream.status_code == 200
+        assert state["subscribers"] == before + 1
+        rejected = client.get("/api/stream", buffered=False)
+        assert rejected.status_code == 503
+        assert state["subscribers"] == before + 1
+        stream.close()
+        assert state["subscribers"] == before
+
+    print("✓ test_stream_subscriber_limit passed")
+
+
+def test_minify_css_keeps_strings():
+    """Whitespace rules do not reach inside quoted CSS strings."""
+    css = 'a[title="x > y"] > b {\n  content: "a:  b /* kept */";\n  color: red;\n}\n/* dropped */'
+    assert events_app.minify_css(css) == 'a[title="x > y"]>b{content:"a:  b /* kept */";color:red}'
+
+    print("✓ test_minify_css_keeps_strings passed")
+
+
+if __name__ == "__main__":
+    print("Running web UI tests...\n")
+    test_element_ids_unique()
+    test_minified_page_keeps_markup_and_scripts()
+    test_page_etag_per_encoding()
+    test_stream_subscriber_limit()
+    test_minify_css_keeps_strings()
+    print("\n✅ All tests passed!")